@@ -4,8 +4,35 @@ load_dotenv()
 import os
 import re
 import json
+import asyncio
+import hashlib
+import logging
+import importlib.util
+import httpx
 import requests
-from typing import List, Dict, Any, Tuple
+from functools import lru_cache
+from itertools import chain, islice
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import List, Dict, Any, Iterator, Tuple
+
+# Optional on-disk response cache; without it every run goes to the network.
+try:
+    import diskcache
+except ImportError:
+    diskcache = None  # type: ignore
+
+# Optional fast JSON codec for jobs.json; stdlib json is used otherwise.
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+# Optional multi-pattern matcher for ranking; falls back to substring scans.
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None  # type: ignore
 
 APOLLO_BASE = "https://api.apollo.io/api/v1"
 API_KEY = os.getenv("APOLLO_API_KEY", "").strip()
@@ -22,10 +49,17 @@ BASE_RECRUITER_TITLES = [
     "recruiter", "technical recruiter", "talent acquisition", "sourcer", "hiring manager"
 ]
 
-RECRUITER_KEYWORDS = re.compile(
-    r"\b(recruit|talent|sourc|staffing|people\s*&?\s*culture|people ops|human\s+resources|hr|ta)\b",
-    re.IGNORECASE
+# Recruiting cues checked as whole words against a title's tokens, plus the
+# multi-word cues that can't be expressed as a single token.
+RECRUIT_ROOTS = frozenset({
+    "recruit", "recruiter", "recruiters", "recruiting", "talent", "sourc", "sourcer",
+    "sourcing", "staffing", "hr", "ta", "hiring",
+})
+HR_PHRASES = (
+    "people & culture", "people&culture", "people culture", "people ops",
+    "human resources", "talent acquisition", "hiring manager",
 )
+WORD_RE = re.compile(r"[a-z0-9]+")
 
 STOPWORDS = {
     "the","a","an","and","or","of","for","to","in","on","at","by","with","from",
@@ -37,145 +71,263 @@ STOPWORDS = {
     "usa","united","states"
 }
 
+_STOPWORDS = frozenset(STOPWORDS)
+
 TOKEN_RE = re.compile(r"[a-zA-Z][a-zA-Z0-9\-\+\.]*")
+
+SENIORITY_SCORES: Tuple[Tuple[str, int], ...] = (
+    ("principal", 6), ("director", 6), ("head", 6), ("vp", 6), ("lead", 5),
+    ("senior", 4), ("manager", 4), ("partner", 4), ("specialist", 3),
+    ("coordinator", 2), ("recruiter", 5), ("sourcer", 4), ("hr", 3),
+)
+
+# Extra substring cues added on top of seniority and phrase hits in score_title.
+RANK_CUES: Tuple[Tuple[str, int], ...] = (("talent acquisition", 3), ("recruit", 3), ("sourc", 2))
+
 MAX_RESULTS = 5
+# Concurrent in-flight Apollo requests when main() fans out over asyncio.
+MAX_CONCURRENCY = int(os.getenv("APOLLO_MAX_CONCURRENCY", "20"))
+
+# One keep-alive session for the synchronous search_people() path so repeated
+# searches/unlocks reuse the TLS connection instead of re-handshaking per
+# request. main() runs on the async client below, sized by MAX_CONCURRENCY.
+_SESSION = requests.Session()
+_SESSION.headers.update(HEADERS)
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504)),
+))
+
+# Re-runs over a barely-changed jobs.json repeat the same searches and unlocks,
+# so identical calls are answered from disk instead of Apollo.
+APOLLO_CACHE_TTL = int(os.getenv("APOLLO_CACHE_TTL", "86400"))
+APOLLO_UNLOCK_CACHE_TTL = int(os.getenv("APOLLO_UNLOCK_CACHE_TTL", str(30 * 86400)))
+_CACHE = diskcache.Cache(os.getenv("APOLLO_CACHE_DIR", ".apollo_cache")) if diskcache else None
+
+logger = logging.getLogger(__name__)
+
+
+def _cache_key(*parts: Any) -> str:
+    return hashlib.sha1(json.dumps(parts, sort_keys=True, default=str).encode()).hexdigest()
 
 
 def _search(params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    key = _cache_key("search", params)
+    if _CACHE is not None:
+        cached = _CACHE.get(key)
+        if cached is not None:
+            return cached
+    try:
+        r = _SESSION.get(f"{APOLLO_BASE}/people/search", params=params, timeout=30)
+        return _parse_search(r, params, key)
+    except Exception as e:
+        logger.warning("Search error: %s", e)
+        return []
+
+
+def _parse_search(r, params: Dict[str, Any], key: str) -> List[Dict[str, Any]]:
+    """Shared by the requests and httpx paths; both responses expose the same API."""
+    if r.status_code != 200:
+        logger.warning("Search HTTP %s: %s", r.status_code, r.text[:200])
+    r.raise_for_status()
+    people = r.json().get("people", [])
+    if not people:
+        # Light params echo for debug
+        echo = {k: params[k] for k in ("q_organization_name", "person_locations[]") if k in params}
+        logger.debug("Search returned 0 people for: %s", echo)
+    elif _CACHE is not None:
+        _CACHE.set(key, people, expire=APOLLO_CACHE_TTL)
+    return people
+
+
+def _cached_unlocks(ids: List[str]) -> Tuple[Dict[str, str], List[str]]:
+    """Split ids into ({id: cached_email}, ids_still_to_fetch)."""
+    emails: Dict[str, str] = {}
+    if _CACHE is not None:
+        for i in ids:
+            cached = _CACHE.get(_cache_key("unlock", i)) if i else None
+            if cached:
+                emails[i] = cached
+    return emails, [i for i in ids if i and i not in emails]
+
+
+def _bulk_payload(ids: List[str]) -> Dict[str, Any]:
+    return {
+        "api_key": API_KEY,
+        "details": [{"id": i, "reveal_personal_emails": True} for i in ids],
+    }
+
+
+def _parse_bulk_unlock(r, ids: List[str], emails: Dict[str, str]) -> Dict[str, str]:
+    if r.status_code == 402:
+        return emails
+    if r.status_code != 200:
+        logger.warning("Bulk unlock HTTP %s for %d id(s): %s", r.status_code, len(ids), r.text[:120])
+        return emails
+    for m in r.json().get("matches") or []:
+        if m and m.get("id") and m.get("email"):
+            emails[m["id"]] = m["email"]
+            if _CACHE is not None:
+                _CACHE.set(_cache_key("unlock", m["id"]), m["email"], expire=APOLLO_UNLOCK_CACHE_TTL)
+    return emails
+
+
+def _bulk_unlock(ids: List[str]) -> Dict[str, str]:
+    """Unlock several people in one /people/bulk_match call. Returns {id: email}."""
+    emails, ids = _cached_unlocks(ids)
+    if not ids:
+        return emails
+    try:
+        r = _SESSION.post(f"{APOLLO_BASE}/people/bulk_match", json=_bulk_payload(ids), timeout=30)
+        return _parse_bulk_unlock(r, ids, emails)
+    except Exception as e:
+        logger.warning("Bulk unlock error for %d id(s): %s", len(ids), e)
+        return emails
+
+
+# --- async I/O layer --------------------------------------------------------
+# main() fans out over every job at once; an event loop with one HTTP/2
+# client multiplexes those requests instead of parking a thread per socket.
+
+def _async_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        base_url=APOLLO_BASE,
+        headers=HEADERS,
+        timeout=30.0,
+        http2=importlib.util.find_spec("h2") is not None,
+        limits=httpx.Limits(max_connections=50, max_keepalive_connections=50),
+    )
+
+
+async def _asearch(client: httpx.AsyncClient, sem: asyncio.Semaphore,
+                   params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    key = _cache_key("search", params)
+    if _CACHE is not None:
+        cached = _CACHE.get(key)
+        if cached is not None:
+            return cached
     try:
-        r = requests.get(f"{APOLLO_BASE}/people/search",
-                         headers=HEADERS, params=params, timeout=30)
-        if r.status_code != 200:
-            print(f"⚠️  Search HTTP {r.status_code}: {r.text[:200]}")
-        r.raise_for_status()
-        people = r.json().get("people", [])
-        if not people:
-            # Light params echo for debug
-            echo = {k: params[k] for k in ("q_organization_name", "person_locations[]") if k in params}
-            print("ℹ️  Search returned 0 people for:", echo)
-        return people
+        async with sem:
+            r = await client.get("/people/search", params=params)
+        return _parse_search(r, params, key)
     except Exception as e:
-        print(f"⚠️  Search error: {e}")
+        logger.warning("Search error: %s", e)
         return []
 
 
-def _unlock_email(person_id: str) -> str:
-    """Return real e-mail or empty string."""
-    payload = {"api_key": API_KEY, "id": person_id, "reveal_email": True}
+async def _abulk_unlock(client: httpx.AsyncClient, sem: asyncio.Semaphore,
+                        ids: List[str]) -> Dict[str, str]:
+    emails, ids = _cached_unlocks(ids)
+    if not ids:
+        return emails
     try:
-        r = requests.post(f"{APOLLO_BASE}/people/match",
-                          json=payload, headers=HEADERS, timeout=30)
-        if r.status_code == 402:
-            
-            return ""
-        if r.status_code != 200:
-            print(f"ℹ️  Email unlock HTTP {r.status_code} for {person_id}: {r.text[:120]}")
-            return ""
-        return r.json().get("person", {}).get("email") or ""
+        async with sem:
+            r = await client.post("/people/bulk_match", json=_bulk_payload(ids))
+        return _parse_bulk_unlock(r, ids, emails)
     except Exception as e:
-        print(f"ℹ️  Email unlock error for {person_id}: {e}")
-        return ""
+        logger.warning("Bulk unlock error for %d id(s): %s", len(ids), e)
+        return emails
 
 
 def _norm(s: str) -> str:
     return (s or "").strip().lower()
 
 
-def _tokens_from_title(title: str) -> List[str]:
+@lru_cache(maxsize=2048)
+def _tokens_from_title(title: str) -> Tuple[str, ...]:
     """Tokenize, lowercase, drop stopwords & pure numbers, keep order & de-dupe."""
-    t = _norm(title)
-    tokens = [w.lower() for w in TOKEN_RE.findall(t)]
-    cleaned = []
-    for w in tokens:
-        w = w.strip(".+-")
-        if not w or w in STOPWORDS:
-            continue
-        if w.isdigit():
-            continue
-        cleaned.append(w)
-    
-    seen, out = set(), []
-    for w in cleaned:
-        if w not in seen:
-            seen.add(w)
-            out.append(w)
-    return out
+    return tuple(dict.fromkeys(
+        w for w in (raw.strip(".+-") for raw in TOKEN_RE.findall(_norm(title)))
+        if w and w not in _STOPWORDS and not w.isdigit()
+    ))
 
 
-def _bigrams(words: List[str]) -> List[str]:
-    out = []
-    for i in range(len(words) - 1):
-        out.append(f"{words[i]} {words[i+1]}")
-    
-    seen, uniq = set(), []
-    for x in out:
-        if x not in seen:
-            seen.add(x)
-            uniq.append(x)
-    return uniq
+def _phrases(toks: Tuple[str, ...]) -> Iterator[str]:
+    """Bigrams first (more specific), then the tokens themselves."""
+    yield from (f"{a} {b}" for a, b in zip(toks, toks[1:]))
+    yield from toks
 
 
-def _phrases_from_title(title: str) -> List[str]:
+@lru_cache(maxsize=2048)
+def _phrases_from_title(title: str) -> Tuple[str, ...]:
     """Use bigrams first (more specific), then tokens; trimmed to keep API params sane."""
-    toks = _tokens_from_title(title)
-    bgs = _bigrams(toks)
-    phrases = bgs + toks
-    return phrases[:25]
+    return tuple(islice(dict.fromkeys(_phrases(_tokens_from_title(title))), 25))
+
 
+_RECRUITER_TITLE_SUFFIXES = ("recruiter", "sourcer", "talent acquisition", "hiring manager")
 
-def _build_dynamic_recruiter_titles(job_title: str) -> List[str]:
+
+@lru_cache(maxsize=2048)
+def _build_dynamic_recruiter_titles(phrases: Tuple[str, ...]) -> Tuple[str, ...]:
     """
     From derived phrases, produce recruiter titles like:
       "<phrase> recruiter", "<phrase> sourcer", "<phrase> talent acquisition", "<phrase> hiring manager"
     Also append a minimal fallback set.
     """
-    phrases = _phrases_from_title(job_title)
-    dynamic: List[str] = []
-    for p in phrases:
-        dynamic.extend([
-            f"{p} recruiter",
-            f"{p} sourcer",
-            f"{p} talent acquisition",
-            f"{p} hiring manager",
-        ])
-    dynamic.extend(BASE_RECRUITER_TITLES)
-
-    
-    seen, final = set(), []
-    for t in dynamic:
-        key = t.lower()
-        if key and key not in seen:
-            seen.add(key)
-            final.append(t)
-    return final[:100]
-
+    dynamic = chain(
+        (f"{p} {suffix}" for p in phrases for suffix in _RECRUITER_TITLE_SUFFIXES),
+        BASE_RECRUITER_TITLES,
+    )
+    # Phrases are already lowercase, so deduping on the title itself matches
+    # the old case-insensitive key.
+    return tuple(islice(dict.fromkeys(t.lower() for t in dynamic if t), 100))
 
 
-def _title_is_recruiting(title: str, phrases: List[str]) -> bool:
+@lru_cache(maxsize=256)
+def _rank_automaton(phrases_norm: Tuple[str, ...]):
+    """
+    One Aho-Corasick automaton over phrases + seniority keys + cues, so a single
+    pass over a title yields every hit. Values are (key, ((tag, weight), ...)).
+    """
+    weights: Dict[str, List[Tuple[str, int]]] = {}
+    for k, v in SENIORITY_SCORES:
+        weights.setdefault(k, []).append(("sen", v))
+    for ph in phrases_norm:
+        weights.setdefault(ph, []).append(("phrase", 3))
+    for k, v in RANK_CUES:
+        weights.setdefault(k, []).append(("cue", v))
+    automaton = ahocorasick.Automaton()
+    for k, tags in weights.items():
+        automaton.add_word(k, (k, tuple(tags)))
+    automaton.make_automaton()
+    return automaton
+
+
+def _is_recruiting_title(t: str) -> bool:
+    """`t` must already be normalized. Set intersection instead of a regex scan."""
+    if not RECRUIT_ROOTS.isdisjoint(WORD_RE.findall(t)):
+        return True
+    return any(p in t for p in HR_PHRASES)
+
+
+def _title_is_recruiting(title: str, phrases_norm: Tuple[str, ...], automaton=None) -> bool:
     """
     True if title looks like recruiting/TA/HR and (preferably) contains one of our phrases.
     Allow generic recruiter/TA titles even without phrase hit.
+    `phrases_norm` must already be normalized and non-empty.
     """
     t = _norm(title)
-    if not t or not RECRUITER_KEYWORDS.search(t):
+    if not t or not _is_recruiting_title(t):
         return False
-    for p in phrases:
-        pp = _norm(p)
-        if pp and pp in t:
-            return True
+    if automaton is not None:
+        for _, (_k, tags) in automaton.iter(t):
+            if any(tag == "phrase" for tag, _v in tags):
+                return True
+    else:
+        for pp in phrases_norm:
+            if pp in t:
+                return True
     return ("recruiter" in t) or ("talent acquisition" in t) or ("sourc" in t) or ("hiring manager" in t)
 
 
-def _filter_and_rank_people(people: List[Dict[str, Any]], phrases: List[str]) -> List[Dict[str, str]]:
-    SENIORITY_SCORES = {
-        "principal": 6, "director": 6, "head": 6, "vp": 6, "lead": 5,
-        "senior": 4, "manager": 4, "partner": 4, "specialist": 3,
-        "coordinator": 2, "recruiter": 5, "sourcer": 4, "hr": 3
-    }
+def _filter_and_rank_people(people: List[Dict[str, Any]], phrases: Tuple[str, ...]) -> List[Dict[str, str]]:
+    # Normalize once per call rather than once per (person, phrase) pair.
+    phrases_norm = tuple(pp for pp in (_norm(p) for p in phrases) if pp)
+    automaton = _rank_automaton(phrases_norm) if ahocorasick is not None else None
     cleaned = []
     for p in people or []:
         title = p.get("title") or p.get("person_title") or ""
-        if not _title_is_recruiting(title, phrases):
+        if not _title_is_recruiting(title, phrases_norm, automaton):
             continue
         name = (f"{p.get('first_name','')} {p.get('last_name','')}".strip()
                 or p.get("name","").strip())
@@ -186,56 +338,61 @@ def _filter_and_rank_people(people: List[Dict[str, Any]], phrases: List[str]) ->
             "id": p.get("id","")
         })
 
-    def score_title(t: str) -> int:
+    def score_title(t: str, _sen=SENIORITY_SCORES, _phr=phrases_norm) -> int:
         t = _norm(t)
         score = 0
-        if RECRUITER_KEYWORDS.search(t):
+        if _is_recruiting_title(t):
             score += 5
-        for k, v in SENIORITY_SCORES.items():
+        if automaton is not None:
+            # Each key counts once, however many times it occurs in the title.
+            hits = {k: tags for _, (k, tags) in automaton.iter(t)}
+            return score + sum(v for tags in hits.values() for _tag, v in tags)
+        for k, v in _sen:
             if k in t:
                 score += v
-        for ph in phrases:
-            ph = _norm(ph)
-            if ph and ph in t:
+        for ph in _phr:
+            if ph in t:
                 score += 3
-        if "talent acquisition" in t: score += 3
-        if "recruit" in t: score += 3
-        if "sourc" in t: score += 2
+        for k, v in RANK_CUES:
+            if k in t:
+                score += v
         return score
 
-    cleaned.sort(key=lambda x: score_title(x["title"]), reverse=True)
+    # Apollo returns many people with identical titles; score each distinct one once.
+    scores = {t: score_title(t) for t in {c["title"] for c in cleaned}}
+    cleaned.sort(key=lambda x: scores[x["title"]], reverse=True)
     return cleaned
 
 
 
-def search_people(company: str, job_title: str) -> List[Dict[str, str]]:
-    phrases = _phrases_from_title(job_title)
-    dynamic_titles = _build_dynamic_recruiter_titles(job_title)
+_US_LOCATIONS = ("United States",)
+_BASE_SEARCH_PARAMS: Dict[str, Any] = {"page": 1, "per_page": 100, "person_locations[]": _US_LOCATIONS}
+# The unfiltered fallback is ranked down to MAX_RESULTS anyway; a short page is enough.
+_FALLBACK_PER_PAGE = 25
 
-    
-    p1 = _search({
-        "q_organization_name": company,
-        "person_titles[]": dynamic_titles,
-        "page": 1,
-        "per_page": 100,
-        "person_locations[]": "United States",
-    })
-    best = _filter_and_rank_people(p1, phrases)
 
-    if not best:
-        
-        p2 = _search({
-            "q_organization_name": company,
-            "page": 1,
-            "per_page": 100,
-            "person_locations[]": "United States",
-        })
-        best = _filter_and_rank_people(p2, phrases)
+def _search_params(company: str, dynamic_titles: Tuple[str, ...] | None = None) -> Dict[str, Any]:
+    if dynamic_titles is None:
+        return {**_BASE_SEARCH_PARAMS, "q_organization_name": company, "per_page": _FALLBACK_PER_PAGE}
+    # requests/httpx encode tuples like lists, so the cached tuple is passed as-is.
+    return {**_BASE_SEARCH_PARAMS, "q_organization_name": company, "person_titles[]": dynamic_titles}
 
-    
+
+def _needs_fallback(first: List[Dict[str, Any]], best: List[Dict[str, str]],
+                    phrases: Tuple[str, ...]) -> bool:
+    """Only run the unfiltered search when the titled one found no recruiter-like people at all
+    and there are phrases to rank the unfiltered results against."""
+    if best or not phrases:
+        return False
+    return not any(_is_recruiting_title(_norm(p.get("title") or p.get("person_title") or ""))
+                   for p in first or [])
+
+
+def _contacts(company: str, job_title: str, phrases: Tuple[str, ...],
+              top: List[Dict[str, str]], emails: Dict[str, str]) -> List[Dict[str, str]]:
     out: List[Dict[str, str]] = []
-    for p in best[:MAX_RESULTS]:
-        email = _unlock_email(p.get("id", "")) or "email_not_unlocked@domain.com"
+    for p in top:
+        email = emails.get(p.get("id", "")) or "email_not_unlocked@domain.com"
         out.append({
             "name": p["name"],
             "title": p["title"],
@@ -243,10 +400,56 @@ def search_people(company: str, job_title: str) -> List[Dict[str, str]]:
             "linkedin_url": p.get("linkedin_url", "")
         })
 
-    print(f"📊  {company} ({job_title}) → {len(out)} contacts (phrases: {', '.join(phrases) or '—'})")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("%s (%s) → %d contacts (phrases: %s)",
+                    company, job_title, len(out), ", ".join(phrases) or "—")
     return out
 
 
+def search_people(company: str, job_title: str) -> List[Dict[str, str]]:
+    if not (company or "").strip() or not (job_title or "").strip():
+        return []
+    phrases = _phrases_from_title(job_title)
+    dynamic_titles = _build_dynamic_recruiter_titles(phrases)
+
+    p1 = _search(_search_params(company, dynamic_titles))
+    best = _filter_and_rank_people(p1, phrases)
+
+    if _needs_fallback(p1, best, phrases):
+        p2 = _search(_search_params(company))
+        best = _filter_and_rank_people(p2, phrases)
+
+    top = best[:MAX_RESULTS]
+    emails = _bulk_unlock([p.get("id", "") for p in top])
+    return _contacts(company, job_title, phrases, top, emails)
+
+
+async def asearch_people(client: httpx.AsyncClient, sem: asyncio.Semaphore,
+                         company: str, job_title: str) -> List[Dict[str, str]]:
+    """Async twin of search_people sharing one client and concurrency limit."""
+    if not (company or "").strip() or not (job_title or "").strip():
+        return []
+    phrases = _phrases_from_title(job_title)
+    dynamic_titles = _build_dynamic_recruiter_titles(phrases)
+
+    p1 = await _asearch(client, sem, _search_params(company, dynamic_titles))
+    best = _filter_and_rank_people(p1, phrases)
+
+    if _needs_fallback(p1, best, phrases):
+        p2 = await _asearch(client, sem, _search_params(company))
+        best = _filter_and_rank_people(p2, phrases)
+
+    top = best[:MAX_RESULTS]
+    emails = await _abulk_unlock(client, sem, [p.get("id", "") for p in top])
+    return _contacts(company, job_title, phrases, top, emails)
+
+
+async def _search_all(pending: List[Tuple[int, str, str]]) -> List[List[Dict[str, str]]]:
+    sem = asyncio.Semaphore(MAX_CONCURRENCY)
+    async with _async_client() as client:
+        return await asyncio.gather(*[asearch_people(client, sem, c, t) for _idx, c, t in pending])
+
+
 
 def _load_jobs() -> Tuple[list, dict | None]:
     """
@@ -254,8 +457,12 @@ def _load_jobs() -> Tuple[list, dict | None]:
     If jobs.json is wrapped ({"jobs":[...]}), returns (list, wrapper_dict).
     If it's a plain list, returns (list, None).
     """
-    with open("jobs.json", encoding="utf-8") as f:
-        data = json.load(f)
+    if orjson is not None:
+        with open("jobs.json", "rb") as f:
+            data = orjson.loads(f.read())
+    else:
+        with open("jobs.json", encoding="utf-8") as f:
+            data = json.load(f)
 
     if isinstance(data, dict) and "jobs" in data and isinstance(data["jobs"], list):
         return data["jobs"], data  # wrapped
@@ -268,23 +475,27 @@ def _load_jobs() -> Tuple[list, dict | None]:
 def _save_jobs(job_list: list, wrapper: dict | None):
     if wrapper is not None:
         wrapper["jobs"] = job_list
-        with open("jobs.json", "w", encoding="utf-8") as f:
-            json.dump(wrapper, f, indent=2, ensure_ascii=False)
+    payload = wrapper if wrapper is not None else job_list
+    if orjson is not None:
+        with open("jobs.json", "wb") as f:
+            f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
     else:
         with open("jobs.json", "w", encoding="utf-8") as f:
-            json.dump(job_list, f, indent=2, ensure_ascii=False)
+            json.dump(payload, f, indent=2, ensure_ascii=False)
 
 
 
 def main():
+    logging.basicConfig(level=os.getenv("LOG_LEVEL", "WARNING").upper(),
+                        format="%(levelname)s %(name)s: %(message)s")
     jobs, wrapper = _load_jobs()
 
     if not jobs:
         print("⚠️  jobs.json contains 0 jobs.")
         return
 
-    updated = 0
-    for job in jobs:
+    pending: List[Tuple[int, str, str]] = []
+    for idx, job in enumerate(jobs):
         if not isinstance(job, dict):
             print("⚠️  Skipping non-dict job entry:", job)
             continue
@@ -297,7 +508,20 @@ def main():
             job["recruiters"] = []
             continue
 
-        job["recruiters"] = search_people(company, title)
+        pending.append((idx, company, title))
+
+    # Scraped feeds repeat the same company+title a lot; look each pair up once.
+    unique: Dict[Tuple[str, str], Tuple[int, str, str]] = {}
+    for idx, c, t in pending:
+        unique.setdefault((c.lower(), t.lower()), (idx, c, t))
+    lookups = list(unique.values())
+
+    # Each lookup is pure network I/O, so run them all on one event loop.
+    memo = dict(zip(unique.keys(), asyncio.run(_search_all(lookups))))
+
+    updated = 0
+    for idx, c, t in pending:
+        jobs[idx]["recruiters"] = [dict(r) for r in memo[(c.lower(), t.lower())]]
         updated += 1
 
     _save_jobs(jobs, wrapper)
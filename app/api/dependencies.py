@@ -1,20 +1,82 @@
+import time
 from typing import Optional
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
-from jose import JWTError, jwt
+from sqlalchemy.orm import Session, selectinload
+import jwt
 
 from app.core.database import get_db
 from app.core.config import settings
+from app.core.jwt_keys import verification_key
 from app.models.user import User, Role
 
 security = HTTPBearer()
 
+# Role guards and check_permission walk user.roles and role.permissions; load
+# both up front (two IN-queries) instead of lazily per attribute access.
+_USER_AUTH_LOAD = selectinload(User.roles).selectinload(Role.permissions)
+
+# Decoded JWT payloads keyed by the raw token. Every authenticated request
+# otherwise re-verifies the signature; the User row is still loaded per request
+# so deactivation and role changes apply immediately.
+_JWT_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+
+
+def _decode_token(token: str) -> dict:
+    """jwt.decode with a short-lived cache. Raises jwt.PyJWTError like jwt.decode."""
+    payload = _JWT_CACHE.get(token)
+    if payload is not None:
+        exp = payload.get("exp")
+        if exp is None or exp > time.time():
+            return payload
+        _JWT_CACHE.pop(token, None)
+    payload = jwt.decode(token, verification_key(), algorithms=[settings.ALGORITHM])
+    _JWT_CACHE[token] = payload
+    return payload
+
+
+def _index_user_auth(user: User) -> User:
+    """Precompute role names, permission names, (permission, resource) pairs
+    and the must-change-password flag once per request."""
+    user._must_change_pw = _must_change_password(user)
+    user._role_names = frozenset(r.name for r in user.roles)
+    user._perm_index = frozenset(
+        (p.name, p.resource) for r in user.roles for p in r.permissions
+    )
+    user._perm_set = frozenset(name for name, _res in user._perm_index)
+    return user
+
+
+def _role_names(user: User) -> frozenset:
+    names = getattr(user, "_role_names", None)
+    if names is None:
+        names = _index_user_auth(user)._role_names
+    return names
+
+
+def invalidate_token_cache(token: Optional[str] = None) -> None:
+    """Drop one cached token (or all of them when token is None)."""
+    if token is None:
+        _JWT_CACHE.clear()
+    else:
+        _JWT_CACHE.pop(token, None)
+
 async def get_current_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
 ) -> User:
-    """Get the current authenticated user from JWT token."""
+    """Get the current authenticated user from JWT token.
+
+    The resolved user is memoized on ``request.state`` so every guard in one
+    request (router-wide require_password_fresh, require_admin, permission
+    checkers built by check_permission) shares a single user+roles load.
+    """
+    cached = getattr(request.state, "user", None)
+    if cached is not None and getattr(request.state, "user_token", None) == credentials.credentials:
+        return cached
+
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -22,18 +84,14 @@ async def get_current_user(
     )
     
     try:
-        payload = jwt.decode(
-            credentials.credentials, 
-            settings.SECRET_KEY, 
-            algorithms=[settings.ALGORITHM]
-        )
+        payload = _decode_token(credentials.credentials)
         user_id: int = payload.get("sub")
         if user_id is None:
             raise credentials_exception
-    except JWTError:
+    except jwt.PyJWTError:
         raise credentials_exception
     
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.query(User).options(_USER_AUTH_LOAD).filter(User.id == user_id).first()
     if user is None:
         raise credentials_exception
     
@@ -43,6 +101,8 @@ async def get_current_user(
             detail="Inactive user"
         )
     
+    request.state.user = _index_user_auth(user)
+    request.state.user_token = credentials.credentials
     return user
 
 async def get_current_active_user(
@@ -60,7 +120,7 @@ async def require_admin(
     current_user: User = Depends(get_current_user)
 ) -> User:
     """Require admin role for access."""
-    if not any(role.name == "admin" for role in current_user.roles):
+    if "admin" not in _role_names(current_user):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin access required"
@@ -71,8 +131,7 @@ async def require_manager(
     current_user: User = Depends(get_current_user)
 ) -> User:
     """Require manager role for access."""
-    user_roles = [role.name for role in current_user.roles]
-    if not any(role in ["admin", "manager"] for role in user_roles):
+    if _role_names(current_user).isdisjoint({"admin", "manager"}):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Manager access required"
@@ -83,8 +142,7 @@ async def require_recruiter(
     current_user: User = Depends(get_current_user)
 ) -> User:
     """Require recruiter role for access."""
-    user_roles = [role.name for role in current_user.roles]
-    if not any(role in ["admin", "manager", "recruiter"] for role in user_roles):
+    if _role_names(current_user).isdisjoint({"admin", "manager", "recruiter"}):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Recruiter access required"
@@ -102,9 +160,9 @@ async def require_recruiter_owner(
       - Recruiter can only access paths where recruiter_identifier matches their email (case-insensitive) OR a future dedicated field.
       - Other roles forbidden.
     """
-    user_roles = [role.name for role in current_user.roles]
+    user_roles = _role_names(current_user)
     # Admin or manager bypass
-    if any(r in ("admin", "manager") for r in user_roles):
+    if not user_roles.isdisjoint({"admin", "manager"}):
         return current_user
     # Must be recruiter
     if "recruiter" not in user_roles:
@@ -118,8 +176,7 @@ async def require_candidate(
     current_user: User = Depends(get_current_user)
 ) -> User:
     """Require candidate role for access."""
-    user_roles = [role.name for role in current_user.roles]
-    if "candidate" not in user_roles:
+    if "candidate" not in _role_names(current_user):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Candidate access required"
@@ -135,36 +192,32 @@ async def get_optional_user(
         return None
     
     try:
-        payload = jwt.decode(
-            credentials.credentials, 
-            settings.SECRET_KEY, 
-            algorithms=[settings.ALGORITHM]
-        )
+        payload = _decode_token(credentials.credentials)
         user_id: int = payload.get("sub")
         if user_id is None:
             return None
-    except JWTError:
+    except jwt.PyJWTError:
         return None
     
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.query(User).options(_USER_AUTH_LOAD).filter(User.id == user_id).first()
     if user is None or not user.is_active:
         return None
     
-    return user
+    return _index_user_auth(user)
 
 def check_permission(permission_name: str, resource: str = None):
     """Check if user has specific permission."""
     def permission_checker(current_user: User = Depends(get_current_user)):
         # Admin has all permissions
-        if any(role.name == "admin" for role in current_user.roles):
+        if "admin" in _role_names(current_user):
             return current_user
         
         # Check if user has the specific permission
-        for role in current_user.roles:
-            for permission in role.permissions:
-                if permission.name == permission_name:
-                    if resource is None or permission.resource == resource:
-                        return current_user
+        if resource is not None:
+            if (permission_name, resource) in current_user._perm_index:
+                return current_user
+        elif permission_name in current_user._perm_set:
+            return current_user
         
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -188,6 +241,9 @@ def _must_change_password(user: User) -> bool:
         return False
 
 
+_ALLOWED_PW_PATHS: frozenset = frozenset({"/auth/change-password", "/auth/reset-password"})
+
+
 async def require_password_fresh(
     request: Request,
     current_user: User = Depends(get_current_user),
@@ -197,9 +253,10 @@ async def require_password_fresh(
     Allowed paths even when flagged: /auth/change-password, /auth/reset-password
     (keep parity with existing auth router endpoints).
     """
-    allowed_paths = {"/auth/change-password", "/auth/reset-password"}
-    path = request.url.path
-    if _must_change_password(current_user) and path not in allowed_paths:
+    must_change = getattr(current_user, "_must_change_pw", None)
+    if must_change is None:
+        must_change = _must_change_password(current_user)
+    if must_change and request.url.path not in _ALLOWED_PW_PATHS:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Password change required",
@@ -6,7 +6,7 @@ This API mirrors the pipeline stages and is compatible with your current codebas
 import os
 from fastapi import FastAPI, APIRouter, HTTPException, Depends, Request, File, UploadFile, Form
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, HTMLResponse
+from fastapi.responses import JSONResponse, HTMLResponse, ORJSONResponse
 from sqlalchemy.orm import Session
 from typing import List, Optional, Dict, Any
 from datetime import datetime
@@ -76,7 +76,8 @@ def list_applications():
 app = FastAPI(
     title="Pipeline Job Application API",
     version="1.0.0",
-    description="Pipeline-aligned API for job application automation."
+    description="Pipeline-aligned API for job application automation.",
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -1,14 +1,20 @@
 from typing import List, Optional
 from datetime import datetime, timedelta
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import or_, update, exists, insert, select, any_, literal, Integer
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
 
 from app.core.database import get_db
 from app.core.config import settings
-from jose import jwt
+from app.core.cache import cache_get, cache_set, cache_delete
+from app.core.jwt_keys import signing_key
+import jwt
 from app.api.dependencies import get_current_user, require_admin, require_password_fresh
-from app.models.user import User, Role, Permission
+from app.models.user import User, Role, Permission, user_roles, role_permissions
 from app.models.communication import EmailTemplate
 from app.schemas.user import (
     RoleCreate, RoleUpdate, RoleResponse,
@@ -19,12 +25,128 @@ from app.schemas.communication import (
     EmailTemplateCreate, EmailTemplateUpdate, EmailTemplateResponse
 )
 from app.schemas.base import PaginatedResponse
+from app.api.utils.pagination import Page, paginate_query
+from app.api.routers.auth import invalidate_role_cache
 
 router = APIRouter(prefix="/admin", tags=["admin"], dependencies=[Depends(require_password_fresh)])
 
+_ON_CONFLICT_INSERTS = {"postgresql": pg_insert, "sqlite": sqlite_insert}
+
+def _insert_unique(db: Session, model, values: dict, index_elements: list):
+    """INSERT ... ON CONFLICT DO NOTHING RETURNING the new row in one round trip.
+
+    Returns None when a row with the same ``index_elements`` already exists.
+    """
+    dialect_insert = _ON_CONFLICT_INSERTS.get(db.get_bind().dialect.name)
+    if dialect_insert is None:
+        try:
+            obj = db.scalars(insert(model).values(**values).returning(model)).first()
+        except IntegrityError:
+            db.rollback()
+            return None
+    else:
+        stmt = (
+            dialect_insert(model)
+            .values(**values)
+            .on_conflict_do_nothing(index_elements=index_elements)
+            .returning(model)
+        )
+        obj = db.scalars(stmt).first()
+    db.commit()
+    return obj
+
+def _update_by_id(db: Session, model, obj_id: int, values: dict) -> bool:
+    """Apply ``values`` to one row with a single UPDATE; False when no row matched.
+
+    Unique-name clashes surface as IntegrityError from the UPDATE itself (the
+    session is rolled back before re-raising).
+    """
+    try:
+        updated = (
+            db.query(model)
+            .filter(model.id == obj_id)
+            .update(values, synchronize_session=False)
+        )
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise
+    return updated > 0
+
+def _permission_ids(db: Session, names: list[str]) -> list[int]:
+    """Resolve permission names to ids (400 on any unknown name)."""
+    wanted = set(names)
+    if not wanted:
+        return []
+    rows = db.execute(select(Permission.id, Permission.name).where(Permission.name.in_(wanted))).all()
+    missing = wanted - {r.name for r in rows}
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown permission(s): {', '.join(sorted(missing))}"
+        )
+    return [r.id for r in rows]
+
+def _replace_role_permissions(db: Session, role_id: int, permission_ids: list[int], assigned_by: int) -> None:
+    """Swap a role's permission links with one DELETE and one INSERT, then commit."""
+    db.execute(role_permissions.delete().where(role_permissions.c.role_id == role_id))
+    if permission_ids:
+        db.execute(
+            insert(role_permissions),
+            [{"role_id": role_id, "permission_id": pid, "assigned_by": assigned_by} for pid in permission_ids],
+        )
+    db.commit()
+
+def _permission_scope(name: str) -> tuple[str, str]:
+    """Split a ``resource:action`` permission name (a bare name covers all actions)."""
+    resource, _, action = name.partition(":")
+    return resource, action or "all"
+
+def _template_columns(data: dict) -> dict:
+    """Email template schema fields -> email_templates columns (``content`` is stored as html_content)."""
+    values = dict(data)
+    if "content" in values:
+        values["html_content"] = values.pop("content")
+    return values
+
+def _cache_key(model, obj_id: int) -> str:
+    return f"admin:{model.__tablename__}:{obj_id}"
+
+def _cached_get(db: Session, model, obj_id: int, schema, not_found: str) -> Response:
+    """GET-by-id served from Redis as pre-serialized JSON when possible.
+
+    Entries are dropped by the matching update/delete endpoints and otherwise
+    expire after settings.ADMIN_CACHE_TTL.
+    """
+    key = _cache_key(model, obj_id)
+    body = cache_get(key)
+    if body is None:
+        obj = db.get(model, obj_id)
+        if obj is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=not_found)
+        body = schema.model_validate(obj).model_dump_json().encode()
+        cache_set(key, body)
+    return Response(content=body, media_type="application/json")
+
+def _page_response(schema, page: Page, limit: int) -> Response:
+    """Serialize one list page straight to JSON bytes.
+
+    Items are validated once from the ORM rows and the wrapper is built with
+    model_construct; returning a Response keeps FastAPI from validating and
+    re-encoding the whole page against response_model a second time.
+    """
+    body = PaginatedResponse[schema].model_construct(
+        items=[schema.model_validate(item) for item in page.items],
+        total=page.total,
+        page=page.page,
+        size=limit,
+        pages=page.pages,
+    )
+    return Response(content=body.model_dump_json(), media_type="application/json")
+
 # Role Management
 @router.get("/roles", response_model=PaginatedResponse[RoleResponse])
-async def get_roles(
+def get_roles(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
     search: Optional[str] = Query(None),
@@ -46,93 +168,84 @@ async def get_roles(
     if is_active is not None:
         query = query.filter(Role.is_active == is_active)
     
-    total = query.count()
-    roles = query.offset(skip).limit(limit).all()
+    page = paginate_query(query, skip, limit)
     
-    return PaginatedResponse(
-        items=roles,
-        total=total,
-        page=skip // limit + 1,
-        size=limit,
-        pages=(total + limit - 1) // limit
-    )
+    return _page_response(RoleResponse, page, limit)
 
 @router.post("/roles", response_model=RoleResponse, status_code=status.HTTP_201_CREATED)
-async def create_role(
+def create_role(
     role_data: RoleCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_admin)
 ):
     """Create a new role."""
-    # Check if role name already exists
-    existing_role = db.query(Role).filter(Role.name == role_data.name).first()
-    if existing_role:
+    permission_ids = _permission_ids(db, role_data.permissions)
+    values = {
+        "name": role_data.name,
+        "display_name": role_data.name,
+        "description": role_data.description,
+        "created_by": current_user.id,
+    }
+    role = _insert_unique(db, Role, values, ["name"])
+    if role is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Role with this name already exists"
         )
-    
-    role = Role(**role_data.dict(), created_by=current_user.id)
-    db.add(role)
-    db.commit()
-    db.refresh(role)
-    
+    if permission_ids:
+        _replace_role_permissions(db, role.id, permission_ids, current_user.id)
     return role
 
+@router.post("/roles/cache/invalidate", status_code=status.HTTP_204_NO_CONTENT)
+def invalidate_roles_cache(current_user: User = Depends(require_admin)):
+    """Drop this worker's cached role name -> id lookups used by auth flows."""
+    invalidate_role_cache()
+
 @router.get("/roles/{role_id}", response_model=RoleResponse)
-async def get_role(
+def get_role(
     role_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_admin)
 ):
     """Get a specific role by ID."""
-    role = db.query(Role).filter(Role.id == role_id).first()
-    if not role:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Role not found"
-        )
-    return role
+    return _cached_get(db, Role, role_id, RoleResponse, "Role not found")
 
 @router.put("/roles/{role_id}", response_model=RoleResponse)
-async def update_role(
+def update_role(
     role_id: int,
     role_data: RoleUpdate,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_admin)
 ):
     """Update a role."""
-    role = db.query(Role).filter(Role.id == role_id).first()
-    if not role:
+    update_data = role_data.model_dump(exclude_unset=True)
+    update_data['updated_by'] = current_user.id
+    # permissions is a relationship (role_permissions), not a roles column
+    permission_names = update_data.pop('permissions', None)
+    permission_ids = _permission_ids(db, permission_names) if permission_names is not None else None
+    
+    # roles.name is unique, so a rename onto an existing role fails the UPDATE
+    try:
+        found = _update_by_id(db, Role, role_id, update_data)
+    except IntegrityError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Role with this name already exists"
+        )
+    if not found:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Role not found"
         )
+    if permission_ids is not None:
+        _replace_role_permissions(db, role_id, permission_ids, current_user.id)
     
-    # Check if new name conflicts with existing role
-    if role_data.name and role_data.name != role.name:
-        existing_role = db.query(Role).filter(
-            and_(Role.name == role_data.name, Role.id != role_id)
-        ).first()
-        if existing_role:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Role with this name already exists"
-            )
-    
-    update_data = role_data.dict(exclude_unset=True)
-    update_data['updated_by'] = current_user.id
-    
-    for field, value in update_data.items():
-        setattr(role, field, value)
-    
-    db.commit()
-    db.refresh(role)
-    
-    return role
+    cache_delete(_cache_key(Role, role_id))
+    invalidate_role_cache()
+    return db.get(Role, role_id)
 
 @router.delete("/roles/{role_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_role(
+def delete_role(
     role_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_admin)
@@ -146,8 +259,8 @@ async def delete_role(
         )
     
     # Check if role is assigned to any users
-    users_with_role = db.query(User).filter(User.roles.contains(role)).first()
-    if users_with_role:
+    role_in_use = db.query(exists().where(user_roles.c.role_id == role_id)).scalar()
+    if role_in_use:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Cannot delete role that is assigned to users"
@@ -155,10 +268,12 @@ async def delete_role(
     
     role.soft_delete()
     db.commit()
+    cache_delete(_cache_key(Role, role_id))
+    invalidate_role_cache()
 
 # Permission Management
 @router.get("/permissions", response_model=PaginatedResponse[PermissionResponse])
-async def get_permissions(
+def get_permissions(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
     search: Optional[str] = Query(None),
@@ -180,72 +295,74 @@ async def get_permissions(
     if resource:
         query = query.filter(Permission.resource == resource)
     
-    total = query.count()
-    permissions = query.offset(skip).limit(limit).all()
+    page = paginate_query(query, skip, limit)
     
-    return PaginatedResponse(
-        items=permissions,
-        total=total,
-        page=skip // limit + 1,
-        size=limit,
-        pages=(total + limit - 1) // limit
-    )
+    return _page_response(PermissionResponse, page, limit)
 
 @router.post("/permissions", response_model=PermissionResponse, status_code=status.HTTP_201_CREATED)
-async def create_permission(
+def create_permission(
     permission_data: PermissionCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_admin)
 ):
     """Create a new permission."""
-    # Check if permission already exists
-    existing_permission = db.query(Permission).filter(
-        and_(
-            Permission.name == permission_data.name,
-            Permission.resource == permission_data.resource
-        )
-    ).first()
-    if existing_permission:
+    resource, action = _permission_scope(permission_data.name)
+    values = {
+        "name": permission_data.name,
+        "display_name": permission_data.name,
+        "description": permission_data.description,
+        "resource": resource,
+        "action": action,
+        "created_by": current_user.id,
+    }
+    # permissions.name is unique on its own, so it is the conflict target
+    permission = _insert_unique(db, Permission, values, ["name"])
+    if permission is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Permission with this name and resource already exists"
+            detail="Permission with this name already exists"
         )
-    
-    permission = Permission(**permission_data.dict(), created_by=current_user.id)
-    db.add(permission)
-    db.commit()
-    db.refresh(permission)
-    
     return permission
 
+@router.get("/permissions/{permission_id}", response_model=PermissionResponse)
+def get_permission(
+    permission_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_admin)
+):
+    """Get a specific permission by ID."""
+    return _cached_get(db, Permission, permission_id, PermissionResponse, "Permission not found")
+
 @router.put("/permissions/{permission_id}", response_model=PermissionResponse)
-async def update_permission(
+def update_permission(
     permission_id: int,
     permission_data: PermissionUpdate,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_admin)
 ):
     """Update a permission."""
-    permission = db.query(Permission).filter(Permission.id == permission_id).first()
-    if not permission:
+    update_data = permission_data.model_dump(exclude_unset=True)
+    update_data['updated_by'] = current_user.id
+    
+    # permissions.name is unique, so a rename onto an existing permission fails the UPDATE
+    try:
+        found = _update_by_id(db, Permission, permission_id, update_data)
+    except IntegrityError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Permission with this name already exists"
+        )
+    if not found:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Permission not found"
         )
     
-    update_data = permission_data.dict(exclude_unset=True)
-    update_data['updated_by'] = current_user.id
-    
-    for field, value in update_data.items():
-        setattr(permission, field, value)
-    
-    db.commit()
-    db.refresh(permission)
-    
-    return permission
+    cache_delete(_cache_key(Permission, permission_id))
+    return db.get(Permission, permission_id)
 
 @router.delete("/permissions/{permission_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_permission(
+def delete_permission(
     permission_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_admin)
@@ -260,10 +377,11 @@ async def delete_permission(
     
     permission.soft_delete()
     db.commit()
+    cache_delete(_cache_key(Permission, permission_id))
 
 # User Management
 @router.get("/users", response_model=PaginatedResponse[UserResponse])
-async def get_users(
+def get_users(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
     search: Optional[str] = Query(None),
@@ -273,7 +391,8 @@ async def get_users(
     current_user: User = Depends(require_admin)
 ):
     """Get all users with pagination and filtering."""
-    query = db.query(User)
+    # UserResponse serializes roles; load them for the whole page in one IN-query.
+    query = db.query(User).options(selectinload(User.roles))
     
     if search:
         query = query.filter(
@@ -288,46 +407,30 @@ async def get_users(
         query = query.filter(User.is_active == is_active)
     
     if role_id:
-        role = db.query(Role).filter(Role.id == role_id).first()
-        if role:
-            query = query.filter(User.roles.contains(role))
+        query = query.join(User.roles).filter(Role.id == role_id)
     
-    total = query.count()
-    users = query.offset(skip).limit(limit).all()
+    page = paginate_query(query, skip, limit)
     
-    return PaginatedResponse(
-        items=users,
-        total=total,
-        page=skip // limit + 1,
-        size=limit,
-        pages=(total + limit - 1) // limit
-    )
+    return _page_response(UserResponse, page, limit)
 
 @router.put("/users/{user_id}", response_model=UserResponse)
-async def update_user(
+def update_user(
     user_id: int,
     user_data: UserUpdate,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_admin)
 ):
     """Update a user (admin only)."""
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
+    update_data = user_data.model_dump(exclude_unset=True)
+    update_data['updated_by'] = current_user.id
+    
+    if not _update_by_id(db, User, user_id, update_data):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
     
-    update_data = user_data.dict(exclude_unset=True)
-    update_data['updated_by'] = current_user.id
-    
-    for field, value in update_data.items():
-        setattr(user, field, value)
-    
-    db.commit()
-    db.refresh(user)
-    
-    return user
+    return db.get(User, user_id)
 
 # --- Password admin ops (set temporary password) ---
 from pydantic import BaseModel, EmailStr
@@ -338,7 +441,7 @@ class SetTempPasswordIn(BaseModel):
     temp_password: str
 
 @router.post("/users/set-temp-password", status_code=status.HTTP_200_OK)
-async def admin_set_temp_password(
+def admin_set_temp_password(
     body: SetTempPasswordIn,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_admin)
@@ -368,17 +471,19 @@ class ResetRequestOut(BaseModel):
     reset_token: str
 
 @router.post("/users/password-reset/request", response_model=ResetRequestOut)
-async def admin_password_reset_request(
+def admin_password_reset_request(
     body: ResetRequestIn,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_admin)
 ):
-    from uuid import uuid4
+    # Plain def: Starlette runs it on the threadpool, so the DB round trips and
+    # the HMAC signing below no longer block the event loop.
+    import secrets
     from app.models.user import PasswordReset
     user = db.query(User).filter(User.email == body.email).first()
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-    jti = uuid4().hex
+    jti = secrets.token_hex(16)
     pr = PasswordReset(
         email=body.email,
         jti=jti,
@@ -389,12 +494,11 @@ async def admin_password_reset_request(
     db.add(pr)
     db.commit()
     # Build JWT reset token (type=reset)
-    from jose import jwt
-    token = jwt.encode({"sub": body.email, "type": "reset", "jti": jti, "exp": datetime.utcnow() + timedelta(minutes=60)}, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    token = jwt.encode({"sub": body.email, "type": "reset", "jti": jti, "exp": datetime.utcnow() + timedelta(minutes=60)}, signing_key(), algorithm=settings.ALGORITHM)
     return ResetRequestOut(reset_token=token)
 
 @router.post("/users/{user_id}/deactivate", status_code=status.HTTP_204_NO_CONTENT)
-async def deactivate_user(
+def deactivate_user(
     user_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_admin)
@@ -418,7 +522,7 @@ async def deactivate_user(
     db.commit()
 
 @router.post("/users/{user_id}/activate", status_code=status.HTTP_204_NO_CONTENT)
-async def activate_user(
+def activate_user(
     user_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_admin)
@@ -437,7 +541,7 @@ async def activate_user(
 
 # Email Template Management
 @router.get("/email-templates", response_model=PaginatedResponse[EmailTemplateResponse])
-async def get_email_templates(
+def get_email_templates(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
     search: Optional[str] = Query(None),
@@ -463,95 +567,66 @@ async def get_email_templates(
     if is_active is not None:
         query = query.filter(EmailTemplate.is_active == is_active)
     
-    total = query.count()
-    templates = query.offset(skip).limit(limit).all()
+    page = paginate_query(query, skip, limit)
     
-    return PaginatedResponse(
-        items=templates,
-        total=total,
-        page=skip // limit + 1,
-        size=limit,
-        pages=(total + limit - 1) // limit
-    )
+    return _page_response(EmailTemplateResponse, page, limit)
 
 @router.post("/email-templates", response_model=EmailTemplateResponse, status_code=status.HTTP_201_CREATED)
-async def create_email_template(
+def create_email_template(
     template_data: EmailTemplateCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_admin)
 ):
     """Create a new email template."""
-    # Check if template name already exists
-    existing_template = db.query(EmailTemplate).filter(
-        EmailTemplate.name == template_data.name
-    ).first()
-    if existing_template:
+    template = _insert_unique(
+        db, EmailTemplate, {**_template_columns(template_data.model_dump()), "created_by": current_user.id}, ["name"]
+    )
+    if template is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email template with this name already exists"
         )
-    
-    template = EmailTemplate(**template_data.dict(), created_by=current_user.id)
-    db.add(template)
-    db.commit()
-    db.refresh(template)
-    
     return template
 
 @router.get("/email-templates/{template_id}", response_model=EmailTemplateResponse)
-async def get_email_template(
+def get_email_template(
     template_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_admin)
 ):
     """Get a specific email template by ID."""
-    template = db.query(EmailTemplate).filter(EmailTemplate.id == template_id).first()
-    if not template:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Email template not found"
-        )
-    return template
+    return _cached_get(db, EmailTemplate, template_id, EmailTemplateResponse, "Email template not found")
 
 @router.put("/email-templates/{template_id}", response_model=EmailTemplateResponse)
-async def update_email_template(
+def update_email_template(
     template_id: int,
     template_data: EmailTemplateUpdate,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_admin)
 ):
     """Update an email template."""
-    template = db.query(EmailTemplate).filter(EmailTemplate.id == template_id).first()
-    if not template:
+    update_data = _template_columns(template_data.model_dump(exclude_unset=True))
+    update_data['updated_by'] = current_user.id
+    
+    # email_templates.name is unique, so a rename onto an existing template fails the UPDATE
+    try:
+        found = _update_by_id(db, EmailTemplate, template_id, update_data)
+    except IntegrityError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email template with this name already exists"
+        )
+    if not found:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Email template not found"
         )
     
-    # Check if new name conflicts with existing template
-    if template_data.name and template_data.name != template.name:
-        existing_template = db.query(EmailTemplate).filter(
-            and_(EmailTemplate.name == template_data.name, EmailTemplate.id != template_id)
-        ).first()
-        if existing_template:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email template with this name already exists"
-            )
-    
-    update_data = template_data.dict(exclude_unset=True)
-    update_data['updated_by'] = current_user.id
-    
-    for field, value in update_data.items():
-        setattr(template, field, value)
-    
-    db.commit()
-    db.refresh(template)
-    
-    return template
+    cache_delete(_cache_key(EmailTemplate, template_id))
+    return db.get(EmailTemplate, template_id)
 
 @router.delete("/email-templates/{template_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_email_template(
+def delete_email_template(
     template_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_admin)
@@ -566,9 +641,10 @@ async def delete_email_template(
     
     template.soft_delete()
     db.commit()
+    cache_delete(_cache_key(EmailTemplate, template_id))
 
 @router.post("/email-templates/{template_id}/duplicate", response_model=EmailTemplateResponse, status_code=status.HTTP_201_CREATED)
-async def duplicate_email_template(
+def duplicate_email_template(
     template_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_admin)
@@ -612,24 +688,31 @@ from app.models.recruiter_candidate import (
 from app.schemas.recruiter_directory import (
     RecruiterDirectoryCreate, RecruiterDirectoryUpdate, RecruiterDirectoryResponse, RecruiterDirectoryList
 )
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 @router.post("/recruiters", response_model=RecruiterDirectoryResponse)
 def create_recruiter_directory(payload: RecruiterDirectoryCreate, db: Session = Depends(get_db), current_user: User = Depends(require_admin)):
-    existing = db.query(RecruiterDirectory).filter(RecruiterDirectory.recruiter_identifier == payload.recruiter_identifier).first()
-    if existing:
+    obj = _insert_unique(
+        db, RecruiterDirectory,
+        {"recruiter_identifier": payload.recruiter_identifier.strip(), "display_name": payload.display_name.strip()},
+        ["recruiter_identifier"],
+    )
+    if obj is None:
         raise HTTPException(status_code=400, detail="Recruiter identifier already exists")
-    obj = RecruiterDirectory(recruiter_identifier=payload.recruiter_identifier.strip(), display_name=payload.display_name.strip())
-    db.add(obj)
-    db.commit()
-    db.refresh(obj)
     return RecruiterDirectoryResponse.model_validate(obj)
 
 @router.get("/recruiters", response_model=RecruiterDirectoryList)
 def list_recruiter_directory(db: Session = Depends(get_db), current_user: User = Depends(require_admin)):
-    q = db.query(RecruiterDirectory).order_by(RecruiterDirectory.display_name.asc())
-    rows = q.all()
-    return RecruiterDirectoryList(items=[RecruiterDirectoryResponse.model_validate(r) for r in rows], total=len(rows))
+    # Plain column rows straight into model_construct: no ORM identity map or
+    # per-row validation for data that came out of our own table.
+    stmt = select(
+        RecruiterDirectory.id, RecruiterDirectory.recruiter_identifier, RecruiterDirectory.display_name
+    ).order_by(RecruiterDirectory.display_name.asc())
+    items = [
+        RecruiterDirectoryResponse.model_construct(id=r.id, recruiter_identifier=r.recruiter_identifier, display_name=r.display_name)
+        for r in db.execute(stmt)
+    ]
+    return RecruiterDirectoryList.model_construct(items=items, total=len(items))
 
 @router.put("/recruiters/{recruiter_identifier}", response_model=RecruiterDirectoryResponse)
 def update_recruiter_directory(recruiter_identifier: str, payload: RecruiterDirectoryUpdate, db: Session = Depends(get_db), current_user: User = Depends(require_admin)):
@@ -642,28 +725,58 @@ def update_recruiter_directory(recruiter_identifier: str, payload: RecruiterDire
     db.refresh(obj)
     return RecruiterDirectoryResponse.model_validate(obj)
 
+_RECRUITER_CANDIDATE_CHILD_MODELS = (
+    RecruiterCandidateProfile, RecruiterCandidateActivity, RecruiterCandidateNote,
+    RecruiterCandidateDocument, RecruiterCandidateCommunication, RecruiterCandidateInterview,
+)
+
+MAX_REASSIGN_CANDIDATES = 5000
+# Stay under SQLite's bound-parameter limit when IN lists are used.
+_ID_CHUNK_SIZE = 900
+
 class CandidateReassignmentRequest(BaseModel):
-    candidate_ids: list[int]
+    candidate_ids: list[int] = Field(..., max_length=MAX_REASSIGN_CANDIDATES)
     new_recruiter_identifier: str
 
+def _id_clauses(db: Session, column, ids: list[int]) -> list:
+    """WHERE clauses matching ``column`` against ``ids``.
+
+    PostgreSQL gets a single ``= ANY(:ids)`` array parameter; other dialects get
+    IN lists chunked to ``_ID_CHUNK_SIZE``.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        return [column == any_(literal(ids, ARRAY(Integer)))]
+    return [column.in_(ids[i:i + _ID_CHUNK_SIZE]) for i in range(0, len(ids), _ID_CHUNK_SIZE)]
+
 @router.post("/recruiters/reassign")
 def reassign_candidates(payload: CandidateReassignmentRequest, db: Session = Depends(get_db), current_user: User = Depends(require_admin)):
     target = payload.new_recruiter_identifier.strip()
     if not target:
         raise HTTPException(status_code=400, detail="New recruiter identifier required")
-    cands = db.query(CandidateSimple).filter(CandidateSimple.id.in_(payload.candidate_ids)).all()
-    if len(cands) != len(payload.candidate_ids):
-        missing = set(payload.candidate_ids) - {c.id for c in cands}
+    candidate_ids = list(dict.fromkeys(payload.candidate_ids))
+    rows = []
+    for clause in _id_clauses(db, CandidateSimple.id, candidate_ids):
+        rows.extend(db.query(CandidateSimple.id, CandidateSimple.recruiter_identifier).filter(clause))
+    missing = set(candidate_ids) - {r.id for r in rows}
+    if missing:
         raise HTTPException(status_code=404, detail=f"Missing candidates: {sorted(missing)}")
-    for cand in cands:
-        if cand.recruiter_identifier == target:
-            continue
-        cand.recruiter_identifier = target
-        db.query(RecruiterCandidateProfile).filter(RecruiterCandidateProfile.candidate_id == cand.id).update({RecruiterCandidateProfile.recruiter_identifier: target})
-        db.query(RecruiterCandidateActivity).filter(RecruiterCandidateActivity.candidate_id == cand.id).update({RecruiterCandidateActivity.recruiter_identifier: target})
-        db.query(RecruiterCandidateNote).filter(RecruiterCandidateNote.candidate_id == cand.id).update({RecruiterCandidateNote.recruiter_identifier: target})
-        db.query(RecruiterCandidateDocument).filter(RecruiterCandidateDocument.candidate_id == cand.id).update({RecruiterCandidateDocument.recruiter_identifier: target})
-        db.query(RecruiterCandidateCommunication).filter(RecruiterCandidateCommunication.candidate_id == cand.id).update({RecruiterCandidateCommunication.recruiter_identifier: target})
-        db.query(RecruiterCandidateInterview).filter(RecruiterCandidateInterview.candidate_id == cand.id).update({RecruiterCandidateInterview.recruiter_identifier: target})
+    move_ids = [r.id for r in rows if r.recruiter_identifier != target]
+    if move_ids:
+        # One UPDATE per table (per chunk) for the whole batch instead of six per candidate.
+        for clause in _id_clauses(db, CandidateSimple.id, move_ids):
+            db.execute(
+                update(CandidateSimple)
+                .where(clause)
+                .values(recruiter_identifier=target)
+                .execution_options(synchronize_session=False)
+            )
+        for model in _RECRUITER_CANDIDATE_CHILD_MODELS:
+            for clause in _id_clauses(db, model.candidate_id, move_ids):
+                db.execute(
+                    update(model)
+                    .where(clause, model.recruiter_identifier != target)
+                    .values(recruiter_identifier=target)
+                    .execution_options(synchronize_session=False)
+                )
     db.commit()
-    return {"updated": len(cands), "new_recruiter_identifier": target}
\ No newline at end of file
+    return {"updated": len(rows), "new_recruiter_identifier": target}
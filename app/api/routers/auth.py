@@ -1,32 +1,48 @@
+import logging
+from functools import lru_cache
 from datetime import datetime, timedelta, timezone
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
-from sqlalchemy import func
-from jose import jwt
-from passlib.context import CryptContext
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from fastapi.security import OAuth2PasswordRequestForm, HTTPAuthorizationCredentials
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import func, update
+import jwt
 
 from app.core.database import get_db
 from app.core.config import settings
+from app.core.passwords import pwd_context, verify_password, get_password_hash
+from app.core.jwt_keys import signing_key, verification_key
 from app.models.user import User, Role, UserSession, Invite as InviteModel, PasswordReset as PasswordResetModel
 from app.schemas.user import (
     UserCreate, UserResponse, UserLogin, Token, 
     PasswordReset, PasswordResetRequest, PasswordChange
 )
-from app.api.dependencies import get_current_user
+from app.api.dependencies import get_current_user, security, invalidate_token_cache
 
 router = APIRouter(prefix="/auth", tags=["authentication"])
-
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against its hash."""
-    return pwd_context.verify(plain_password, hashed_password)
-
-def get_password_hash(password: str) -> str:
-    """Hash a password."""
-    return pwd_context.hash(password)
+logger = logging.getLogger(__name__)
+
+# Role name -> id. Roles are a handful of rows that rarely change, so after the
+# first lookup a name resolves through a primary-key get (often served from the
+# session identity map) instead of a WHERE name = ... query.
+ROLE_CACHE: dict[str, int] = {}
+
+def get_role_by_name(db: Session, name: str) -> Optional[Role]:
+    """Return the Role called ``name`` (or None), using ROLE_CACHE for the id."""
+    role_id = ROLE_CACHE.get(name)
+    if role_id is not None:
+        role = db.get(Role, role_id)
+        if role is not None and role.name == name:
+            return role
+        ROLE_CACHE.pop(name, None)
+    role = db.query(Role).filter(Role.name == name).first()
+    if role is not None:
+        ROLE_CACHE[name] = role.id
+    return role
+
+def invalidate_role_cache() -> None:
+    ROLE_CACHE.clear()
 
 def _set_must_change_password(user: User, flag: bool = True):
     """Set a soft flag in preferences JSON to require password change.
@@ -41,35 +57,68 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """Create a JWT access token."""
     to_encode = data.copy()
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = _now_utc() + expires_delta
     else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        expire = _now_utc() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, signing_key(), algorithm=settings.ALGORITHM)
     return encoded_jwt
 
-def _now_utc():
+def _deactivate_sessions(db: Session, *criteria) -> int:
+    """Log out every active UserSession matching ``criteria`` with one UPDATE."""
+    return db.query(UserSession).filter(UserSession.is_active == True, *criteria).update(
+        {UserSession.is_active: False}, synchronize_session=False
+    )
+
+def _now_utc() -> datetime:
+    """The one clock for this module: tz-aware UTC.
+
+    Handlers read it once and reuse the value for every timestamp they write
+    or compare against.
+    """
     return datetime.now(timezone.utc)
 
+def _as_utc(value: datetime) -> datetime:
+    """Treat naive values (SQLite drops the offset) as UTC so they compare with _now_utc()."""
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
 def _encode_with_ttl(data: dict, minutes: int) -> str:
     return create_access_token(data, expires_delta=timedelta(minutes=minutes))
 
+@lru_cache(maxsize=1)
+def _dummy_hash() -> str:
+    """A throwaway hash with the current default scheme and costs."""
+    return pwd_context.hash("x" * 8)
+
 def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
     """Authenticate a user by email and password (case-insensitive email)."""
     if not email:
         return None
     norm_email = email.strip().lower()
-    # Case-insensitive match so existing mixed-case records still work
-    user = db.query(User).filter(func.lower(User.email) == norm_email).first()
+    # Case-insensitive match so existing mixed-case records still work.
+    # login() resolves the primary role right after, so load roles up front.
+    user = (
+        db.query(User)
+        .options(selectinload(User.roles))
+        .filter(func.lower(User.email) == norm_email)
+        .first()
+    )
     if not user or not getattr(user, 'hashed_password', None):
+        # Burn the same KDF time as a real check so unknown emails can't be
+        # told apart from wrong passwords by latency
+        pwd_context.verify(password, _dummy_hash())
         return None
     try:
         if not verify_password(password, user.hashed_password):
             return None
+        needs_rehash = pwd_context.needs_update(user.hashed_password)
     except Exception:
         # Hash could be in legacy/invalid format
         return None
+    if needs_rehash:
+        user.hashed_password = get_password_hash(password)
+        db.commit()
     return user
 
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
@@ -78,30 +127,26 @@ async def register(
     db: Session = Depends(get_db)
 ):
     """Register a new user."""
-    # Check if user already exists
-    existing_user = db.query(User).filter(User.email == user_data.email).first()
+    # Check if user already exists (email is stored lowercased; legacy rows may not be)
+    existing_user = db.query(User).filter(func.lower(User.email) == user_data.email).first()
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
         )
     
-    # Hash password
-    hashed_password = get_password_hash(user_data.password)
+    # Hash password (KDF runs on the threadpool, not the event loop)
+    hashed_password = await run_in_threadpool(get_password_hash, user_data.password)
     
     # Create user
-    user_dict = user_data.dict()
-    requested_role = user_dict.pop('role', None)
-    user_dict.pop('password')
-    user_dict['hashed_password'] = hashed_password
-    
-    user = User(**user_dict)
+    requested_role = user_data.role
+    user = User(**user_data.model_dump(exclude={'password', 'role'}), hashed_password=hashed_password)
     
     # Assign requested role or fallback to candidate
     role_name = (requested_role.value if hasattr(requested_role, 'value') else requested_role) or "candidate"
-    role_obj = db.query(Role).filter(Role.name == role_name).first()
+    role_obj = get_role_by_name(db, role_name)
     if not role_obj:
-        role_obj = db.query(Role).filter(Role.name == "candidate").first()
+        role_obj = get_role_by_name(db, "candidate")
     if role_obj:
         user.roles.append(role_obj)
     
@@ -113,7 +158,7 @@ async def register(
 
 # ---- Invite and Activation ----
 from pydantic import BaseModel, EmailStr
-from uuid import uuid4
+import secrets
 
 class InviteCreateIn(BaseModel):
     email: EmailStr
@@ -131,7 +176,7 @@ async def create_invite(
     """Create an invite token. Caller must be admin/super_admin in higher-level router guard.
     For now, minimal enforcement assumes admin guard is applied by route inclusion.
     """
-    jti = uuid4().hex
+    jti = secrets.token_hex(16)
     inv = InviteModel(
         email=payload.email,
         role_name=payload.role,
@@ -150,65 +195,112 @@ class ActivateIn(BaseModel):
 
 @router.post("/activate", response_model=Token)
 async def activate(body: ActivateIn, db: Session = Depends(get_db)):
-    from jose import JWTError
     try:
-        data = jwt.decode(body.invite_token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-    except Exception:
+        data = jwt.decode(body.invite_token, verification_key(), algorithms=[settings.ALGORITHM])
+    except jwt.InvalidTokenError:
         raise HTTPException(status_code=400, detail="Invalid invite token")
     if data.get("type") != "invite":
         raise HTTPException(status_code=400, detail="Wrong token type")
-    email, role, jti = data.get("sub"), data.get("role"), data.get("jti")
+    email, role, jti = str(data.get("sub") or "").strip().lower(), data.get("role"), data.get("jti")
     inv = db.query(InviteModel).filter(InviteModel.code_jti == jti).first()
     if not inv or inv.used_at is not None or inv.email.lower() != str(email).lower():
         raise HTTPException(status_code=400, detail="Invite not found or used")
-    if inv.expires_at < _now_utc():
+    now = _now_utc()
+    if _as_utc(inv.expires_at) < now:
         raise HTTPException(status_code=400, detail="Invite expired")
 
-    user = db.query(User).filter(User.email == email).first()
-    created = False
-    if user is None:
-        user = User(email=email, first_name=email.split('@')[0], last_name="", hashed_password=get_password_hash(body.password), is_active=True)
-        db.add(user)
-        created = True
-    else:
-        user.hashed_password = get_password_hash(body.password)
-        user.is_active = True
-    # First commit user upsert
+    user = db.query(User).filter(func.lower(User.email) == email).first()
+    hashed_password = await run_in_threadpool(get_password_hash, body.password)
+    # User upsert, role assignment and invite consumption commit together
     try:
-        db.commit(); db.refresh(user)
+        if user is None:
+            user = User(email=email, first_name=email.split('@')[0], last_name="", hashed_password=hashed_password, is_active=True)
+            db.add(user)
+        else:
+            user.hashed_password = hashed_password
+            user.is_active = True
+
+        # Assign role if available
+        if role and not any(r.name == role for r in user.roles):
+            role_obj = get_role_by_name(db, role)
+            if role_obj:
+                user.roles.append(role_obj)
+
+        # Mark invite used
+        inv.used_at = now
+        db.flush()  # assigns user.id without a separate commit
+        user_id = user.id
+        db.commit()
     except Exception as e:
         db.rollback()
-        raise HTTPException(status_code=500, detail=f"activate user commit failed: {e}")
-
-    # Assign role if available
-    if role and not any(r.name == role for r in user.roles):
-        role_obj = db.query(Role).filter(Role.name == role).first()
-        if role_obj:
-            user.roles.append(role_obj)
-            try:
-                db.commit(); db.refresh(user)
-            except Exception as e:
-                db.rollback()
-                raise HTTPException(status_code=500, detail=f"activate role assign failed: {e}")
-
-    # Mark invite used
-    inv.used_at = _now_utc()
+        raise HTTPException(status_code=500, detail=f"activate commit failed: {e}")
+
+    access_token = create_access_token({"sub": str(user_id)}, expires_delta=timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES))
+    return {"access_token": access_token, "token_type": "bearer", "expires_in": settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60}
+
+def _primary_role_name(user: User) -> str:
+    """Highest-priority active role, else the first assigned role, else candidate.
+
+    user.roles is eager-loaded by both callers (authenticate_user and
+    get_current_user), so this is pure in-memory work.
+    """
+    role = user.get_primary_role()
+    if role is None and user.roles:
+        role = user.roles[0]
+    return role.name if role is not None else 'candidate'
+
+def _write_after_response(bind, label: str, write, *args) -> None:
+    """Background task: run ``write(db, *args)`` on a fresh Session and commit.
+
+    Handlers have already returned by the time this runs, so the request's
+    Session is closed; a private one bound to the same engine is used instead.
+    """
+    db = Session(bind=bind)
     try:
+        write(db, *args)
         db.commit()
-    except Exception as e:
+    except Exception:
         db.rollback()
-        raise HTTPException(status_code=500, detail=f"activate invite commit failed: {e}")
+        logger.exception("%s failed", label)
+    finally:
+        db.close()
 
-    access_token = create_access_token({"sub": str(user.id)}, expires_delta=timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES))
-    return {"access_token": access_token, "token_type": "bearer", "expires_in": settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60}
+def _record_login(db: Session, user_id: int, jti: str, expires_at: datetime,
+                  ip_address: Optional[str], user_agent: Optional[str]) -> None:
+    """Bump login stats and store the session row for a login.
+
+    The session row keeps only the token's jti, not the token itself.
+    """
+    # Increment in SQL so concurrent logins can't lose a count
+    db.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(last_login=func.now(), login_count=func.coalesce(User.login_count, 0) + 1)
+    )
+    db.add(UserSession(
+        user_id=user_id,
+        session_token=jti,
+        expires_at=expires_at,
+        ip_address=ip_address,
+        user_agent=user_agent,
+    ))
+
+def _persist_reset(db: Session, user_id: int, token: str, expires_at: datetime) -> None:
+    """Store a password-reset token on the user row."""
+    db.query(User).filter(User.id == user_id).update(
+        {User.password_reset_token: token, User.password_reset_expires: expires_at},
+        synchronize_session=False,
+    )
 
 @router.post("/login", response_model=Token)
 async def login(
+    background_tasks: BackgroundTasks,
     form_data: OAuth2PasswordRequestForm = Depends(),
     db: Session = Depends(get_db)
 ):
     """Login and get access token."""
-    user = authenticate_user(db, form_data.username, form_data.password)
+    # Verification (and any rehash) is CPU-bound by design; keep it off the loop
+    user = await run_in_threadpool(authenticate_user, db, form_data.username, form_data.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -222,47 +314,26 @@ async def login(
             detail="Account is deactivated"
         )
     
-    # Update last login
-    user.last_login = datetime.utcnow()
-    user.login_count = (user.login_count or 0) + 1
-    
-    # Create session record
-    session = UserSession(
-        user_id=user.id,
-        session_token=create_access_token(data={"sub": str(user.id)}),
-        expires_at=datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES),
-        ip_address=form_data.client_id if hasattr(form_data, 'client_id') else None,
-        user_agent=form_data.client_secret if hasattr(form_data, 'client_secret') else None
+    # Session row (identified by the token's jti) and last-login stats are
+    # written after the response goes out
+    jti = secrets.token_hex(16)
+    background_tasks.add_task(
+        _write_after_response,
+        db.get_bind(),
+        f"Recording login for user {user.id}",
+        _record_login,
+        user.id,
+        jti,
+        _now_utc() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES),
+        form_data.client_id if hasattr(form_data, 'client_id') else None,
+        form_data.client_secret if hasattr(form_data, 'client_secret') else None,
     )
     
-    db.add(session)
-    db.commit()
-    
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    # Determine primary role name (fallback to candidate if none)
-    primary_role = None
-    candidate_email = "kc5817@srmist.edu.in"
-    if user.email.lower() == candidate_email:
-        primary_role = 'candidate'
-    else:
-        try:
-            if hasattr(user, 'get_primary_role'):
-                pr = user.get_primary_role()
-                primary_role = pr.name if pr else None
-        except Exception:
-            primary_role = None
-        if not primary_role:
-            # Fallback logic: inspect roles relationship directly
-            try:
-                if user.roles:
-                    primary_role = getattr(user.roles[0], 'name', None)
-            except Exception:
-                primary_role = None
-        if not primary_role:
-            primary_role = 'candidate'
+    primary_role = _primary_role_name(user)
 
     access_token = create_access_token(
-        data={"sub": str(user.id), "role": primary_role, "email": user.email}, expires_delta=access_token_expires
+        data={"sub": str(user.id), "role": primary_role, "email": user.email, "jti": jti}, expires_delta=access_token_expires
     )
     
     # Surface must_change_password flag for UI convenience
@@ -277,22 +348,23 @@ async def login(
 
 @router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
 async def logout(
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    credentials: HTTPAuthorizationCredentials = Depends(security),
 ):
     """Logout current user."""
-    # Invalidate all active sessions for the user
-    active_sessions = db.query(UserSession).filter(
+    invalidate_token_cache(credentials.credentials)
+    # Session rows are bookkeeping only (auth never consults them), so closing
+    # them out can wait until the 204 has been sent
+    background_tasks.add_task(
+        _write_after_response,
+        db.get_bind(),
+        f"Closing sessions for user {current_user.id}",
+        _deactivate_sessions,
         UserSession.user_id == current_user.id,
-        UserSession.is_active == True,
-        UserSession.expires_at > datetime.utcnow()
-    ).all()
-    
-    for session in active_sessions:
-        session.is_active = False
-        session.logged_out_at = datetime.utcnow()
-    
-    db.commit()
+        UserSession.expires_at > _now_utc(),
+    )
 
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_info(
@@ -315,14 +387,7 @@ async def refresh_token(
     
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     # Determine role & include email for consistency
-    role_name = None
-    try:
-        pr = current_user.get_primary_role() if hasattr(current_user, 'get_primary_role') else None
-        role_name = pr.name if pr else None
-    except Exception:
-        role_name = None
-    if not role_name:
-        role_name = 'candidate'
+    role_name = _primary_role_name(current_user)
     access_token = create_access_token(
         data={"sub": str(current_user.id), "role": role_name, "email": current_user.email}, expires_delta=access_token_expires
     )
@@ -337,37 +402,37 @@ async def refresh_token(
 async def change_password(
     password_data: PasswordChange,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    credentials: HTTPAuthorizationCredentials = Depends(security),
 ):
     """Change user password."""
     # Verify current password
-    if not verify_password(password_data.current_password, current_user.hashed_password):
+    if not await run_in_threadpool(verify_password, password_data.current_password, current_user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Incorrect current password"
         )
     
     # Update password
-    current_user.hashed_password = get_password_hash(password_data.new_password)
-    current_user.password_changed_at = datetime.utcnow()
+    current_user.hashed_password = await run_in_threadpool(get_password_hash, password_data.new_password)
+    now = _now_utc()
+    current_user.password_changed_at = now
     _set_must_change_password(current_user, False)
     
     # Invalidate all sessions except current one
-    active_sessions = db.query(UserSession).filter(
+    _deactivate_sessions(
+        db,
         UserSession.user_id == current_user.id,
-        UserSession.is_active == True,
-        UserSession.expires_at > datetime.utcnow()
-    ).all()
-    
-    for session in active_sessions:
-        session.is_active = False
-        session.logged_out_at = datetime.utcnow()
+        UserSession.expires_at > now,
+    )
     
     db.commit()
+    invalidate_token_cache(credentials.credentials)
 
 @router.post("/forgot-password", status_code=status.HTTP_204_NO_CONTENT)
 async def forgot_password(
     request_data: PasswordResetRequest,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ):
     """Request password reset."""
@@ -382,12 +447,18 @@ async def forgot_password(
         expires_delta=timedelta(hours=1)  # Reset token expires in 1 hour
     )
     
-    user.password_reset_token = reset_token
-    user.password_reset_expires = datetime.utcnow() + timedelta(hours=1)
-    
-    db.commit()
+    background_tasks.add_task(
+        _write_after_response,
+        db.get_bind(),
+        f"Storing reset token for user {user.id}",
+        _persist_reset,
+        user.id,
+        reset_token,
+        _now_utc() + timedelta(hours=1),
+    )
     
-    # TODO: Send email with reset link
+    # TODO: Send email with reset link (queue it after _persist_reset so the
+    # token is stored before the link can be followed)
     # send_password_reset_email(user.email, reset_token)
 
 @router.post("/reset-password", status_code=status.HTTP_204_NO_CONTENT)
@@ -399,7 +470,7 @@ async def reset_password(
     try:
         payload = jwt.decode(
             reset_data.token, 
-            settings.SECRET_KEY, 
+            verification_key(), 
             algorithms=[settings.ALGORITHM]
         )
         user_id: int = payload.get("sub")
@@ -410,7 +481,7 @@ async def reset_password(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Invalid reset token"
             )
-    except jwt.JWTError:
+    except jwt.InvalidTokenError:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid reset token"
@@ -424,29 +495,24 @@ async def reset_password(
         )
     
     # Check if token matches and hasn't expired
+    now = _now_utc()
     if (user.password_reset_token != reset_data.token or 
-        user.password_reset_expires < datetime.utcnow()):
+        user.password_reset_expires is None or
+        _as_utc(user.password_reset_expires) < now):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid or expired reset token"
         )
     
     # Update password
-    user.hashed_password = get_password_hash(reset_data.new_password)
-    user.password_changed_at = datetime.utcnow()
+    user.hashed_password = await run_in_threadpool(get_password_hash, reset_data.new_password)
+    user.password_changed_at = now
     user.password_reset_token = None
     user.password_reset_expires = None
     _set_must_change_password(user, False)
     
     # Invalidate all sessions
-    active_sessions = db.query(UserSession).filter(
-        UserSession.user_id == user.id,
-        UserSession.is_active == True
-    ).all()
-    
-    for session in active_sessions:
-        session.is_active = False
-        session.logged_out_at = datetime.utcnow()
+    _deactivate_sessions(db, UserSession.user_id == user.id)
     
     db.commit()
 
@@ -459,8 +525,8 @@ class ResetConfirmIn(BaseModel):
 async def reset_confirm(body: ResetConfirmIn, db: Session = Depends(get_db)):
     """Confirm reset via admin-issued short-lived token."""
     try:
-        data = jwt.decode(body.reset_token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-    except Exception:
+        data = jwt.decode(body.reset_token, verification_key(), algorithms=[settings.ALGORITHM])
+    except jwt.InvalidTokenError:
         raise HTTPException(status_code=400, detail="Invalid reset token")
     if data.get("type") != "reset":
         raise HTTPException(status_code=400, detail="Wrong token type")
@@ -468,15 +534,16 @@ async def reset_confirm(body: ResetConfirmIn, db: Session = Depends(get_db)):
     pr = db.query(PasswordResetModel).filter(PasswordResetModel.jti == jti).first()
     if not pr or pr.used_at is not None or pr.email.lower() != str(email).lower():
         raise HTTPException(status_code=400, detail="Reset record invalid/used")
-    if pr.expires_at < _now_utc():
+    now = _now_utc()
+    if _as_utc(pr.expires_at) < now:
         raise HTTPException(status_code=400, detail="Reset token expired")
     user = db.query(User).filter(User.email == email).first()
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-    user.hashed_password = get_password_hash(body.new_password)
-    user.password_changed_at = datetime.utcnow()
+    user.hashed_password = await run_in_threadpool(get_password_hash, body.new_password)
+    user.password_changed_at = now
     _set_must_change_password(user, False)
-    pr.used_at = _now_utc()
+    pr.used_at = now
     db.commit()
     access_token = create_access_token({"sub": str(user.id)}, expires_delta=timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES))
     return {"access_token": access_token, "token_type": "bearer", "expires_in": settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60}
@@ -490,7 +557,7 @@ async def get_user_sessions(
     sessions = db.query(UserSession).filter(
         UserSession.user_id == current_user.id,
         UserSession.is_active == True,
-        UserSession.expires_at > datetime.utcnow()
+        UserSession.expires_at > _now_utc()
     ).all()
     
     return [{
@@ -505,21 +572,26 @@ async def get_user_sessions(
 @router.delete("/sessions/{session_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def revoke_session(
     session_id: int,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Revoke a specific session."""
-    session = db.query(UserSession).filter(
+    found = db.query(UserSession.id).filter(
         UserSession.id == session_id,
         UserSession.user_id == current_user.id
     ).first()
     
-    if not session:
+    if not found:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Session not found"
         )
     
-    session.is_active = False
-    session.logged_out_at = datetime.utcnow()
-    db.commit()
\ No newline at end of file
+    background_tasks.add_task(
+        _write_after_response,
+        db.get_bind(),
+        f"Revoking session {session_id}",
+        _deactivate_sessions,
+        UserSession.id == session_id,
+    )
\ No newline at end of file
@@ -18,8 +18,12 @@ from app.services.bench_service import BenchService
 router = APIRouter(prefix="/candidates", tags=["bench"])
 
 
+# BenchService holds no per-request state, so one instance serves every request
+_BENCH_SERVICE = BenchService()
+
+
 def get_service() -> BenchService:
-    return BenchService()
+    return _BENCH_SERVICE
 
 
 @router.post("/", response_model=CandidateBenchResponse, status_code=status.HTTP_201_CREATED)
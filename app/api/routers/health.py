@@ -1,13 +1,35 @@
+import threading
+import time
+
 from fastapi import APIRouter
 
+from app.core.config import settings
 from app.schemas.pipeline import HealthResponse
 from app.services.pipeline import PipelineService
 
 router = APIRouter()
 
+# Last check_health() result and the monotonic time it goes stale
+_cached_health = None
+_cached_until = 0.0
+_refresh_lock = threading.Lock()
+
+def _current_health() -> HealthResponse:
+    global _cached_health, _cached_until
+    if _cached_health is not None and time.monotonic() < _cached_until:
+        return _cached_health
+    with _refresh_lock:
+        # Another probe may have refreshed while this one waited
+        if _cached_health is None or time.monotonic() >= _cached_until:
+            _cached_health = HealthResponse(**PipelineService.check_health())
+            _cached_until = time.monotonic() + settings.HEALTH_CACHE_TTL
+        return _cached_health
+
 @router.get("/healthz", response_model=HealthResponse)
-async def health_check():
+def health_check():
     """
     Health check endpoint to verify API and service health
     """
-    return PipelineService.check_health()
+    # check_health() does blocking DB/HTTP calls, so this stays a plain def
+    # (threadpool) and probes inside the TTL reuse the last result
+    return _current_health()
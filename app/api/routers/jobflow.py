@@ -1,13 +1,24 @@
 from __future__ import annotations
-from fastapi import APIRouter, HTTPException, UploadFile, File, Request
-from fastapi.responses import FileResponse, RedirectResponse
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, UploadFile, File, Request
+from fastapi.responses import FileResponse, ORJSONResponse, RedirectResponse
 from pydantic import BaseModel
 from typing import List, Optional
-import os, json, hashlib, shutil, concurrent.futures, time, uuid, sqlite3
+import os, hashlib, re, concurrent.futures, time, uuid, sqlite3, stat
+import logging
 import asyncio
-
-from app.models import PipelineRun, RunStatus, Stage, ScrapedJob
-from app.core.database import SessionLocal
+import aiofiles
+import orjson
+import multiprocessing
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+
+from app.models import PipelineRun, RunStatus, Stage, ScrapedJob, RunEmailEvent
+from cachetools import TTLCache
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, load_only
+
+from app.core.database import get_db
 from app.services.pipeline_orchestrator import run_pipeline
 from app.services.apollo_enrichment import search_recruiter_contacts
 from job_application_pipeline import extract_resume_text
@@ -24,56 +35,70 @@ from app.services.apollo_enrichment import find_recruiter_contact
 from app.services.apollo_enrichment import search_recruiter_contacts as _search_multi_contacts
 from app.services.supabase_storage import upload_bytes, get_public_url, create_signed_url, list_prefix  # safe even if None when not configured
 
-# Optional: expose email tracker DB (events.db) if present
-def _get_events_conn():
-    """Read-only style connection (returns None if file missing)."""
-    db_path = os.getenv('TRACKING_DB_PATH', 'events.db')
-    if not os.path.exists(db_path):
-        return None
-    try:
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
-    except Exception:
-        return None
+# Email tracker DB (events.db): one long-lived connection shared by every
+# request. SQLite serialises writers anyway, so guarding a single connection
+# with a lock costs nothing and avoids a connect/teardown (and a cold page
+# cache) per tracked send.
+_EVENTS_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS messages (
+        id TEXT PRIMARY KEY,
+        to_email TEXT,
+        subject TEXT,
+        created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+        provider_msgid TEXT
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS events (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        msg_id TEXT,
+        event TEXT,
+        email TEXT,
+        url TEXT,
+        reason TEXT,
+        timestamp INTEGER
+    )
+    """,
+    # Per-message event lookups and counts
+    "CREATE INDEX IF NOT EXISTS idx_events_msg_id ON events(msg_id)",
+)
+_events_db: sqlite3.Connection | None = None
+_events_lock = threading.Lock()
+
+def _open_events_db() -> sqlite3.Connection:
+    """Connect to events.db and ensure the required tables exist (once per process)."""
+    # Autocommit mode: writers open their own BEGIN IMMEDIATE transaction
+    conn = sqlite3.connect(os.getenv('TRACKING_DB_PATH', 'events.db'), check_same_thread=False, isolation_level=None)
+    # Return rows as dict-like objects for r['col'] access
+    conn.row_factory = sqlite3.Row
+    # WAL + synchronous=NORMAL: one cheap fsync per checkpoint instead of per commit
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    for ddl in _EVENTS_SCHEMA:
+        conn.execute(ddl)
+    return conn
+
+@contextmanager
+def _events_conn():
+    """Hold the shared events.db connection for one unit of work.
+
+    Yields None when the database cannot be opened; the next call retries.
+    """
+    global _events_db
+    with _events_lock:
+        if _events_db is None:
+            try:
+                _events_db = _open_events_db()
+            except Exception:
+                _events_db = None
+        yield _events_db
 
-def _get_events_conn_writable():
-    """Ensure events.db exists with required tables and return connection."""
-    db_path = os.getenv('TRACKING_DB_PATH', 'events.db')
-    try:
-        conn = sqlite3.connect(db_path)
-        # Return rows as dict-like objects for r['col'] access
-        conn.row_factory = sqlite3.Row
-        cur = conn.cursor()
-        # Create tables if they do not exist
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS messages (
-                id TEXT PRIMARY KEY,
-                to_email TEXT,
-                subject TEXT,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                provider_msgid TEXT
-            )
-        """)
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS events (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                msg_id TEXT,
-                event TEXT,
-                email TEXT,
-                url TEXT,
-                reason TEXT,
-                timestamp INTEGER
-            )
-        """)
-        conn.commit()
-        return conn
-    except Exception:
-        try:
-            conn.close()
-        except Exception:  # pragma: no cover - best effort
-            pass
-        return None
+def init_events_schema() -> None:
+    """Open events.db at startup so the first tracked send doesn't pay for setup."""
+    with _events_conn():
+        pass
 
 def _record_tracked_email(email: str, subject: str, status: str, provider_msgid: str | None = None):
     """Insert (or upsert) a tracked message + initial event so UI can display it.
@@ -81,31 +106,134 @@ def _record_tracked_email(email: str, subject: str, status: str, provider_msgid:
     We intentionally create a new synthetic message id for each send attempt so the
     UI reflects individual actions (including dry-run previews).
     """
-    conn = _get_events_conn_writable()
-    if not conn:
-        return
-    try:
-        msg_id = uuid.uuid4().hex
-        ts = int(time.time())
-        cur = conn.cursor()
-        cur.execute(
-            "INSERT INTO messages(id,to_email,subject,provider_msgid) VALUES (?,?,?,?)",
-            (msg_id, email, subject, provider_msgid)
-        )
-        cur.execute(
-            "INSERT INTO events(msg_id,event,email,timestamp) VALUES (?,?,?,?)",
-            (msg_id, status, email, ts)
-        )
-        conn.commit()
-    except Exception:
-        pass
-    finally:
+    with _events_conn() as conn:
+        if conn is None:
+            return
         try:
-            conn.close()
+            msg_id = uuid.uuid4().hex
+            ts = int(time.time())
+            cur = conn.cursor()
+            # Both rows in one transaction: a single write lock and commit
+            cur.execute("BEGIN IMMEDIATE")
+            cur.execute(
+                "INSERT INTO messages(id,to_email,subject,provider_msgid) VALUES (?,?,?,?)",
+                (msg_id, email, subject, provider_msgid)
+            )
+            cur.execute(
+                "INSERT INTO events(msg_id,event,email,timestamp) VALUES (?,?,?,?)",
+                (msg_id, status, email, ts)
+            )
+            conn.commit()
         except Exception:
-            pass
-
-router = APIRouter(prefix="/api", tags=["jobflow"])  # global prefix alignment
+            # Never leave a half-written transaction on the shared connection
+            if conn.in_transaction:
+                conn.rollback()
+
+router = APIRouter(prefix="/api", tags=["jobflow"], default_response_class=ORJSONResponse)  # global prefix alignment
+logger = logging.getLogger(__name__)
+
+# The event loop only keeps weak references to tasks; hold running pipeline
+# tasks here so a fire-and-forget run cannot be garbage-collected mid-flight
+_PIPELINE_TASKS: set[asyncio.Task] = set()
+
+# OpenAI calls one generate request keeps in flight, and the shared worker
+# pool for those blocking helpers. The pool is sized above the per-request
+# limit so a few concurrent requests (or calls still running after their
+# timeout fired) do not leave new calls queued while their timer runs.
+_OPENAI_CONCURRENCY = 8
+_OPENAI_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=4 * _OPENAI_CONCURRENCY, thread_name_prefix="openai")
+
+# SendGrid deliveries in flight at once for one send request
+_SENDGRID_CONCURRENCY = 8
+
+# Supabase Storage uploads in flight at once when mirroring generated files
+_STORAGE_UPLOAD_CONCURRENCY = 8
+_DOCX_CONTENT_TYPE = 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+
+# Rows per fetch when streaming a run's jobs through document generation
+_JOB_STREAM_BATCH = 200
+
+# Worker processes for python-docx conversions, created on first use. Spawned
+# rather than forked: the server process is multi-threaded.
+_DOCX_POOL: concurrent.futures.ProcessPoolExecutor | None = None
+_DOCX_POOL_LOCK = threading.Lock()
+
+
+def _docx_pool() -> concurrent.futures.ProcessPoolExecutor:
+    global _DOCX_POOL
+    with _DOCX_POOL_LOCK:
+        if _DOCX_POOL is None:
+            _DOCX_POOL = concurrent.futures.ProcessPoolExecutor(
+                max_workers=min(4, os.cpu_count() or 1),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _DOCX_POOL
+
+
+def shutdown_docx_pool() -> None:
+    """Stop the DOCX worker processes, if any were started."""
+    global _DOCX_POOL
+    with _DOCX_POOL_LOCK:
+        if _DOCX_POOL is not None:
+            _DOCX_POOL.shutdown(wait=False, cancel_futures=True)
+            _DOCX_POOL = None
+
+# Apollo lookups in flight at once for one bulk request (Apollo rate-limits)
+_APOLLO_CONCURRENCY = 5
+
+_TOKEN_RE = re.compile(r"[a-zA-Z0-9]+")
+_HTML_TAG_RE = re.compile(r"<[^<]+?>")
+# Anything but letters, digits, "_", "-" and "." (\w is Unicode-aware, like str.isalnum)
+_UNSAFE_FILENAME_RE = re.compile(r"[^\w.-]+")
+# Tokenised resume per run id, stored with the text it came from. Job list and
+# detail polls score every job against the same resume, so tokenise it once.
+_RESUME_TOKENS: TTLCache = TTLCache(maxsize=1024, ttl=900)
+# Unique tokens of each job description by job id. Descriptions are written
+# once at scrape time, so polls reuse the set instead of re-running the regex.
+_JOB_TOKENS: TTLCache = TTLCache(maxsize=20_000, ttl=900)
+_TOKENS_LOCK = threading.Lock()
+
+def _resume_tokens(run_id: int, resume_text: str) -> set[str]:
+    with _TOKENS_LOCK:
+        hit = _RESUME_TOKENS.get(run_id)
+    if hit is not None and hit[0] == resume_text:
+        return hit[1]
+    toks = set(_TOKEN_RE.findall(resume_text.lower()))
+    with _TOKENS_LOCK:
+        _RESUME_TOKENS[run_id] = (resume_text, toks)
+    return toks
+
+def _job_tokens(job_id: int, description: str) -> frozenset[str]:
+    with _TOKENS_LOCK:
+        toks = _JOB_TOKENS.get(job_id)
+    if toks is None:
+        toks = frozenset(_TOKEN_RE.findall(description.lower()))
+        with _TOKENS_LOCK:
+            _JOB_TOKENS[job_id] = toks
+    return toks
+
+def _run_job_count(db: Session, run_id: int) -> int:
+    # COUNT over the (run_id, id) index, without wrapping the ORM query in a subquery
+    return db.scalar(select(func.count()).select_from(ScrapedJob).filter(ScrapedJob.run_id == run_id)) or 0
+
+def _run_job_partitions(db: Session, run_id: int, limit: int | None = None):
+    """Yield a run's jobs in lists of _JOB_STREAM_BATCH, fetched as they are consumed."""
+    stmt = select(ScrapedJob).filter(ScrapedJob.run_id == run_id)
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return db.scalars(stmt.execution_options(yield_per=_JOB_STREAM_BATCH)).partitions()
+
+def _cached_job_tokens(job_ids) -> dict[int, frozenset[str]]:
+    with _TOKENS_LOCK:
+        return {jid: toks for jid in job_ids if (toks := _JOB_TOKENS.get(jid)) is not None}
+
+def _resume_match(toks_r: set[str], toks_j: frozenset[str]) -> float | None:
+    """Token overlap ratio (case-insensitive unique tokens) as a 0-100 percent."""
+    if not toks_r or not toks_j:
+        return None
+    overlap = len(toks_r & toks_j)
+    denom = min(len(toks_r), len(toks_j)) or 1
+    return round((overlap/denom)*100, 1)
 
 
 class QuickSearchRequest(BaseModel):
@@ -120,6 +248,13 @@ class QuickSearchJob(BaseModel):
     url: Optional[str]
     source: str
 
+# (title template, company, default location, url) for quick-search fallback results
+_DEMO_SAMPLES = (
+    ("{q} Engineer", "Acme Corp", "Remote", "https://example.com/job/acme"),
+    ("Senior {q} Developer", "Globex", "USA", "https://example.com/job/globex"),
+    ("{q} Specialist", "Initech", "Europe", "https://example.com/job/initech"),
+)
+
 @router.post("/search/jobs", response_model=List[QuickSearchJob])
 async def quick_search_jobs(payload: QuickSearchRequest):
     """Lightweight job search without creating a full pipeline run.
@@ -145,19 +280,28 @@ async def quick_search_jobs(payload: QuickSearchRequest):
         ))
     if not results:
         # fallback demo jobs
-        demo_samples = [
-            (f"{payload.query.title()} Engineer", "Acme Corp", payload.location or "Remote", "https://example.com/job/acme"),
-            (f"Senior {payload.query.title()} Developer", "Globex", payload.location or "USA", "https://example.com/job/globex"),
-            (f"{payload.query.title()} Specialist", "Initech", payload.location or "Europe", "https://example.com/job/initech"),
-        ]
-        for t,c,l,u in demo_samples[:payload.limit]:
-            results.append(QuickSearchJob(title=t, company=c, location=l, url=u, source="demo"))
+        q_title = payload.query.title()
+        for t,c,l,u in _DEMO_SAMPLES[:payload.limit]:
+            results.append(QuickSearchJob(title=t.format(q=q_title), company=c, location=payload.location or l, url=u, source="demo"))
     return results
 
 
+# Last /api/health payload and the monotonic time it goes stale; pollers
+# inside the window get it without another SendGrid round trip
+_health_cache: dict | None = None
+_health_cache_until = 0.0
+
 @router.get("/health")
-async def health():
+async def health(request: Request):
     """Composite health check including external service probes (lightweight)."""
+    global _health_cache, _health_cache_until
+    if _health_cache is not None and time.monotonic() < _health_cache_until:
+        return _health_cache
+    _health_cache = await _probe_services(request)
+    _health_cache_until = time.monotonic() + settings.HEALTH_CACHE_TTL
+    return _health_cache
+
+async def _probe_services(request: Request) -> dict:
     results: dict[str, dict] = {}
     # OpenAI check: validate API key format / quick model list (head request fallback)
     try:
@@ -193,8 +337,14 @@ async def health():
             url = 'https://api.sendgrid.com/v3/user/account'
             headers = {"Authorization": f"Bearer {settings.SENDGRID_API_KEY}"}
             try:
-                async with httpx.AsyncClient(timeout=3.5) as client:
+                # Reuse the app-wide client (warm connection to SendGrid); a
+                # throwaway one only when startup hasn't run (e.g. bare TestClient)
+                client = getattr(request.app.state, 'http', None)
+                if client is not None:
                     r = await client.get(url, headers=headers)
+                else:
+                    async with httpx.AsyncClient(timeout=3.5) as tmp:
+                        r = await tmp.get(url, headers=headers)
                 if r.status_code in (200, 201):
                     results['sendgrid'] = {"ok": True}
                 elif r.status_code == 401:
@@ -232,24 +382,25 @@ class RunStatusResponse(BaseModel):
 
 
 @router.post("/jobs/run", response_model=RunStartResponse)
-async def start_run(req: RunRequest):
-    db = SessionLocal()
+async def start_run(req: RunRequest, db: Session = Depends(get_db)):
     run = PipelineRun(query=req.query, locations=req.locations, sources=req.sources or ["indeed"], counts={})
+    # counts starts as {} so the UI sees a pending run even if the pipeline
+    # fails early; one flush assigns the id and one commit persists it
     db.add(run)
+    db.flush()
+    run_id = run.id
     db.commit()
-    db.refresh(run)
-    # Basic log in counts immediately so UI sees pending run even if pipeline fails early
-    run.counts = run.counts or {}
-    db.add(run); db.commit()
-    # Execute pipeline inline (temporary) to ensure deterministic insertion for demo
     # Launch pipeline in background so client can poll for progressive counts
-    asyncio.create_task(run_pipeline(run.id, req.query, req.locations, req.sources))
-    return RunStartResponse(task_id=str(run.id))
+    task = asyncio.create_task(run_pipeline(run_id, req.query, req.locations, req.sources))
+    _PIPELINE_TASKS.add(task)
+    task.add_done_callback(_PIPELINE_TASKS.discard)
+    return RunStartResponse(task_id=str(run_id))
 
 
 @router.get("/runs/{task_id}", response_model=RunStatusResponse)
-async def get_run(task_id: str):
-    db = SessionLocal()
+def get_run(task_id: str, db: Session = Depends(get_db)):
+    # Run/job read and enrich endpoints are plain def: their DB (and Apollo)
+    # calls run on the threadpool instead of blocking the event loop.
     run = db.get(PipelineRun, int(task_id))
     if not run:
         raise HTTPException(status_code=404, detail="Run not found")
@@ -303,25 +454,22 @@ class JobDetailResponse(BaseModel):
     resume_match: float | None = None
 
 @router.get("/runs/{task_id}/jobs/{job_id}/details", response_model=JobDetailResponse)
-async def get_job_details(task_id: str, job_id: int, request: Request):
-    db = SessionLocal()
+def get_job_details(task_id: str, job_id: int, request: Request, db: Session = Depends(get_db)):
     job = db.get(ScrapedJob, job_id)
     if not job or job.run_id != int(task_id):
         raise HTTPException(status_code=404, detail="Job not found for run")
-    import os, json as _json
     base_url = str(request.base_url).rstrip('/')
     run_dir = os.path.join(os.getcwd(), 'generated_docs', f'run_{task_id}')
     txt_path = os.path.join(run_dir, f'resume_job{job.id}.txt')
     docx_path = os.path.join(run_dir, f'resume_job{job.id}.docx')
     txt_url = f"{base_url}/generated_docs/run_{task_id}/resume_job{job.id}.txt" if os.path.exists(txt_path) else None
     docx_url = f"{base_url}/generated_docs/run_{task_id}/resume_job{job.id}.docx" if os.path.exists(docx_path) else None
-    from app.core.config import settings as _settings
-    if _settings.supabase_storage_enabled:
+    if settings.supabase_storage_enabled:
         try:
             key_txt = f"runs/{task_id}/resume_job{job.id}.txt"
             key_docx = f"runs/{task_id}/resume_job{job.id}.docx"
-            supa_txt = get_public_url(_settings.SUPABASE_STORAGE_BUCKET_DOCS, key_txt) or create_signed_url(_settings.SUPABASE_STORAGE_BUCKET_DOCS, key_txt, 3600)
-            supa_docx = get_public_url(_settings.SUPABASE_STORAGE_BUCKET_DOCS, key_docx) or create_signed_url(_settings.SUPABASE_STORAGE_BUCKET_DOCS, key_docx, 3600)
+            supa_txt = get_public_url(settings.SUPABASE_STORAGE_BUCKET_DOCS, key_txt) or create_signed_url(settings.SUPABASE_STORAGE_BUCKET_DOCS, key_txt, 3600)
+            supa_docx = get_public_url(settings.SUPABASE_STORAGE_BUCKET_DOCS, key_docx) or create_signed_url(settings.SUPABASE_STORAGE_BUCKET_DOCS, key_docx, 3600)
             txt_url = supa_txt or txt_url
             docx_url = supa_docx or docx_url
         except Exception:
@@ -329,7 +477,7 @@ async def get_job_details(task_id: str, job_id: int, request: Request):
     recruiter_contacts = None
     if job.metadata_json:
         try:
-            meta = _json.loads(job.metadata_json) or {}
+            meta = orjson.loads(job.metadata_json) or {}
             if isinstance(meta.get('recruiter_contacts'), list):
                 recruiter_contacts = meta.get('recruiter_contacts')
         except Exception:
@@ -338,16 +486,15 @@ async def get_job_details(task_id: str, job_id: int, request: Request):
     if recruiter_contacts is None:
         try:
             if settings.APOLLO_API_KEY and job.company and job.title:
-                from app.services.apollo_enrichment import search_recruiter_contacts as _live_search
-                live = _live_search(job.company, job.title, max_results=5) or []
+                live = search_recruiter_contacts(job.company, job.title, max_results=5) or []
                 if live:
                     recruiter_contacts = live
                     try:
-                        meta = (job.metadata_json and _json.loads(job.metadata_json)) or {}
+                        meta = (job.metadata_json and orjson.loads(job.metadata_json)) or {}
                     except Exception:
                         meta = {}
                     meta['recruiter_contacts'] = live
-                    job.metadata_json = _json.dumps(meta)
+                    job.metadata_json = orjson.dumps(meta).decode()
                     db.add(job)
                     db.commit()
         except Exception:
@@ -361,20 +508,13 @@ async def get_job_details(task_id: str, job_id: int, request: Request):
     resume_text = None
     try:
         if run and getattr(run, 'metadata_json', None):
-            _meta = _json.loads(run.metadata_json) or {}
+            _meta = orjson.loads(run.metadata_json) or {}
             resume_text = _meta.get('resume_text')
     except Exception:
         resume_text = None
     if resume_text and job.description:
         try:
-            # Simple token overlap ratio (case-insensitive unique tokens)
-            import re
-            toks_r = set(re.findall(r"[a-zA-Z0-9]+", resume_text.lower()))
-            toks_j = set(re.findall(r"[a-zA-Z0-9]+", job.description.lower()))
-            if toks_r and toks_j:
-                overlap = len(toks_r & toks_j)
-                denom = min(len(toks_r), len(toks_j)) or 1
-                resume_match_val = round((overlap/denom)*100, 1)
+            resume_match_val = _resume_match(_resume_tokens(job.run_id, resume_text), _job_tokens(job.id, job.description))
         except Exception:
             resume_match_val = None
     return JobDetailResponse(
@@ -415,32 +555,52 @@ class BulkEnrichResponse(BaseModel):
 
 
 @router.get("/runs/{task_id}/jobs", response_model=List[RunJobItem])
-async def list_run_jobs(task_id: str, request: Request):
-    db = SessionLocal()
-    jobs = db.query(ScrapedJob).filter(ScrapedJob.run_id == int(task_id)).limit(200).all()
+def list_run_jobs(task_id: str, request: Request, db: Session = Depends(get_db)):
+    # description is only needed for resume matching; it is fetched separately below
+    jobs = (
+        db.query(ScrapedJob)
+        .options(load_only(
+            ScrapedJob.id, ScrapedJob.title, ScrapedJob.company, ScrapedJob.url, ScrapedJob.location,
+            ScrapedJob.recruiter_name, ScrapedJob.recruiter_email, ScrapedJob.cover_letter,
+            ScrapedJob.resume_custom, ScrapedJob.metadata_json,
+        ))
+        .filter(ScrapedJob.run_id == int(task_id))
+        .limit(200)
+        .all()
+    )
     # Determine file base path; files are stored under generated_docs/run_<id>
-    import os
     run_dir = os.path.join(os.getcwd(), 'generated_docs', f'run_{task_id}')
     items = []
     base = str(request.base_url).rstrip('/')
-    from app.core.config import settings as _settings
-    supa_enabled = _settings.supabase_storage_enabled
-    bucket_docs = _settings.SUPABASE_STORAGE_BUCKET_DOCS if supa_enabled else None
+    supa_enabled = settings.supabase_storage_enabled
+    bucket_docs = settings.SUPABASE_STORAGE_BUCKET_DOCS if supa_enabled else None
     # Attempt to load resume_text once
     resume_text = None
     try:
         run_obj = db.get(PipelineRun, int(task_id))
         if run_obj and getattr(run_obj, 'metadata_json', None):
-            import json as _json2
-            _meta = _json2.loads(run_obj.metadata_json) or {}
+            _meta = orjson.loads(run_obj.metadata_json) or {}
             resume_text = _meta.get('resume_text')
     except Exception:
         resume_text = None
+    toks_r = _resume_tokens(int(task_id), resume_text) if resume_text else None
+    job_toks: dict[int, frozenset[str]] = {}
+    if toks_r:
+        job_toks = _cached_job_tokens(j.id for j in jobs)
+        missing = [j.id for j in jobs if j.id not in job_toks]
+        if missing:
+            rows = db.query(ScrapedJob.id, ScrapedJob.description).filter(ScrapedJob.id.in_(missing))
+            for jid, desc in rows:
+                if desc:
+                    job_toks[jid] = _job_tokens(jid, desc)
+    # One directory read instead of two stat() calls per job
+    try:
+        local_files = {e.name for e in os.scandir(run_dir)}
+    except OSError:
+        local_files = set()
     for j in jobs:
-        txt_path = os.path.join(run_dir, f'resume_job{j.id}.txt')
-        docx_path = os.path.join(run_dir, f'resume_job{j.id}.docx')
-        txt_url = f"{base}/generated_docs/run_{task_id}/resume_job{j.id}.txt" if os.path.exists(txt_path) else None
-        docx_url = f"{base}/generated_docs/run_{task_id}/resume_job{j.id}.docx" if os.path.exists(docx_path) else None
+        txt_url = f"{base}/generated_docs/run_{task_id}/resume_job{j.id}.txt" if f'resume_job{j.id}.txt' in local_files else None
+        docx_url = f"{base}/generated_docs/run_{task_id}/resume_job{j.id}.docx" if f'resume_job{j.id}.docx' in local_files else None
         # Prefer Supabase URLs when available
         if supa_enabled:
             key_txt = f"runs/{task_id}/resume_job{j.id}.txt"
@@ -456,26 +616,21 @@ async def list_run_jobs(task_id: str, request: Request):
         # Attempt to pull cached recruiter_contacts from metadata_json if present
         try:
             if j.metadata_json:
-                import json as _json
-                meta = _json.loads(j.metadata_json)
+                meta = orjson.loads(j.metadata_json)
                 if isinstance(meta, dict) and isinstance(meta.get('recruiter_contacts'), list):
                     recruiter_contacts = meta.get('recruiter_contacts')[:5]
         except Exception:
             recruiter_contacts = None
         # compute resume match if possible
         resume_match_val = None
-        if resume_text and j.description:
+        if toks_r and j.id in job_toks:
             try:
-                import re
-                toks_r = set(re.findall(r"[a-zA-Z0-9]+", resume_text.lower()))
-                toks_j = set(re.findall(r"[a-zA-Z0-9]+", (j.description or '').lower()))
-                if toks_r and toks_j:
-                    overlap = len(toks_r & toks_j)
-                    denom = min(len(toks_r), len(toks_j)) or 1
-                    resume_match_val = round((overlap/denom)*100, 1)
+                resume_match_val = _resume_match(toks_r, job_toks[j.id])
             except Exception:
                 resume_match_val = None
-        items.append(RunJobItem(
+        # Plain dicts in RunJobItem's shape, returned directly: building and
+        # then re-validating up to 200 models per poll dominated this endpoint
+        items.append(dict(
             id=j.id, title=j.title, company=j.company, url=j.url, location=j.location,
             recruiter_name=j.recruiter_name, recruiter_email=j.recruiter_email,
             recruiter_contacts=recruiter_contacts,
@@ -483,57 +638,50 @@ async def list_run_jobs(task_id: str, request: Request):
             resume_txt_url=txt_url, resume_docx_url=docx_url,
             resume_match=resume_match_val
         ))
-    return items
+    return ORJSONResponse(items)
 
 @router.post("/jobs/{job_id}/enrich", response_model=EnrichJobResponse)
-async def enrich_single_job(job_id: int):
+def enrich_single_job(job_id: int, db: Session = Depends(get_db)):
     """Force Apollo enrichment for a single scraped job (manual test helper)."""
-    db = SessionLocal()
-    try:
-        j = db.get(ScrapedJob, job_id)
-        if not j:
-            raise HTTPException(status_code=404, detail="Job not found")
-        contact = None
-        if settings.APOLLO_API_KEY and j.company and j.title:
-            try:
-                contact = find_recruiter_contact(j.company, j.title)
-            except Exception as e:  # noqa: BLE001
-                contact = None
-        from datetime import datetime as _dt
-        if contact:
-            prev_name = j.recruiter_name
-            if contact.get("name"):
-                j.recruiter_name = contact.get("name")
-            email_val = contact.get("email") or None
-            if email_val:
-                j.recruiter_email = email_val
-            # Cache multiple contacts for UI expansion
-            try:
-                multi = search_recruiter_contacts(j.company, j.title, max_results=5) or []
-            except Exception:
-                multi = []
-            if multi:
-                import json as _json
-                meta = {}
-                if j.metadata_json:
-                    try:
-                        meta = _json.loads(j.metadata_json) or {}
-                    except Exception:
-                        meta = {}
-                meta['recruiter_contacts'] = multi
-                j.metadata_json = _json.dumps(meta)
-            j.enriched_at = _dt.utcnow()
-            db.commit()
-            enriched_flag = bool(j.recruiter_email)
-            import logging as _log
-            _log.info("Manual enrich job=%s name=%s email=%s", j.id, j.recruiter_name, 'SET' if j.recruiter_email else 'MISSING')
-            return EnrichJobResponse(id=j.id, recruiter_name=j.recruiter_name, recruiter_email=j.recruiter_email, enriched=enriched_flag)
-        return EnrichJobResponse(id=j.id, recruiter_name=j.recruiter_name, recruiter_email=j.recruiter_email, enriched=bool(j.recruiter_email))
-    finally:
-        db.close()
+    j = db.get(ScrapedJob, job_id)
+    if not j:
+        raise HTTPException(status_code=404, detail="Job not found")
+    contact = None
+    if settings.APOLLO_API_KEY and j.company and j.title:
+        try:
+            contact = find_recruiter_contact(j.company, j.title)
+        except Exception as e:  # noqa: BLE001
+            contact = None
+    if contact:
+        prev_name = j.recruiter_name
+        if contact.get("name"):
+            j.recruiter_name = contact.get("name")
+        email_val = contact.get("email") or None
+        if email_val:
+            j.recruiter_email = email_val
+        # Cache multiple contacts for UI expansion
+        try:
+            multi = search_recruiter_contacts(j.company, j.title, max_results=5) or []
+        except Exception:
+            multi = []
+        if multi:
+            meta = {}
+            if j.metadata_json:
+                try:
+                    meta = orjson.loads(j.metadata_json) or {}
+                except Exception:
+                    meta = {}
+            meta['recruiter_contacts'] = multi
+            j.metadata_json = orjson.dumps(meta).decode()
+        j.enriched_at = datetime.utcnow()
+        db.commit()
+        enriched_flag = bool(j.recruiter_email)
+        logger.info("Manual enrich job=%s name=%s email=%s", j.id, j.recruiter_name, 'SET' if j.recruiter_email else 'MISSING')
+        return EnrichJobResponse(id=j.id, recruiter_name=j.recruiter_name, recruiter_email=j.recruiter_email, enriched=enriched_flag)
+    return EnrichJobResponse(id=j.id, recruiter_name=j.recruiter_name, recruiter_email=j.recruiter_email, enriched=bool(j.recruiter_email))
 
 @router.post("/runs/{task_id}/enrich", response_model=BulkEnrichResponse)
-async def bulk_enrich(task_id: int, limit: int = 200, force: bool = False, debug: int = 0):
+def bulk_enrich(task_id: int, limit: int = 200, force: bool = False, debug: int = 0, db: Session = Depends(get_db)):
     """Re-run Apollo enrichment for jobs in a run.
 
     Behavior:
@@ -543,171 +691,214 @@ async def bulk_enrich(task_id: int, limit: int = 200, force: bool = False, debug
 
     Debug Mode (?debug=1): returns additional diagnostics: per_reason_job_ids, sample_contacts.
     """
-    db = SessionLocal()
-    try:
-        run = db.get(PipelineRun, int(task_id))
-        if not run:
-            raise HTTPException(status_code=404, detail="Run not found")
-        base_q = db.query(ScrapedJob).filter(ScrapedJob.run_id == run.id)
-        jobs = base_q.limit(limit).all()
-        processed = updated_email = updated_name_only = 0
-        skipped_missing_fields = no_contact = exceptions = 0
-        acted_on: list[int] = []
-        reason_map: dict[str, list[int]] = {"skipped_missing_fields": [], "no_contact": [], "updated_email": [], "updated_name_only": [], "exception": [], "already_enriched": []}
-        sample_contacts: dict[int, dict] = {}
-        from app.services.apollo_enrichment import find_recruiter_contact
-        import logging as _log
-        for j in jobs:
-            if j.recruiter_email and not force:
-                reason_map["already_enriched"].append(j.id)
-                continue
-            # We'll attempt this job
-            if not (settings.APOLLO_API_KEY and j.company and j.title):
-                skipped_missing_fields += 1
-                reason_map["skipped_missing_fields"].append(j.id)
-                continue
-            acted_on.append(j.id)
-            processed += 1
-            try:
-                contact = find_recruiter_contact(j.company, j.title)
-                # Also capture multiple contacts for dashboard expansion (cache in metadata_json)
-                try:
-                    multi = _search_multi_contacts(j.company, j.title, max_results=5) or []
-                except Exception:
-                    multi = []
-                if multi:
-                    import json as _json
-                    meta = {}
-                    if j.metadata_json:
-                        try:
-                            meta = _json.loads(j.metadata_json) or {}
-                        except Exception:
-                            meta = {}
-                    meta['recruiter_contacts'] = multi
-                    j.metadata_json = _json.dumps(meta)
-            except Exception as e:  # noqa: BLE001
-                exceptions += 1
-                reason_map["exception"].append(j.id)
-                _log.info("Bulk enrich exception job=%s: %s", j.id, e)
-                continue
-            if not contact:
-                no_contact += 1
-                reason_map["no_contact"].append(j.id)
-                continue
-            # Capture sample contact for debug purposes
-            if debug:
-                # Redact email partially
-                cpy = dict(contact)
-                em = cpy.get("email")
-                if em and len(em) > 5:
-                    cpy["email"] = em[:2] + "***" + em[-2:]
-                sample_contacts[j.id] = {k: cpy.get(k) for k in ("name", "email", "title") if k in cpy}
-            if contact.get("name"):
-                j.recruiter_name = contact.get("name")
-            if contact.get("email"):
-                j.recruiter_email = contact.get("email")
-                updated_email += 1
-                reason_map["updated_email"].append(j.id)
-            else:
-                updated_name_only += 1
-                reason_map["updated_name_only"].append(j.id)
-        db.commit()
-        debug_blob = None
+    run = db.get(PipelineRun, int(task_id))
+    if not run:
+        raise HTTPException(status_code=404, detail="Run not found")
+    base_q = db.query(ScrapedJob).filter(ScrapedJob.run_id == run.id)
+    jobs = base_q.limit(limit).all()
+    processed = updated_email = updated_name_only = 0
+    skipped_missing_fields = no_contact = exceptions = 0
+    acted_on: list[int] = []
+    reason_map: dict[str, list[int]] = {"skipped_missing_fields": [], "no_contact": [], "updated_email": [], "updated_name_only": [], "exception": [], "already_enriched": []}
+    sample_contacts: dict[int, dict] = {}
+    candidates: list[ScrapedJob] = []
+    for j in jobs:
+        if j.recruiter_email and not force:
+            reason_map["already_enriched"].append(j.id)
+            continue
+        # We'll attempt this job
+        if not (settings.APOLLO_API_KEY and j.company and j.title):
+            skipped_missing_fields += 1
+            reason_map["skipped_missing_fields"].append(j.id)
+            continue
+        acted_on.append(j.id)
+        processed += 1
+        candidates.append(j)
+
+    def _lookup(company: str, title: str):
+        """Apollo calls for one (company, title); runs on a worker thread and never touches the session."""
+        # Multiple contacts for dashboard expansion (cached in metadata_json)
+        try:
+            multi = _search_multi_contacts(company, title, max_results=5) or []
+        except Exception:
+            multi = []
+        # The multi search ranks the same people and only keeps unlocked
+        # emails, so its top hit is the primary contact. The single-contact
+        # search (which can also return a name-only match) is the fallback.
+        contact = multi[0] if multi else find_recruiter_contact(company, title)
+        return contact, multi
+
+    # Apollo results depend only on (company, title): look each pair up once,
+    # overlap the round trips (bounded), then fan the results back out to the
+    # jobs on this thread, in job order
+    with concurrent.futures.ThreadPoolExecutor(max_workers=_APOLLO_CONCURRENCY) as ex:
+        futures = {}
+        for j in candidates:
+            key = (j.company, j.title)
+            if key not in futures:
+                futures[key] = ex.submit(_lookup, *key)
+    # Changed columns per job, written with one bulk UPDATE instead of
+    # per-object change tracking and flushes
+    updates: list[dict] = []
+    now = datetime.utcnow()
+    for j in candidates:
+        row: dict = {"id": j.id}
+        try:
+            contact, multi = futures[(j.company, j.title)].result()
+            if multi:
+                meta = {}
+                if j.metadata_json:
+                    try:
+                        meta = orjson.loads(j.metadata_json) or {}
+                    except Exception:
+                        meta = {}
+                meta['recruiter_contacts'] = multi
+                row["metadata_json"] = orjson.dumps(meta).decode()
+        except Exception as e:  # noqa: BLE001
+            exceptions += 1
+            reason_map["exception"].append(j.id)
+            logger.info("Bulk enrich exception job=%s: %s", j.id, e)
+            continue
+        if not contact:
+            no_contact += 1
+            reason_map["no_contact"].append(j.id)
+            continue
+        # Capture sample contact for debug purposes
         if debug:
-            debug_blob = {
-                "reason_job_ids": {k: v for k, v in reason_map.items() if v},
-                "sample_contacts": sample_contacts,
-                "total_jobs_in_run": base_q.count(),
-                "limit": limit,
-            }
-        return BulkEnrichResponse(
-            run_id=run.id,
-            processed=processed,
-            updated_with_email=updated_email,
-            updated_name_only=updated_name_only,
-            skipped_missing_fields=skipped_missing_fields,
-            no_contact_found=no_contact,
-            exceptions=exceptions,
-            acted_on_job_ids=acted_on,
-            forced=force,
-            debug=debug_blob,
-        )
-    finally:
-        db.close()
+            # Redact email partially
+            cpy = dict(contact)
+            em = cpy.get("email")
+            if em and len(em) > 5:
+                cpy["email"] = em[:2] + "***" + em[-2:]
+            sample_contacts[j.id] = {k: cpy.get(k) for k in ("name", "email", "title") if k in cpy}
+        if contact.get("name"):
+            row["recruiter_name"] = contact.get("name")
+        if contact.get("email"):
+            row["recruiter_email"] = contact.get("email")
+            updated_email += 1
+            reason_map["updated_email"].append(j.id)
+        else:
+            updated_name_only += 1
+            reason_map["updated_name_only"].append(j.id)
+        row["enriched_at"] = now
+        updates.append(row)
+    if updates:
+        db.bulk_update_mappings(ScrapedJob, updates)
+        db.commit()
+    debug_blob = None
+    if debug:
+        debug_blob = {
+            "reason_job_ids": {k: v for k, v in reason_map.items() if v},
+            "sample_contacts": sample_contacts,
+            "total_jobs_in_run": _run_job_count(db, run.id),
+            "limit": limit,
+        }
+    return BulkEnrichResponse(
+        run_id=run.id,
+        processed=processed,
+        updated_with_email=updated_email,
+        updated_name_only=updated_name_only,
+        skipped_missing_fields=skipped_missing_fields,
+        no_contact_found=no_contact,
+        exceptions=exceptions,
+        acted_on_job_ids=acted_on,
+        forced=force,
+        debug=debug_blob,
+    )
 
 @router.get("/runs/{task_id}/recruiters", response_model=List[JobRecruiterContact])
-async def list_run_recruiters(task_id: str, max_per_job: int = 3):
+def list_run_recruiters(task_id: str, max_per_job: int = 3, db: Session = Depends(get_db)):
     """Return real Apollo recruiter contacts per job (live lookup, no fallbacks)."""
-    db = SessionLocal()
-    jobs = db.query(ScrapedJob).filter(ScrapedJob.run_id == int(task_id)).limit(60).all()
-    out: list[JobRecruiterContact] = []
-    for j in jobs:
-        if not j.company or not j.title:
-            out.append(JobRecruiterContact(job_id=j.id, contacts=[]))
-            continue
+    jobs = (
+        db.query(ScrapedJob)
+        .options(load_only(ScrapedJob.id, ScrapedJob.company, ScrapedJob.title))
+        .filter(ScrapedJob.run_id == int(task_id))
+        .limit(60)
+        .all()
+    )
+
+    def _lookup(company: str, title: str) -> list[dict]:
         try:
-            contacts = search_recruiter_contacts(j.company, j.title, max_results=max_per_job) or []
+            return search_recruiter_contacts(company, title, max_results=max_per_job) or []
         except Exception:
-            contacts = []
+            return []
+
+    # Same bounded fan-out as bulk_enrich: one Apollo search per distinct
+    # (company, title), overlapped across a small worker pool
+    with concurrent.futures.ThreadPoolExecutor(max_workers=_APOLLO_CONCURRENCY) as ex:
+        futures = {}
+        for j in jobs:
+            key = (j.company, j.title)
+            if j.company and j.title and key not in futures:
+                futures[key] = ex.submit(_lookup, *key)
+    out: list[JobRecruiterContact] = []
+    for j in jobs:
+        fut = futures.get((j.company, j.title))
+        contacts = list(fut.result()) if fut else []
         out.append(JobRecruiterContact(job_id=j.id, contacts=contacts))
     return out
 
 @router.get("/runs/{task_id}/coverletters", response_model=List[CoverLetterDoc])
 async def list_cover_letter_docs(task_id: str):
-    import os
     run_dir = os.path.abspath(os.path.join(os.getcwd(), 'generated_docs', f'run_{task_id}'))
-    out: list[CoverLetterDoc] = []
-    from app.core.config import settings as _settings
-    supa_enabled = _settings.supabase_storage_enabled
+    # docx filename -> size; storage entries win, local files fill the gaps,
+    # so a document mirrored to both is listed once
+    by_name: dict[str, int] = {}
+    supa_enabled = settings.supabase_storage_enabled
     if supa_enabled:
         try:
-            entries = list_prefix(_settings.SUPABASE_STORAGE_BUCKET_DOCS, f"runs/{task_id}")
+            entries = list_prefix(settings.SUPABASE_STORAGE_BUCKET_DOCS, f"runs/{task_id}")
             for ent in entries:
                 name = ent.get("name") or ""
                 if name.endswith('.docx') and name.startswith('cover_letter_job'):
-                    try:
-                        job_id = int(name.split('job')[1].split('.')[0])
-                    except Exception:
-                        continue
-                    size = int(ent.get("metadata", {}).get("size", ent.get("size", 0)) or 0)
-                    out.append(CoverLetterDoc(job_id=job_id, docx_filename=name, size=size))
+                    by_name[name] = int(ent.get("metadata", {}).get("size", ent.get("size", 0)) or 0)
         except Exception:
             pass
-    if os.path.isdir(run_dir):
-        for name in os.listdir(run_dir):
-            if name.endswith('.docx') and name.startswith('cover_letter_job'):
-                try:
-                    job_id = int(name.split('job')[1].split('.')[0])
-                except Exception:
-                    continue
-                full = os.path.join(run_dir, name)
-                try:
-                    size = os.path.getsize(full)
-                except Exception:
-                    size = 0
-                out.append(CoverLetterDoc(job_id=job_id, docx_filename=name, size=size))
+    try:
+        with os.scandir(run_dir) as it:
+            for e in it:
+                if e.name.endswith('.docx') and e.name.startswith('cover_letter_job') and e.name not in by_name:
+                    try:
+                        by_name[e.name] = e.stat().st_size
+                    except OSError:
+                        by_name[e.name] = 0
+    except OSError:
+        pass
+    out: list[CoverLetterDoc] = []
+    for name, size in by_name.items():
+        try:
+            job_id = int(name.split('job')[1].split('.')[0])
+        except Exception:
+            continue
+        out.append(CoverLetterDoc(job_id=job_id, docx_filename=name, size=size))
     return sorted(out, key=lambda x: x.job_id)
 
 @router.get("/runs/{task_id}/coverletters/{filename}")
 async def download_cover_letter_doc(task_id: str, filename: str):
-    import os
-    safe = ''.join(c for c in filename if c.isalnum() or c in ('_','-','.'))
+    safe = _UNSAFE_FILENAME_RE.sub('', filename)
     if '..' in safe:
         raise HTTPException(status_code=400, detail='invalid filename')
-    from app.core.config import settings as _settings
-    if _settings.supabase_storage_enabled:
+    if settings.supabase_storage_enabled:
         # Redirect to signed/public URL
-        bucket = _settings.SUPABASE_STORAGE_BUCKET_DOCS
+        bucket = settings.SUPABASE_STORAGE_BUCKET_DOCS
         key = f"runs/{task_id}/{safe}"
         url = get_public_url(bucket, key) or create_signed_url(bucket, key, 3600)
         if url:
-            from fastapi.responses import RedirectResponse as _Redirect
-            return _Redirect(url=url, status_code=307)
-    run_dir = os.path.abspath(os.path.join(os.getcwd(), 'generated_docs', f'run_{task_id}'))
-    path = os.path.join(run_dir, safe)
-    if not os.path.isfile(path):
+            return RedirectResponse(url=url, status_code=307)
+    run_dir = os.path.realpath(os.path.join(os.getcwd(), 'generated_docs', f'run_{task_id}'))
+    # Resolve symlinks before checking containment, so a link inside the run
+    # directory cannot point the download elsewhere
+    path = os.path.realpath(os.path.join(run_dir, safe))
+    if os.path.commonpath([run_dir, path]) != run_dir:
+        raise HTTPException(status_code=400, detail='invalid filename')
+    try:
+        st = os.stat(path)
+    except OSError:
+        st = None
+    if st is None or not stat.S_ISREG(st.st_mode):
         raise HTTPException(status_code=404, detail='file not found')
-    return FileResponse(path, media_type='application/vnd.openxmlformats-officedocument.wordprocessingml.document', filename=safe)
+    # Pass the stat we already have so FileResponse does not stat again
+    return FileResponse(path, media_type='application/vnd.openxmlformats-officedocument.wordprocessingml.document', filename=safe, stat_result=st)
 
 
 class ResumeUpload(BaseModel):
@@ -715,27 +906,24 @@ class ResumeUpload(BaseModel):
     resume_text: str
 
 @router.post("/runs/{task_id}/resume")
-async def upload_resume(task_id: str, payload: ResumeUpload):
+def upload_resume(task_id: str, payload: ResumeUpload, db: Session = Depends(get_db)):
     if int(task_id) != payload.run_id:
         raise HTTPException(status_code=400, detail="run_id mismatch")
     # Placeholder: store resume text in run.metadata_json for future personalization
-    db = SessionLocal()
     run = db.get(PipelineRun, int(task_id))
     if not run:
         raise HTTPException(status_code=404, detail="Run not found")
-    meta = (run.metadata_json and __import__('json').loads(run.metadata_json)) or {}
+    meta = (run.metadata_json and orjson.loads(run.metadata_json)) or {}
     meta['resume_text'] = payload.resume_text[:20000]
-    import json as _json
-    run.metadata_json = _json.dumps(meta)
+    run.metadata_json = orjson.dumps(meta).decode()
     db.add(run)
     db.commit()
     return {"ok": True}
 
 
 @router.post("/runs/{task_id}/resume/upload")
-async def upload_resume_file(task_id: str, file: UploadFile = File(...)):
+async def upload_resume_file(task_id: str, file: UploadFile = File(...), db: Session = Depends(get_db)):
     run_id = int(task_id)
-    db = SessionLocal()
     run = db.get(PipelineRun, run_id)
     if not run:
         raise HTTPException(status_code=404, detail="Run not found")
@@ -744,15 +932,19 @@ async def upload_resume_file(task_id: str, file: UploadFile = File(...)):
     os.makedirs(base_dir, exist_ok=True)
     # Sanitize filename
     orig = file.filename or 'resume'
-    safe = ''.join(c for c in orig if c.isalnum() or c in ('-', '_', '.')) or 'resume.txt'
+    safe = _UNSAFE_FILENAME_RE.sub('', orig) or 'resume.txt'
     stored_name = f"run{run_id}_{safe}"
     stored_path = os.path.join(base_dir, stored_name)
-    # Write file to disk
-    with open(stored_path, 'wb') as out:
-        shutil.copyfileobj(file.file, out)
-    # Hash
+    # Write file to disk, hashing as it streams through; the bytes are only
+    # kept in memory when they also have to be mirrored to storage
     h = hashlib.sha256()
-    with open(stored_path, 'rb') as f: h.update(f.read())
+    mirror: list[bytes] | None = [] if settings.supabase_storage_enabled else None
+    async with aiofiles.open(stored_path, 'wb') as out:
+        while chunk := await file.read(1 << 20):
+            h.update(chunk)
+            await out.write(chunk)
+            if mirror is not None:
+                mirror.append(chunk)
     file_hash = h.hexdigest()
     # Extract text
     text = extract_resume_text(stored_path)
@@ -762,13 +954,11 @@ async def upload_resume_file(task_id: str, file: UploadFile = File(...)):
     if settings.supabase_storage_enabled:
         try:
             key = f"runs/{run_id}/uploads/{stored_name}"
-            with open(stored_path, 'rb') as fh:
-                data = fh.read()
-            upload_bytes(settings.SUPABASE_STORAGE_BUCKET_UPLOADS, key, data, content_type=file.content_type or None, upsert=True)
+            upload_bytes(settings.SUPABASE_STORAGE_BUCKET_UPLOADS, key, b''.join(mirror or ()), content_type=file.content_type or None, upsert=True)
         except Exception:
             pass
     # Persist into metadata_json
-    meta = (run.metadata_json and json.loads(run.metadata_json)) or {}
+    meta = (run.metadata_json and orjson.loads(run.metadata_json)) or {}
     meta['resume_file'] = {
         'original': orig,
         'stored': stored_name,
@@ -776,7 +966,7 @@ async def upload_resume_file(task_id: str, file: UploadFile = File(...)):
         'chars': len(text)
     }
     meta['resume_text'] = text[:20000]
-    run.metadata_json = json.dumps(meta)
+    run.metadata_json = orjson.dumps(meta).decode()
     db.add(run)
     db.commit()
     return {"ok": True, "stored": stored_name, "length": len(text)}
@@ -794,13 +984,12 @@ class BulkResumeGenerateRequest(BaseModel):
     force: bool = True  # overwrite existing if True
 
 @router.post("/runs/{task_id}/resumes/generate")
-async def bulk_generate_resumes(task_id: str, payload: BulkResumeGenerateRequest):
+def bulk_generate_resumes(task_id: str, payload: BulkResumeGenerateRequest, db: Session = Depends(get_db)):
     """Generate (or regenerate) resume_custom for jobs in a run.
 
     Uses unified resume_service: uploaded resume > sample_resume.txt > placeholder.
     If force=False, existing resume_custom values are left untouched.
     """
-    db = SessionLocal()
     try:
         task_int = int(task_id)
     except Exception:  # noqa: BLE001
@@ -808,153 +997,213 @@ async def bulk_generate_resumes(task_id: str, payload: BulkResumeGenerateRequest
     run = db.get(PipelineRun, task_int)
     if not run:
         raise HTTPException(status_code=404, detail="Run not found")
-    base_q = db.query(ScrapedJob).filter(ScrapedJob.run_id == run.id)
-    jobs = base_q.all() if payload.all else base_q.limit(max(payload.limit, 1) if payload.limit else 50).all()
+    limit = None if payload.all else (max(payload.limit, 1) if payload.limit else 50)
     from app.services.resume_service import generate_resumes_for_jobs
-    processed, skipped = generate_resumes_for_jobs(run, jobs, force=payload.force)
-    for j in jobs:
-        db.add(j)
-    db.commit()
-    # Write resumes to disk (text + docx) similar to pipeline behavior
-    import os
     from coverletter_convertion import convert_cover_letter
     def _project_root() -> str:
         return os.path.abspath(os.getcwd())
     output_dir = os.path.join(_project_root(), 'generated_docs', f'run_{run.id}')
     os.makedirs(output_dir, exist_ok=True)
-    written = 0
-    for j in jobs:
-        if not j.resume_custom:
-            continue
-        resume_txt_path = os.path.join(output_dir, f"resume_job{j.id}.txt")
-        resume_docx_path = os.path.join(output_dir, f"resume_job{j.id}.docx")
-        try:
-            with open(resume_txt_path, 'w', encoding='utf-8') as f:
-                f.write(j.resume_custom)
+    processed = skipped = touched = written = 0
+    updates: list[dict] = []
+    # (job id, txt path, docx path, txt bytes) for every text file written;
+    # the bytes are only kept when they also have to be mirrored to storage
+    mirror = settings.supabase_storage_enabled
+    outputs: list[tuple[int, str, str, bytes | None]] = []
+    # Stream the run's jobs a batch at a time; only each batch's ORM objects
+    # are alive at once
+    for jobs in _run_job_partitions(db, run.id, limit):
+        # Detach the jobs so the generator's attribute writes are not tracked
+        # (and flushed row by row); changed rows are written in one bulk UPDATE.
+        for j in jobs:
+            db.expunge(j)
+        touched += len(jobs)
+        before = {j.id: j.resume_custom for j in jobs}
+        batch_processed, batch_skipped = generate_resumes_for_jobs(run, jobs, force=payload.force)
+        processed += batch_processed
+        skipped += batch_skipped
+        updates.extend({"id": j.id, "resume_custom": j.resume_custom} for j in jobs if j.resume_custom != before[j.id])
+        # Write resumes to disk (text + docx) similar to pipeline behavior
+        for j in jobs:
+            if not j.resume_custom:
+                continue
+            resume_txt_path = os.path.join(output_dir, f"resume_job{j.id}.txt")
+            resume_docx_path = os.path.join(output_dir, f"resume_job{j.id}.docx")
             try:
-                convert_cover_letter(resume_txt_path, resume_docx_path)
+                txt_bytes = j.resume_custom.encode('utf-8')
+                with open(resume_txt_path, 'wb') as f:
+                    f.write(txt_bytes)
+                written += 1
+                outputs.append((j.id, resume_txt_path, resume_docx_path, txt_bytes if mirror else None))
+            except Exception:
+                continue
+    if updates:
+        db.bulk_update_mappings(ScrapedJob, updates)
+        db.commit()
+    # DOCX conversion is pure-Python (GIL-bound) work: spread it over processes
+    # when there is more than one document to build
+    if len(outputs) > 1:
+        pool = _docx_pool()
+        concurrent.futures.wait([pool.submit(convert_cover_letter, txt, docx) for _, txt, docx, _ in outputs])
+    else:
+        for _, txt, docx, _ in outputs:
+            try:
+                convert_cover_letter(txt, docx)
             except Exception:
                 pass
-            written += 1
-            # Mirror to Supabase Storage
-            if settings.supabase_storage_enabled:
-                try:
-                    key_txt = f"runs/{task_id}/resume_job{j.id}.txt"
-                    key_docx = f"runs/{task_id}/resume_job{j.id}.docx"
-                    with open(resume_txt_path, 'rb') as fh:
-                        upload_bytes(settings.SUPABASE_STORAGE_BUCKET_DOCS, key_txt, fh.read(), content_type='text/plain', upsert=True)
-                    if os.path.exists(resume_docx_path):
-                        with open(resume_docx_path, 'rb') as fh:
-                            upload_bytes(settings.SUPABASE_STORAGE_BUCKET_DOCS, key_docx, fh.read(), content_type='application/vnd.openxmlformats-officedocument.wordprocessingml.document', upsert=True)
-                except Exception:
-                    pass
-        except Exception:
-            continue
-    return {"ok": True, "processed": processed, "skipped": skipped, "files_written": written, "total_in_run": base_q.count(), "touched": len(jobs), "force": payload.force}
+    # (key, bytes, content type) to mirror to Supabase Storage
+    uploads: list[tuple[str, bytes, str]] = []
+    if mirror:
+        for job_id, _, docx, txt_bytes in outputs:
+            uploads.append((f"runs/{task_id}/resume_job{job_id}.txt", txt_bytes, 'text/plain'))
+            try:
+                with open(docx, 'rb') as fh:
+                    uploads.append((f"runs/{task_id}/resume_job{job_id}.docx", fh.read(), _DOCX_CONTENT_TYPE))
+            except OSError:
+                pass
+    if uploads:
+        def _upload(item: tuple[str, bytes, str]) -> None:
+            key, data, content_type = item
+            try:
+                upload_bytes(settings.SUPABASE_STORAGE_BUCKET_DOCS, key, data, content_type=content_type, upsert=True)
+            except Exception:
+                pass
+        # Independent uploads: overlap the round trips on a small pool
+        with concurrent.futures.ThreadPoolExecutor(max_workers=_STORAGE_UPLOAD_CONCURRENCY) as ex:
+            list(ex.map(_upload, uploads))
+    return {"ok": True, "processed": processed, "skipped": skipped, "files_written": written, "total_in_run": _run_job_count(db, run.id), "touched": touched, "force": payload.force}
 
 @router.post("/runs/{task_id}/generate")
-async def generate_docs(task_id: str, payload: GenerateRequest):
-    db = SessionLocal()
+async def generate_docs(task_id: str, payload: GenerateRequest, db: Session = Depends(get_db)):
     run = db.get(PipelineRun, int(task_id))
     if not run:
         raise HTTPException(status_code=404, detail="Run not found")
-    import json as _json
-    meta = (run.metadata_json and _json.loads(run.metadata_json)) or {}
+    meta = (run.metadata_json and orjson.loads(run.metadata_json)) or {}
     resume_text = meta.get('resume_text')
     used_placeholder = False
     if not resume_text:
         resume_text = "PLACEHOLDER RESUME TEXT - upload a real resume for better tailoring."  # fallback
         used_placeholder = True
-    base_q = db.query(ScrapedJob).filter(ScrapedJob.run_id == run.id)
-    total_jobs = base_q.count()
+    total_jobs = _run_job_count(db, run.id)
     # Always operate on either all jobs (if flag) or limited subset, but we'll regenerate regardless of existing docs.
-    if payload.all:
-        jobs = base_q.all()
-    else:
-        jobs = base_q.limit(payload.limit).all()
+    limit = None if payload.all else payload.limit
+    processed = 0
     generated = 0
     regenerated = 0
+    updates: list[dict] = []
     openai_key = settings.OPENAI_API_KEY or ''
     openai_timeout = 8  # seconds per job for analysis/generation helpers
 
-    def call_with_timeout(func, *args, timeout: int, default=None, **kwargs):
+    loop = asyncio.get_running_loop()
+    sem = asyncio.Semaphore(_OPENAI_CONCURRENCY)
+
+    def release_slot(_fut) -> None:
+        try:
+            loop.call_soon_threadsafe(sem.release)
+        except RuntimeError:
+            pass  # request's loop already closed
+
+    async def call_with_timeout(func, *args, timeout: int, default=None):
         if not openai_key:
             return default
+        # A slot is held until the worker thread really finishes, not just
+        # until wait_for gives up on it: a timed-out call still occupies a
+        # thread, so it must keep counting against the limit
+        await sem.acquire()
+        cf = _OPENAI_POOL.submit(func, *args)
+        cf.add_done_callback(release_slot)
         try:
-            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as ex:
-                fut = ex.submit(func, *args, **kwargs)
-                return fut.result(timeout=timeout)
+            return await asyncio.wait_for(asyncio.wrap_future(cf), timeout)
         except Exception:
             return default
-    for j in jobs:
-        try:
-            # Always regenerate cover letter & resume customization (ignore previous state)
-            already_had = bool(j.cover_letter or j.resume_custom)
-
-            # Handle missing descriptions with a synthetic JD
-            raw_desc = j.description or ''
-            jd_plain = clean_html(raw_desc) if raw_desc else f"{j.title} role at {j.company or 'the company'}"
-            analysis = {}
-            if openai_key:
-                analysis = call_with_timeout(
-                    analyze_job_match_with_openai,
-                    resume_text,
-                    jd_plain,
-                    j.title,
-                    j.company or '',
-                    str(j.id),
-                    openai_key,
-                    timeout=openai_timeout,
-                    default={},
-                ) or {}
-            optimized_resume = resume_text
-            if openai_key and analysis:
-                optimized_resume = call_with_timeout(
-                    generate_ats_optimized_resume_with_analysis,
-                    resume_text,
-                    analysis,
-                    openai_key,
-                    timeout=openai_timeout,
-                    default=resume_text,
-                ) or resume_text
-            cover_letter = None
-            if openai_key:
-                cover_letter = call_with_timeout(
-                    generate_optimized_cover_letter,
-                    j.title,
-                    j.company or '',
-                    j.recruiter_name or 'Hiring Manager',
-                    jd_plain,
-                    resume_text,
-                    openai_key,
-                    timeout=openai_timeout,
-                    default=None,
-                )
-            if not cover_letter:
-                # Deterministic fallback when OpenAI key missing or timeout
-                snippet = jd_plain[:260].rstrip()
-                cover_letter = (
-                    f"Dear {j.recruiter_name or 'Hiring Manager'},\n\n"
-                    f"I'm writing to express strong interest in the {j.title} role at {j.company or 'your company'}. "
-                    f"My background aligns with the position requirements and I'd welcome the opportunity to contribute.\n\n"
-                    f"Role Focus (excerpt): {snippet}\n\n"
-                    "Thank you for your time and consideration.\n\nBest Regards,\nCandidate"
-                )
-            j.cover_letter = cover_letter[:20000]
-            j.resume_custom = (optimized_resume or '')[:20000]
+
+    async def process_job(j: ScrapedJob):
+        # A job's three OpenAI steps stay sequential (each feeds the next);
+        # jobs themselves run concurrently, bounded per OpenAI call by the semaphore
+        # Always regenerate cover letter & resume customization (ignore previous state)
+        already_had = bool(j.cover_letter or j.resume_custom)
+
+        # Handle missing descriptions with a synthetic JD
+        raw_desc = j.description or ''
+        jd_plain = clean_html(raw_desc) if raw_desc else f"{j.title} role at {j.company or 'the company'}"
+        analysis = {}
+        if openai_key:
+            analysis = await call_with_timeout(
+                analyze_job_match_with_openai,
+                resume_text,
+                jd_plain,
+                j.title,
+                j.company or '',
+                str(j.id),
+                openai_key,
+                timeout=openai_timeout,
+                default={},
+            ) or {}
+        optimized_resume = resume_text
+        if openai_key and analysis:
+            optimized_resume = await call_with_timeout(
+                generate_ats_optimized_resume_with_analysis,
+                resume_text,
+                analysis,
+                openai_key,
+                timeout=openai_timeout,
+                default=resume_text,
+            ) or resume_text
+        cover_letter = None
+        if openai_key:
+            cover_letter = await call_with_timeout(
+                generate_optimized_cover_letter,
+                j.title,
+                j.company or '',
+                j.recruiter_name or 'Hiring Manager',
+                jd_plain,
+                resume_text,
+                openai_key,
+                timeout=openai_timeout,
+                default=None,
+            )
+        if not cover_letter:
+            # Deterministic fallback when OpenAI key missing or timeout
+            snippet = jd_plain[:260].rstrip()
+            cover_letter = (
+                f"Dear {j.recruiter_name or 'Hiring Manager'},\n\n"
+                f"I'm writing to express strong interest in the {j.title} role at {j.company or 'your company'}. "
+                f"My background aligns with the position requirements and I'd welcome the opportunity to contribute.\n\n"
+                f"Role Focus (excerpt): {snippet}\n\n"
+                "Thank you for your time and consideration.\n\nBest Regards,\nCandidate"
+            )
+        row = {
+            "id": j.id,
+            "cover_letter": cover_letter[:20000],
+            "resume_custom": (optimized_resume or '')[:20000],
+        }
+        return row, already_had
+
+    # Fetch a batch, generate for it, drop it, fetch the next
+    for jobs in _run_job_partitions(db, run.id, limit):
+        processed += len(jobs)
+        results = await asyncio.gather(*(process_job(j) for j in jobs), return_exceptions=True)
+        for j in jobs:
+            db.expunge(j)
+        for res in results:
+            if isinstance(res, BaseException):
+                continue
+            row, already_had = res
+            updates.append(row)
             if already_had:
                 regenerated += 1
             else:
                 generated += 1
-        except Exception:  # noqa: BLE001
-            continue
-    db.commit()
+    # One bulk UPDATE for every generated row instead of a per-object flush
+    if updates:
+        db.bulk_update_mappings(ScrapedJob, updates)
+        db.commit()
     return {
         "ok": True,
         "generated": generated,
         "regenerated": regenerated,
         "placeholder": used_placeholder,
-        "processed": len(jobs),
+        "processed": processed,
         "total_jobs": total_jobs,
     }
 
@@ -965,10 +1214,9 @@ class SendRequest(BaseModel):
     force: bool = False  # future use: send even if missing recruiter_email (skips now)
 
 @router.post("/runs/{task_id}/send")
-async def send_emails(task_id: str, payload: SendRequest):
+def send_emails(task_id: str, payload: SendRequest, background_tasks: BackgroundTasks, db: Session = Depends(get_db)):
     if not settings.SENDGRID_API_KEY:
         raise HTTPException(status_code=400, detail="SENDGRID_API_KEY not configured")
-    db = SessionLocal()
     run = db.get(PipelineRun, int(task_id))
     if not run:
         raise HTTPException(status_code=404, detail="Run not found")
@@ -978,8 +1226,8 @@ async def send_emails(task_id: str, payload: SendRequest):
     tmpl_path = os.path.join(os.getcwd(), 'email_template.json')
     if os.path.exists(tmpl_path):
         try:
-            with open(tmpl_path, 'r', encoding='utf-8') as f:
-                _tmpl_data = json.load(f)
+            with open(tmpl_path, 'rb') as f:
+                _tmpl_data = orjson.loads(f.read())
             if isinstance(_tmpl_data, list) and _tmpl_data:
                 first = _tmpl_data[0]
                 if isinstance(first, dict):
@@ -987,9 +1235,26 @@ async def send_emails(task_id: str, payload: SendRequest):
                     template_html = first.get('html') or first.get('body') or None
         except Exception:  # noqa: BLE001
             pass  # Non-fatal
-
-    # Fetch all jobs for the run to aggregate recruiter contacts.
-    jobs = db.query(ScrapedJob).filter(ScrapedJob.run_id == run.id).all()
+    # crude html -> text, done once here rather than for every recipient
+    template_text = (_HTML_TAG_RE.sub('', template_html).strip() or template_html) if template_html else None
+
+    # Fetch all jobs for the run to aggregate recruiter contacts. Only the
+    # columns the outbox needs, as plain rows (no ORM objects to build/track).
+    jobs = (
+        db.query(ScrapedJob)
+        .filter(ScrapedJob.run_id == run.id)
+        .with_entities(
+            ScrapedJob.id,
+            ScrapedJob.title,
+            ScrapedJob.company,
+            ScrapedJob.recruiter_email,
+            ScrapedJob.recruiter_name,
+            ScrapedJob.cover_letter,
+            ScrapedJob.resume_custom,
+            ScrapedJob.metadata_json,
+        )
+        .all()
+    )
     total_jobs = len(jobs)
     sent = 0  # successful sends (or dry-run counted as success)
     failures = 0
@@ -999,9 +1264,10 @@ async def send_emails(task_id: str, payload: SendRequest):
     # Cap across ALL individual emails (not jobs)
     max_total_emails = max(0, payload.max_emails)
 
-    import re, json as _json
+    # Build the outbox first (respecting the global cap), then deliver
+    outbox: list[tuple[int, str, str, str, str]] = []
     for j in jobs:
-        if max_total_emails and sent + failures >= max_total_emails:
+        if max_total_emails and len(outbox) >= max_total_emails:
             break  # reached overall limit
         # Build set of email addresses: primary recruiter_email + recruiter_contacts entries
         emails_set: list[str] = []
@@ -1010,7 +1276,7 @@ async def send_emails(task_id: str, payload: SendRequest):
         # Extract recruiter_contacts from per-job metadata_json (NOT run metadata)
         job_meta = None
         try:
-            job_meta = j.metadata_json and _json.loads(j.metadata_json)
+            job_meta = j.metadata_json and orjson.loads(j.metadata_json)
         except Exception:  # noqa: BLE001
             job_meta = None
         if isinstance(job_meta, dict) and isinstance(job_meta.get('recruiter_contacts'), list):
@@ -1022,62 +1288,86 @@ async def send_emails(task_id: str, payload: SendRequest):
         if not emails_set:
             skipped += 1
             continue
+        # Build subject/body
+        subject = template_subject or f"Application: {j.title} - {j.company or ''}"[:120]
+        # Use existing personalized cover letter else template_html (stripped to text) else fallback.
+        body_plain = j.cover_letter or template_text
+        if not body_plain:
+            body_plain = f"Dear Recruiter,\n\nI'm interested in the {j.title} role at {j.company or 'your company'}.\nBest,\nCandidate"
+        resume_part = (j.resume_custom or '')[:5000]
         # For each email send separately (respecting global max)
         for em in emails_set:
-            if max_total_emails and sent + failures >= max_total_emails:
+            if max_total_emails and len(outbox) >= max_total_emails:
                 break
-            try:
-                # Build subject/body
-                subject = template_subject or f"Application: {j.title} - {j.company or ''}"[:120]
-                # Use existing personalized cover letter else template_html (stripped to text) else fallback.
-                body_plain = j.cover_letter or None
-                if not body_plain and template_html:
-                    # crude html -> text
-                    body_plain = re.sub('<[^<]+?>', '', template_html).strip() or template_html
-                if not body_plain:
-                    body_plain = f"Dear Recruiter,\n\nI'm interested in the {j.title} role at {j.company or 'your company'}.\nBest,\nCandidate"
-                resume_part = (j.resume_custom or '')[:5000]
-                send_email_via_sendgrid(
-                    settings.SENDGRID_API_KEY,
-                    em,
-                    subject,
-                    body_plain,
-                    resume_part,
-                    dry_run=payload.dry_run,
-                )
-                status = 'sent' if not payload.dry_run else 'dry-run'
-                events.append({
-                    'job_id': j.id,
-                    'email': em,
-                    'subject': subject,
-                    'dry_run': payload.dry_run,
-                    'status': status,
-                })
-                _record_tracked_email(em, subject, status)
-                sent += 1 if status == 'sent' or status == 'dry-run' else 0
-                unique_recipients_processed += 1
-            except Exception as e:  # noqa: BLE001
-                failures += 1
-                events.append({
-                    'job_id': j.id,
-                    'email': em,
-                    'subject': subject if 'subject' in locals() else None,
-                    'dry_run': payload.dry_run,
-                    'status': 'error',
-                    'error': str(e)[:160],
-                })
-                _record_tracked_email(em, subject if 'subject' in locals() else 'unknown', 'error')
+            outbox.append((j.id, em, subject, body_plain, resume_part))
+
+    def _deliver(item: tuple[int, str, str, str, str]) -> Exception | None:
+        _job_id, em, subject, body_plain, resume_part = item
+        try:
+            send_email_via_sendgrid(
+                settings.SENDGRID_API_KEY,
+                em,
+                subject,
+                body_plain,
+                resume_part,
+                dry_run=payload.dry_run,
+            )
+        except Exception as e:  # noqa: BLE001
+            return e
+        return None
+
+    # Real sends are independent HTTP round trips: overlap them on a small
+    # pool. Dry runs do no I/O and stay inline.
+    if payload.dry_run:
+        errors = [_deliver(item) for item in outbox]
+    else:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=_SENDGRID_CONCURRENCY) as ex:
+            errors = list(ex.map(_deliver, outbox))
+
+    for (job_id, em, subject, _body, _resume), err in zip(outbox, errors):
+        if err is None:
+            status = 'sent' if not payload.dry_run else 'dry-run'
+            events.append({
+                'job_id': job_id,
+                'email': em,
+                'subject': subject,
+                'dry_run': payload.dry_run,
+                'status': status,
+            })
+            # Tracking rows are written after the response is sent
+            background_tasks.add_task(_record_tracked_email, em, subject, status)
+            sent += 1
+            unique_recipients_processed += 1
+        else:
+            failures += 1
+            events.append({
+                'job_id': job_id,
+                'email': em,
+                'subject': subject,
+                'dry_run': payload.dry_run,
+                'status': 'error',
+                'error': str(err)[:160],
+            })
+            background_tasks.add_task(_record_tracked_email, em, subject, 'error')
 
     # Update run counts (count emails, not jobs)
     counts = run.counts or {}
     counts['emails'] = (counts.get('emails') or 0) + sent
     run.counts = counts
-    # Append events to run metadata log
-    run_meta = (run.metadata_json and _json.loads(run.metadata_json)) or {}
-    run_log = run_meta.get('email_events') or []
-    run_log.extend(events)
-    run_meta['email_events'] = run_log[-200:]
-    run.metadata_json = _json.dumps(run_meta)
+    # Append events to the run's email log (rows, not a blob rewritten per send)
+    if events:
+        db.bulk_insert_mappings(RunEmailEvent, [
+            {
+                'run_id': run.id,
+                'job_id': e['job_id'],
+                'email': e['email'],
+                'subject': e['subject'],
+                'dry_run': e['dry_run'],
+                'status': e['status'],
+                'error': e.get('error'),
+            }
+            for e in events
+        ])
     db.add(run)
     db.commit()
     return {
@@ -1100,13 +1390,21 @@ class EmailEvent(BaseModel):
 
 
 @router.get("/runs/{task_id}/emails", response_model=List[EmailEvent])
-async def list_email_events(task_id: str):
-    db = SessionLocal()
+def list_email_events(task_id: str, db: Session = Depends(get_db)):
     run = db.get(PipelineRun, int(task_id))
     if not run:
         raise HTTPException(status_code=404, detail="Run not found")
-    import json as _json
-    meta = (run.metadata_json and _json.loads(run.metadata_json)) or {}
+    rows = (
+        db.query(RunEmailEvent.job_id, RunEmailEvent.email, RunEmailEvent.subject, RunEmailEvent.dry_run)
+        .filter(RunEmailEvent.run_id == run.id)
+        .order_by(RunEmailEvent.id.desc())
+        .limit(200)
+        .all()
+    )
+    if rows:
+        return [EmailEvent(job_id=r.job_id, email=r.email, subject=r.subject, dry_run=r.dry_run) for r in reversed(rows)]
+    # Runs that sent before the email log table existed kept it in metadata_json
+    meta = (run.metadata_json and orjson.loads(run.metadata_json)) or {}
     return meta.get('email_events') or []
 
 
@@ -1120,8 +1418,7 @@ class RunSummary(BaseModel):
 
 
 @router.get("/runs", response_model=List[RunSummary])
-async def list_runs(limit: int = 20):
-    db = SessionLocal()
+def list_runs(limit: int = 20, db: Session = Depends(get_db)):
     runs = db.query(PipelineRun).order_by(PipelineRun.id.desc()).limit(limit).all()
     out = []
     for r in runs:
@@ -1153,16 +1450,18 @@ class TrackedEvent(BaseModel):
     timestamp: int
 
 @router.get("/emails/tracked", response_model=List[TrackedMessage])
-async def list_tracked_emails(limit: int = 100):
-    # Use writable conn to auto-create schema if missing and avoid 500s with legacy DBs
-    conn = _get_events_conn_writable()
-    if not conn:
-        return []
-    try:
-        cur = conn.cursor()
+def list_tracked_emails(limit: int = 100):
+    # Plain def: waits on the shared events.db lock on the threadpool, not the loop
+    with _events_conn() as conn:
+        if conn is None:
+            return []
         try:
-            rows = cur.execute(
-                "SELECT id,to_email,subject,created_at,provider_msgid FROM messages ORDER BY datetime(created_at) DESC LIMIT ?",
+            # Event counts come from the same statement (one pass over the
+            # msg_id index) rather than a COUNT query per message
+            rows = conn.execute(
+                "SELECT m.id,m.to_email,m.subject,m.created_at,m.provider_msgid,COUNT(e.id) AS events "
+                "FROM messages m LEFT JOIN events e ON e.msg_id=m.id "
+                "GROUP BY m.id ORDER BY datetime(m.created_at) DESC LIMIT ?",
                 (limit,),
             ).fetchall()
         except Exception:
@@ -1171,10 +1470,6 @@ async def list_tracked_emails(limit: int = 100):
 
         out: list[TrackedMessage] = []
         for r in rows:
-            try:
-                cnt = cur.execute("SELECT COUNT(*) FROM events WHERE msg_id=?", (r['id'],)).fetchone()[0]
-            except Exception:
-                cnt = 0
             # created_at may be NULL for legacy rows; coerce to ISO string
             created = r['created_at'] if r['created_at'] is not None else time.strftime('%Y-%m-%d %H:%M:%S')
             out.append(TrackedMessage(
@@ -1182,24 +1477,18 @@ async def list_tracked_emails(limit: int = 100):
                 to_email=r['to_email'],
                 subject=r['subject'],
                 created_at=created,
-                events=cnt,
+                events=r['events'],
                 provider_msgid=r['provider_msgid'] or None
             ))
         return out
-    finally:
-        try:
-            conn.close()
-        except Exception:
-            pass
 
 # ---- Resume export helpers ----
 @router.get("/runs/{task_id}/resumes/export")
-async def export_resumes(task_id: str):
+def export_resumes(task_id: str, db: Session = Depends(get_db)):
     """Ensure resume files exist on disk for a run and list them.
 
     Returns JSON with written file names (txt + docx) relative to run folder.
     """
-    db = SessionLocal()
     try:
         run_id = int(task_id)
     except Exception:
@@ -1211,7 +1500,6 @@ async def export_resumes(task_id: str):
     from app.services.resume_export import ensure_resume_files
     written = ensure_resume_files(run, jobs)
     # Return relative names under generated_docs/run_<id>
-    import os
     rel_root = os.path.join("generated_docs", f"run_{run.id}")
     rel_files = []
     for p in written:
@@ -1222,9 +1510,8 @@ async def export_resumes(task_id: str):
     return {"ok": True, "files": rel_files, "count": len(rel_files), "root": rel_root}
 
 @router.get("/runs/{task_id}/resumes/archive.zip")
-async def download_resumes_zip(task_id: str):
+def download_resumes_zip(task_id: str, db: Session = Depends(get_db)):
     """Build (or rebuild) a zip of all resume files for the run and return as download."""
-    db = SessionLocal()
     try:
         run_id = int(task_id)
     except Exception:
@@ -1244,15 +1531,12 @@ async def download_resumes_zip(task_id: str):
     return FileResponse(path=zip_path, filename=filename, media_type='application/zip')
 
 @router.get("/emails/tracked/{msg_id}", response_model=List[TrackedEvent])
-async def list_tracked_events(msg_id: str):
-    # Use writable conn to ensure schema exists and gracefully handle legacy DBs
-    conn = _get_events_conn_writable()
-    if not conn:
-        return []
-    try:
-        cur = conn.cursor()
+def list_tracked_events(msg_id: str):
+    with _events_conn() as conn:
+        if conn is None:
+            return []
         try:
-            rows = cur.execute(
+            rows = conn.execute(
                 "SELECT id,msg_id,event,email,url,reason,timestamp FROM events WHERE msg_id=? ORDER BY timestamp",
                 (msg_id,),
             ).fetchall()
@@ -1267,8 +1551,3 @@ async def list_tracked_events(msg_id: str):
             reason=r['reason'],
             timestamp=r['timestamp'],
         ) for r in rows]
-    finally:
-        try:
-            conn.close()
-        except Exception:
-            pass
@@ -84,7 +84,7 @@ async def update_recruiter(
         )
     
     # Update recruiter fields
-    for field, value in recruiter_update.dict(exclude_unset=True).items():
+    for field, value in recruiter_update.model_dump(exclude_unset=True).items():
         setattr(recruiter, field, value)
     
     recruiter.updated_at = datetime.utcnow()
@@ -29,7 +29,7 @@ async def start_pipeline(
     pipeline_run = {
         "run_id": run_id,
         "status": PipelineStatus.PENDING,
-        "request": request.dict(),
+        "request": request.model_dump(),
         "start_time": datetime.now(),
         "jobs_scraped": 0,
         "jobs_matched": 0,
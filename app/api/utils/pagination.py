@@ -1,6 +1,48 @@
+from typing import Any, List, NamedTuple
+
+from sqlalchemy import func, literal
+from sqlalchemy.orm import Query
+
+from app.core.config import settings
 from app.schemas.common import PaginationMeta
 
 
+class Page(NamedTuple):
+    items: List[Any]
+    total: int
+    page: int
+    pages: int
+
+
+def paginate_query(query: Query, skip: int, limit: int) -> Page:
+    """Return one page of an ORM query with its total and page numbers.
+
+    The total and page count ride along as window columns (COUNT(*) OVER ()
+    and its ceiling division by ``limit``) so the page, count and page count
+    come back in one round trip. An empty page past the end still needs a
+    real count, so that case falls back to query.count(). ``limit`` must be
+    positive; the routers' Query(ge=1) validators guarantee it.
+    """
+    page = skip // limit + 1
+    if not settings.PAGINATION_WINDOW_COUNT:
+        total = query.count()
+        return Page(query.offset(skip).limit(limit).all(), total, page, (total + limit - 1) // limit)
+    total_col = func.count().over()
+    rows = (
+        query.add_columns(
+            total_col.label("_total"),
+            ((total_col + literal(limit - 1)) // literal(limit)).label("_pages"),
+        )
+        .offset(skip)
+        .limit(limit)
+        .all()
+    )
+    if not rows:
+        total = query.count() if skip else 0
+        return Page([], total, page, (total + limit - 1) // limit)
+    return Page([row[0] for row in rows], rows[0]._total, page, int(rows[0]._pages))
+
+
 def build_pagination_meta(total: int, skip: int, limit: int) -> PaginationMeta:
     page = (skip // limit) + 1 if limit else 1
     total_pages = (total + limit - 1) // limit if limit else 1
@@ -0,0 +1,70 @@
+"""Small Redis-backed response cache.
+
+Values are opaque bytes (typically pre-serialized JSON). Redis being absent or
+unreachable never fails a request: lookups miss, writes are dropped, and the
+client backs off for ``_RETRY_AFTER`` seconds before trying again.
+"""
+import logging
+import time
+from typing import Optional
+
+from app.core.config import settings
+
+try:
+    import redis
+except ImportError:  # pragma: no cover - optional dependency
+    redis = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+_RETRY_AFTER = 30.0
+_client = None
+_down_until = 0.0
+
+
+def _get_client():
+    global _client
+    if redis is None or settings.ADMIN_CACHE_TTL <= 0 or time.monotonic() < _down_until:
+        return None
+    if _client is None:
+        _client = redis.Redis.from_url(
+            settings.REDIS_URL, socket_connect_timeout=0.25, socket_timeout=0.25
+        )
+    return _client
+
+
+def _mark_down(exc: Exception) -> None:
+    global _down_until
+    _down_until = time.monotonic() + _RETRY_AFTER
+    logger.warning("Redis cache unavailable, bypassing for %ss: %s", _RETRY_AFTER, exc)
+
+
+def cache_get(key: str) -> Optional[bytes]:
+    client = _get_client()
+    if client is None:
+        return None
+    try:
+        return client.get(key)
+    except redis.RedisError as exc:
+        _mark_down(exc)
+        return None
+
+
+def cache_set(key: str, value: bytes, ttl: Optional[int] = None) -> None:
+    client = _get_client()
+    if client is None:
+        return
+    try:
+        client.set(key, value, ex=ttl or settings.ADMIN_CACHE_TTL)
+    except redis.RedisError as exc:
+        _mark_down(exc)
+
+
+def cache_delete(*keys: str) -> None:
+    client = _get_client()
+    if client is None or not keys:
+        return
+    try:
+        client.delete(*keys)
+    except redis.RedisError as exc:
+        _mark_down(exc)
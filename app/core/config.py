@@ -31,6 +31,10 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    # Argon2id cost parameters for password hashing (memory in KiB)
+    ARGON2_MEMORY_COST: int = 65536
+    ARGON2_TIME_COST: int = 3
+    ARGON2_PARALLELISM: int = 4
     
     # Clerk Authentication Configuration (optional in non-production)
     CLERK_SECRET_KEY: Optional[str] = None
@@ -74,10 +78,17 @@ class Settings(BaseSettings):
     
     # Redis settings (for caching and sessions)
     REDIS_URL: str = "redis://localhost:6379"
+    # TTL (seconds) for cached admin GET-by-id responses; 0 disables the cache
+    ADMIN_CACHE_TTL: int = 300
+    # Seconds a /healthz or /api/health result is reused before the checks run again
+    HEALTH_CACHE_TTL: float = 2.0
     
     # Pagination settings
     DEFAULT_PAGE_SIZE: int = 20
     MAX_PAGE_SIZE: int = 100
+    # Fetch list totals with COUNT(*) OVER () in the page query instead of a
+    # separate count() round trip; disable if a backend handles windows poorly.
+    PAGINATION_WINDOW_COUNT: bool = True
     
     # Session settings
     SESSION_TIMEOUT_MINUTES: int = 60
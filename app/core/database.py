@@ -101,7 +101,7 @@ def init_db():
     Creates tables and adds initial data like roles and permissions.
     """
     from app.models import Role, Permission, User
-    from app.core.security import get_password_hash
+    from app.core.passwords import get_password_hash
     
     # Create tables
     create_tables()
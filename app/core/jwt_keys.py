@@ -0,0 +1,30 @@
+"""Preloaded JWT signing/verification keys.
+
+PyJWT accepts ready-made key objects, so the secret is converted (HMAC) or the
+PEM parsed and validated (RSA/EC) once per process instead of on every
+encode/decode.
+"""
+from functools import lru_cache
+
+from app.core.config import settings
+
+
+def _is_hmac(algorithm: str) -> bool:
+    return algorithm.upper().startswith("HS")
+
+
+@lru_cache(maxsize=1)
+def signing_key():
+    """Key passed to jwt.encode for settings.ALGORITHM."""
+    if _is_hmac(settings.ALGORITHM):
+        return settings.SECRET_KEY.encode("utf-8")
+    from cryptography.hazmat.primitives.serialization import load_pem_private_key
+    return load_pem_private_key(settings.SECRET_KEY.encode("utf-8"), password=None)
+
+
+@lru_cache(maxsize=1)
+def verification_key():
+    """Key passed to jwt.decode for settings.ALGORITHM."""
+    if _is_hmac(settings.ALGORITHM):
+        return signing_key()
+    return signing_key().public_key()
@@ -0,0 +1,27 @@
+"""Password hashing shared by the auth router, security helpers and DB seeding.
+
+New hashes are argon2id; legacy bcrypt hashes still verify and are reported
+by ``pwd_context.needs_update`` so callers can upgrade them on the next
+successful login.
+"""
+from passlib.context import CryptContext
+
+from app.core.config import settings
+
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated=["bcrypt"],
+    argon2__memory_cost=settings.ARGON2_MEMORY_COST,
+    argon2__time_cost=settings.ARGON2_TIME_COST,
+    argon2__parallelism=settings.ARGON2_PARALLELISM,
+)
+
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against its hash."""
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+def get_password_hash(password: str) -> str:
+    """Hash a password."""
+    return pwd_context.hash(password)
@@ -1,28 +1,20 @@
 from datetime import datetime, timedelta
 from typing import Optional, Union
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+import jwt
 from fastapi import HTTPException, status, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 from .config import settings
+# Re-exported: callers historically import the hashing helpers from here
+from .passwords import pwd_context, verify_password, get_password_hash  # noqa: F401
+from .jwt_keys import signing_key, verification_key
 from .database import get_db
 from app.models.user import User
 from app.models.role import Role
 from sqlalchemy import select
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 security = HTTPBearer()
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against its hash"""
-    return pwd_context.verify(plain_password, hashed_password)
-
-def get_password_hash(password: str) -> str:
-    """Hash a password"""
-    return pwd_context.hash(password)
-
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create JWT access token"""
     to_encode = data.copy()
@@ -32,7 +24,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
         expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, signing_key(), algorithm=settings.ALGORITHM)
     return encoded_jwt
 
 def create_refresh_token(data: dict) -> str:
@@ -40,7 +32,7 @@ def create_refresh_token(data: dict) -> str:
     to_encode = data.copy()
     expire = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, signing_key(), algorithm=settings.ALGORITHM)
     return encoded_jwt
 
 async def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)) -> dict:
@@ -48,7 +40,7 @@ async def verify_token(credentials: HTTPAuthorizationCredentials = Depends(secur
     try:
         payload = jwt.decode(
             credentials.credentials, 
-            settings.SECRET_KEY, 
+            verification_key(), 
             algorithms=[settings.ALGORITHM]
         )
         user_id: str = payload.get("sub")
@@ -59,7 +51,7 @@ async def verify_token(credentials: HTTPAuthorizationCredentials = Depends(secur
                 headers={"WWW-Authenticate": "Bearer"},
             )
         return payload
-    except JWTError:
+    except jwt.PyJWTError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authentication credentials",
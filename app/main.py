@@ -1,9 +1,13 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 import sys
 import os
 import logging
+import time
+import anyio.to_thread
+import httpx
 
 # Add parent directory to path to import job_application_pipeline
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -38,6 +42,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url=None if settings.ENVIRONMENT == "production" else "/docs",
     redoc_url=None if settings.ENVIRONMENT == "production" else "/redoc",
+    default_response_class=ORJSONResponse,
 )
 
 logger = logging.getLogger(__name__)
@@ -95,6 +100,13 @@ async def root():
 @app.on_event("startup")
 async def on_startup() -> None:
     """Initialize resources on startup (dev-only table creation)."""
+    # Password hashing and sync endpoints share the anyio worker pool; size it
+    # so a login burst cannot starve everything else (never below the default).
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = max(limiter.total_tokens, 2 * (os.cpu_count() or 1))
+    # One pooled outbound HTTP client for the app's lifetime (keep-alive + TLS
+    # session reuse); handlers reach it through request.app.state.http
+    app.state.http = httpx.AsyncClient(timeout=3.5, limits=httpx.Limits(max_keepalive_connections=20))
     # Only auto-create tables in non-production and when using SQLite.
     try:
         if settings.ENVIRONMENT != "production" and settings.DATABASE_URL.startswith("sqlite"):
@@ -104,6 +116,11 @@ async def on_startup() -> None:
             logger.info("Skipping auto table creation (production/migrations expected)")
     except Exception as e:
         logger.warning(f"Database init on startup skipped/failed: {e}")
+    # Email tracker DB: connection, pragmas and schema are set up once here
+    try:
+        jobflow.init_events_schema()
+    except Exception as e:
+        logger.warning(f"Email tracking DB init failed: {e}")
     # Log Supabase integration status
     try:
         db_mode = "supabase-postgres" if (settings.SUPABASE_POSTGRES_URL or "").strip() else ("sqlite" if settings.DATABASE_URL.startswith("sqlite") else "other-db")
@@ -119,6 +136,19 @@ async def on_startup() -> None:
         )
     except Exception as se:  # pragma: no cover
         logger.warning(f"Supabase status logging failed: {se}")
+    # Log the cost of one password hash so ARGON2_* settings can be tuned per host
+    try:
+        t0 = time.perf_counter()
+        get_password_hash("startup-calibration")
+        logger.info(
+            "Password hash timing: argon2id m=%s t=%s p=%s took %.1f ms",
+            settings.ARGON2_MEMORY_COST,
+            settings.ARGON2_TIME_COST,
+            settings.ARGON2_PARALLELISM,
+            (time.perf_counter() - t0) * 1000,
+        )
+    except Exception as he:  # pragma: no cover
+        logger.warning(f"Password hash timing failed: {he}")
     # Seed dedicated candidate demo user (idempotent)
     try:
         db = SessionLocal()
@@ -267,6 +297,15 @@ async def on_startup() -> None:
         except Exception:
             pass
 
+
+@app.on_event("shutdown")
+async def on_shutdown() -> None:
+    """Release app-wide resources."""
+    http = getattr(app.state, "http", None)
+    if http is not None:
+        await http.aclose()
+    jobflow.shutdown_docx_pool()
+
 @app.get("/health")
 async def health_check():
     """Detailed health check endpoint."""
@@ -10,7 +10,7 @@ from .analytics import RecruitmentMetric, JobAnalytics, CandidateAnalytics, Recr
 from .upload import FileUpload, Document, DocumentVersion, DocumentComment, FileShare, FileAccessLog, FileVersion, BulkUpload
 from .bench import CandidateBench, Certification, CandidateSubmission, CandidateSale, CandidateInterview
 from .client import Client, ClientContact, JobOpportunity
-from .run import PipelineRun, RunStatus, Stage
+from .run import PipelineRun, RunStatus, Stage, RunEmailEvent
 from .jobflow import Company, Recruiter, Email, EmailStatus, Asset, AssetKind
 from .scraped_job import ScrapedJob
 from .candidate_simple import CandidateSimple
@@ -50,7 +50,7 @@ __all__ = [
 
     # Client
     'Client', 'ClientContact', 'JobOpportunity'
-    , 'PipelineRun', 'RunStatus', 'Stage',
+    , 'PipelineRun', 'RunStatus', 'Stage', 'RunEmailEvent',
     'Company', 'Recruiter', 'Email', 'EmailStatus', 'Asset', 'AssetKind', 'ScrapedJob',
     'CandidateSimple'
 ]
\ No newline at end of file
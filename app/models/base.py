@@ -1,10 +1,25 @@
-from sqlalchemy import Column, Integer, DateTime, Boolean, String, Text, ForeignKey
+from sqlalchemy import Column, Integer, DateTime, Boolean, String, Text, ForeignKey, Index, DDL, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.sql import func
 from datetime import datetime
 
 Base = declarative_base()
 
+# Trigram GIN indexes (see trgm_index) need the extension; create_all on
+# PostgreSQL installs it first, other dialects skip those indexes entirely.
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+
+
+def trgm_index(name: str, column: str) -> Index:
+    """PostgreSQL-only trigram GIN index, for ilike('%term%') searches on ``column``."""
+    return Index(
+        name, column, postgresql_using="gin", postgresql_ops={column: "gin_trgm_ops"}
+    ).ddl_if(dialect="postgresql")
+
 class TimestampMixin:
     """Mixin for adding timestamp fields to models"""
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
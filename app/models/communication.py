@@ -2,7 +2,7 @@ from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, Foreign
 from sqlalchemy.orm import relationship
 from sqlalchemy import JSON
 from datetime import datetime
-from .base import BaseModel, AuditMixin, MetadataMixin
+from .base import BaseModel, AuditMixin, MetadataMixin, trgm_index
 from ..schemas.base import NotificationType, Priority
 
 class Message(BaseModel, AuditMixin, MetadataMixin):
@@ -263,9 +263,13 @@ class CallLog(BaseModel, AuditMixin):
 class EmailTemplate(BaseModel, AuditMixin, MetadataMixin):
     """Email templates for various communications"""
     __tablename__ = 'email_templates'
+    __table_args__ = (
+        trgm_index('ix_email_templates_name_trgm', 'name'),
+        trgm_index('ix_email_templates_subject_trgm', 'subject'),
+    )
     
     # Template identification
-    name = Column(String(200), nullable=False)
+    name = Column(String(200), nullable=False, unique=True, index=True)
     description = Column(Text, nullable=True)
     template_type = Column(String(100), nullable=False, index=True)  # application_received, interview_scheduled, etc.
     
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, JSON, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, DateTime, JSON, Boolean, Text, ForeignKey, Enum as SQLEnum
 from datetime import datetime
 from .base import BaseModel, AuditMixin, MetadataMixin
 from enum import Enum
@@ -51,3 +51,16 @@ class PipelineRun(BaseModel, AuditMixin, MetadataMixin):
 
     def set_stage(self, stage: Stage):
         self.stage = stage
+
+
+class RunEmailEvent(BaseModel):
+    """One outreach email attempt made by a pipeline run (appended, never rewritten)."""
+    __tablename__ = "run_email_events"
+
+    run_id = Column(Integer, ForeignKey("pipeline_runs.id"), nullable=False, index=True)
+    job_id = Column(Integer, nullable=True)
+    email = Column(String(255), nullable=True)
+    subject = Column(Text, nullable=True)
+    dry_run = Column(Boolean, nullable=True)
+    status = Column(String(20), nullable=True)  # sent | dry-run | error
+    error = Column(String(255), nullable=True)
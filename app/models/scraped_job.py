@@ -36,6 +36,10 @@ class ScrapedJob(BaseModel, AuditMixin, MetadataMixin):
         return hashlib.sha256(base.encode()).hexdigest()
 
 Index("ix_scraped_jobs_run_source", ScrapedJob.run_id, ScrapedJob.source)
+# Run-scoped listings filter on run_id and page/order by id
+Index("ix_scraped_jobs_run_id_id", ScrapedJob.run_id, ScrapedJob.id)
+# Outreach (send_emails) reads a run's jobs alongside their recruiter_email
+Index("ix_scraped_jobs_run_recruiter_email", ScrapedJob.run_id, ScrapedJob.recruiter_email)
 Index("ix_scraped_jobs_company_title", ScrapedJob.company, ScrapedJob.title)
 
 __all__ = ["ScrapedJob"]
@@ -1,10 +1,10 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, Table, Enum as SQLEnum, UniqueConstraint
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, Table, Enum as SQLEnum, UniqueConstraint, Index, func, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy import JSON
 from datetime import datetime
 import uuid
-from .base import BaseModel, AuditMixin, MetadataMixin
+from .base import BaseModel, AuditMixin, MetadataMixin, trgm_index
 from ..schemas.base import UserRole
 
 # Association table for user roles (many-to-many)
@@ -49,6 +49,17 @@ class User(BaseModel, AuditMixin, MetadataMixin):
     username = Column(String(100), unique=True, index=True, nullable=True)
     first_name = Column(String(100), nullable=False)
     last_name = Column(String(100), nullable=False)
+
+    __table_args__ = (
+        # Case-insensitive login lookups filter on lower(email)
+        Index('ix_users_email_lower', func.lower(email)),
+        # Admin user list: is_active filter and ilike search (migration 5c1e9a7d2f40)
+        Index('ix_users_active', 'is_active',
+              postgresql_where=text('is_active = true'), sqlite_where=text('is_active = 1')),
+        trgm_index('ix_users_email_trgm', 'email'),
+        trgm_index('ix_users_first_name_trgm', 'first_name'),
+        trgm_index('ix_users_last_name_trgm', 'last_name'),
+    )
     
     # Clerk integration fields
     clerk_user_id = Column(String(255), unique=True, index=True, nullable=True)
@@ -190,6 +201,10 @@ class User(BaseModel, AuditMixin, MetadataMixin):
 class Role(BaseModel, AuditMixin):
     """Role model"""
     __tablename__ = 'roles'
+    __table_args__ = (
+        trgm_index('ix_roles_name_trgm', 'name'),
+        trgm_index('ix_roles_description_trgm', 'description'),
+    )
     
     name = Column(String(100), unique=True, nullable=False, index=True)
     display_name = Column(String(200), nullable=False)
@@ -227,11 +242,15 @@ class Role(BaseModel, AuditMixin):
 class Permission(BaseModel, AuditMixin):
     """Permission model"""
     __tablename__ = 'permissions'
+    __table_args__ = (
+        trgm_index('ix_permissions_name_trgm', 'name'),
+        trgm_index('ix_permissions_description_trgm', 'description'),
+    )
     
     name = Column(String(100), unique=True, nullable=False, index=True)
     display_name = Column(String(200), nullable=False)
     description = Column(Text, nullable=True)
-    resource = Column(String(100), nullable=False)  # e.g., 'job', 'application', 'user'
+    resource = Column(String(100), nullable=False, index=True)  # e.g., 'job', 'application', 'user'
     action = Column(String(50), nullable=False)  # e.g., 'create', 'read', 'update', 'delete'
     is_active = Column(Boolean, default=True, nullable=False)
     is_system = Column(Boolean, default=False, nullable=False)
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import AliasChoices, BaseModel, Field, ConfigDict
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from .base import TimestampMixin, NotificationType, Priority
@@ -137,6 +137,8 @@ class EmailTemplateUpdate(BaseModel):
 class EmailTemplateResponse(EmailTemplateBase, TimestampMixin):
     """Email template response schema"""
     id: int
+    # Stored as email_templates.html_content
+    content: str = Field(..., min_length=1, validation_alias=AliasChoices("content", "html_content"))
     created_by: int
     
     model_config = ConfigDict(from_attributes=True)
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, EmailStr, Field, ConfigDict
+from pydantic import BaseModel, EmailStr, Field, ConfigDict, field_validator
 from typing import Optional, List
 from datetime import datetime
 from .base import TimestampMixin, UserRole
@@ -22,6 +22,11 @@ class UserCreate(UserBase):
     password: str = Field(..., min_length=8, max_length=100)
     role: UserRole
 
+    @field_validator("email")
+    @classmethod
+    def normalize_email(cls, v: str) -> str:
+        return v.strip().lower()
+
 class UserUpdate(BaseModel):
     """User update schema"""
     first_name: Optional[str] = Field(None, min_length=1, max_length=50)
@@ -105,6 +110,12 @@ class RoleResponse(RoleBase, TimestampMixin):
     
     model_config = ConfigDict(from_attributes=True)
 
+    @field_validator("permissions", mode="before")
+    @classmethod
+    def _permission_names(cls, v):
+        # ORM roles carry Permission objects; the API exposes their names
+        return [getattr(p, "name", p) for p in (v or [])]
+
 # Permission schemas
 class PermissionBase(BaseModel):
     """Base permission schema"""
@@ -5,8 +5,9 @@ This is an extracted, trimmed version of logic from `apollotest.py` adapted so
 it does NOT raise SystemExit on import if the API key is missing. The pipeline
 can call `find_recruiter_contact` opportunistically.
 """
-import os, re, requests, math, logging, time
+import os, re, requests, math, logging, time, threading
 from typing import List, Dict, Any, Optional
+from cachetools import TTLCache
 from app.core.config import settings
 
 APOLLO_BASE = "https://api.apollo.io/api/v1"
@@ -257,6 +258,12 @@ def find_recruiter_contact(company: str, job_title: str) -> Optional[Dict[str,st
     _CONTACT_CACHE[cache_key] = result
     return result
 
+# Multi-contact results by normalised (company, title, max_results). Each miss
+# costs several searches plus one unlock per contact, and runs repeat the same
+# companies. Empty results are not cached so transient failures are retried.
+_CONTACTS_CACHE: TTLCache = TTLCache(maxsize=5000, ttl=3600)
+_CONTACTS_CACHE_LOCK = threading.Lock()
+
 def search_recruiter_contacts(company: str, job_title: str, max_results: int = 5):
     """Return list of recruiter contacts (name,title,email,linkedin_url) with real unlocked emails only.
 
@@ -267,6 +274,11 @@ def search_recruiter_contacts(company: str, job_title: str, max_results: int = 5
     """
     if not company or not job_title or not settings.APOLLO_API_KEY:
         return []
+    cache_key = (_norm(company), _norm(job_title), max_results)
+    with _CONTACTS_CACHE_LOCK:
+        cached = _CONTACTS_CACHE.get(cache_key)
+    if cached is not None:
+        return list(cached)
     phrases = _phrases(job_title)
     # Phase 1: generic recruiter titles
     generic_params = {
@@ -318,6 +330,9 @@ def search_recruiter_contacts(company: str, job_title: str, max_results: int = 5
             "email": email,
             "linkedin_url": p.get("linkedin_url"),
         })
-    return contacts
+    if contacts:
+        with _CONTACTS_CACHE_LOCK:
+            _CONTACTS_CACHE[cache_key] = contacts
+    return list(contacts)
 
 __all__ = ["find_recruiter_contact", "search_recruiter_contacts"]
\ No newline at end of file
@@ -6,6 +6,41 @@ from app.models.bench import CandidateBench
 from app.schemas.bench import CandidateBenchCreate, CandidateBenchUpdate
 
 
+# Sort keys accepted by list_candidates, resolved once at import. Unknown keys
+# leave the result unordered, as before.
+_ORDER_BY = {
+    "-created_at": CandidateBench.created_at.desc(),
+    "-hourly_rate": CandidateBench.hourly_rate.desc().nullslast(),
+    "-experience_years": CandidateBench.experience_years.desc(),
+    "created_at": CandidateBench.created_at.asc(),
+    "hourly_rate": CandidateBench.hourly_rate.asc().nullsfirst(),
+    "experience_years": CandidateBench.experience_years.asc(),
+}
+
+
+def _filter_criteria(tenant_id: int, filters: Optional[Dict[str, Any]]) -> list:
+    """WHERE criteria for list_candidates, always in the same order so equal
+    filter shapes produce the same statement (and hit the compiled cache)."""
+    criteria = [CandidateBench.tenant_id == tenant_id]
+    if not filters:
+        return criteria
+    if availability := filters.get("availability_status"):
+        criteria.append(CandidateBench.availability_status.in_(availability))
+    if status := filters.get("bench_status"):
+        criteria.append(CandidateBench.bench_status.in_(status))
+    if (min_exp := filters.get("min_experience")) is not None:
+        criteria.append(CandidateBench.experience_years >= min_exp)
+    if (max_exp := filters.get("max_experience")) is not None:
+        criteria.append(CandidateBench.experience_years <= max_exp)
+    if (min_rate := filters.get("min_rate")) is not None:
+        criteria.append(CandidateBench.hourly_rate >= min_rate)
+    if (max_rate := filters.get("max_rate")) is not None:
+        criteria.append(CandidateBench.hourly_rate <= max_rate)
+    if title_contains := filters.get("title_contains"):
+        criteria.append(CandidateBench.current_title.ilike(f"%{title_contains}%"))
+    return criteria
+
+
 class BenchService:
     """Service layer for Candidate Bench operations."""
 
@@ -55,70 +90,28 @@ class BenchService:
         return candidate
 
     def list_candidates(self, db: Session, tenant_id: int, filters: Optional[Dict[str, Any]] = None, skip: int = 0, limit: int = 50) -> Tuple[List[CandidateBench], int]:
-        # Build base query with tenant scope
-        base_stmt = select(CandidateBench).where(CandidateBench.tenant_id == tenant_id)
-
-        # Apply filters to both items and count
-        if filters:
-            if availability := filters.get("availability_status"):
-                base_stmt = base_stmt.where(CandidateBench.availability_status.in_(availability))
-            if status := filters.get("bench_status"):
-                base_stmt = base_stmt.where(CandidateBench.bench_status.in_(status))
-            if (min_exp := filters.get("min_experience")) is not None:
-                base_stmt = base_stmt.where(CandidateBench.experience_years >= min_exp)
-            if (max_exp := filters.get("max_experience")) is not None:
-                base_stmt = base_stmt.where(CandidateBench.experience_years <= max_exp)
-            if (min_rate := filters.get("min_rate")) is not None:
-                base_stmt = base_stmt.where(CandidateBench.hourly_rate >= min_rate)
-            if (max_rate := filters.get("max_rate")) is not None:
-                base_stmt = base_stmt.where(CandidateBench.hourly_rate <= max_rate)
-            if title_contains := filters.get("title_contains"):
-                like = f"%{title_contains}%"
-                base_stmt = base_stmt.where(CandidateBench.current_title.ilike(like))
+        # Items and count share the same tenant scope and filter criteria
+        criteria = _filter_criteria(tenant_id, filters)
+        base_stmt = select(CandidateBench).where(*criteria)
 
         # Sorting
         order = (filters or {}).get("order") or "-created_at"
-        if order.startswith("-"):
-            field = order[1:]
-            if field == "created_at":
-                base_stmt = base_stmt.order_by(CandidateBench.created_at.desc())
-            elif field == "hourly_rate":
-                base_stmt = base_stmt.order_by(CandidateBench.hourly_rate.desc().nullslast())
-            elif field == "experience_years":
-                base_stmt = base_stmt.order_by(CandidateBench.experience_years.desc())
-        else:
-            field = order
-            if field == "created_at":
-                base_stmt = base_stmt.order_by(CandidateBench.created_at.asc())
-            elif field == "hourly_rate":
-                base_stmt = base_stmt.order_by(CandidateBench.hourly_rate.asc().nullsfirst())
-            elif field == "experience_years":
-                base_stmt = base_stmt.order_by(CandidateBench.experience_years.asc())
-
-        # Paged items
-        items = db.execute(base_stmt.offset(skip).limit(limit)).scalars().all()
-
-        # Total count with same filters
-        count_stmt = select(func.count(CandidateBench.id)).where(CandidateBench.tenant_id == tenant_id)
-        if filters:
-            if availability := filters.get("availability_status"):
-                count_stmt = count_stmt.where(CandidateBench.availability_status.in_(availability))
-            if status := filters.get("bench_status"):
-                count_stmt = count_stmt.where(CandidateBench.bench_status.in_(status))
-            if (min_exp := filters.get("min_experience")) is not None:
-                count_stmt = count_stmt.where(CandidateBench.experience_years >= min_exp)
-            if (max_exp := filters.get("max_experience")) is not None:
-                count_stmt = count_stmt.where(CandidateBench.experience_years <= max_exp)
-            if (min_rate := filters.get("min_rate")) is not None:
-                count_stmt = count_stmt.where(CandidateBench.hourly_rate >= min_rate)
-            if (max_rate := filters.get("max_rate")) is not None:
-                count_stmt = count_stmt.where(CandidateBench.hourly_rate <= max_rate)
-            if title_contains := filters.get("title_contains"):
-                like = f"%{title_contains}%"
-                count_stmt = count_stmt.where(CandidateBench.current_title.ilike(like))
-        total = db.scalar(count_stmt) or 0
+        order_by = _ORDER_BY.get(order)
+        if order_by is not None:
+            base_stmt = base_stmt.order_by(order_by)
 
-        return items, int(total)
+        # Paged items with the filtered total as a COUNT(*) OVER () column, so
+        # page and count come back in one round trip
+        rows = db.execute(
+            base_stmt.add_columns(func.count().over().label("total")).offset(skip).limit(limit)
+        ).all()
+        if rows:
+            return [row[0] for row in rows], int(rows[0].total)
+        # An empty page past the end still needs a real count
+        if not skip:
+            return [], 0
+        total = db.scalar(select(func.count(CandidateBench.id)).where(*criteria)) or 0
+        return [], int(total)
 
     def get_candidate(self, db: Session, tenant_id: int, candidate_id: int) -> Optional[CandidateBench]:
         return db.query(CandidateBench).filter(CandidateBench.tenant_id == tenant_id, CandidateBench.id == candidate_id).first()
@@ -1,4 +1,5 @@
 from __future__ import annotations
+import asyncio
 import logging
 from typing import List
 from datetime import datetime
@@ -39,6 +40,66 @@ class PipelineContext:
         self.save()
 
 
+def _write_job_files(run_id: int, job_id: int, cover_letter: str | None, resume_custom: str | None, output_dir: str) -> None:
+    """Write one job's cover letter/resume text + DOCX files and mirror them to storage.
+
+    Pure file/network work (no session access) so it can run on a worker thread.
+    """
+    from coverletter_convertion import convert_cover_letter
+    # Write text file & convert to docx for UI download
+    base_name = f"cover_letter_job{job_id}"
+    txt_path = os.path.join(output_dir, base_name + '.txt')
+    docx_path = os.path.join(output_dir, base_name + '.docx')
+    resume_txt_path = os.path.join(output_dir, f"resume_job{job_id}.txt")
+    resume_docx_path = os.path.join(output_dir, f"resume_job{job_id}.docx")
+    try:
+        with open(txt_path, 'w', encoding='utf-8') as f:
+            f.write(cover_letter or '')
+        convert_cover_letter(txt_path, docx_path)
+        logging.info("[PIPELINE] Wrote cover letter files for job %s -> %s", job_id, base_name)
+        # Mirror to Supabase Storage
+        from app.core.config import settings as _settings
+        if _settings.supabase_storage_enabled:
+            try:
+                from app.services.supabase_storage import upload_bytes
+                key_txt = f"runs/{run_id}/{base_name}.txt"
+                key_docx = f"runs/{run_id}/{base_name}.docx"
+                with open(txt_path, 'rb') as fh:
+                    upload_bytes(_settings.SUPABASE_STORAGE_BUCKET_DOCS, key_txt, fh.read(), content_type='text/plain', upsert=True)
+                if os.path.exists(docx_path):
+                    with open(docx_path, 'rb') as fh:
+                        upload_bytes(_settings.SUPABASE_STORAGE_BUCKET_DOCS, key_docx, fh.read(), content_type='application/vnd.openxmlformats-officedocument.wordprocessingml.document', upsert=True)
+            except Exception:
+                pass
+        # Write resume txt
+        if resume_custom:
+            with open(resume_txt_path, 'w', encoding='utf-8') as f:
+                f.write(resume_custom)
+            # Re-use converter if it accepts arbitrary text (create temp file)
+            try:
+                # Write temp wrapper file for conversion
+                tmp_resume_source = resume_txt_path  # already plain text
+                convert_cover_letter(tmp_resume_source, resume_docx_path)
+            except Exception:
+                pass
+            logging.info("[PIPELINE] Wrote resume files for job %s", job_id)
+            # Mirror resume files as well
+            if _settings.supabase_storage_enabled:
+                try:
+                    from app.services.supabase_storage import upload_bytes
+                    key_txt = f"runs/{run_id}/resume_job{job_id}.txt"
+                    key_docx = f"runs/{run_id}/resume_job{job_id}.docx"
+                    with open(resume_txt_path, 'rb') as fh:
+                        upload_bytes(_settings.SUPABASE_STORAGE_BUCKET_DOCS, key_txt, fh.read(), content_type='text/plain', upsert=True)
+                    if os.path.exists(resume_docx_path):
+                        with open(resume_docx_path, 'rb') as fh:
+                            upload_bytes(_settings.SUPABASE_STORAGE_BUCKET_DOCS, key_docx, fh.read(), content_type='application/vnd.openxmlformats-officedocument.wordprocessingml.document', upsert=True)
+                except Exception:
+                    pass
+    except Exception:
+        pass
+
+
 async def run_pipeline(run_id: int, query: str, locations: list[str] | None, sources: list[str] | None):
     from app.core.database import SessionLocal  # avoid circular import
     db = SessionLocal()
@@ -100,7 +161,7 @@ async def run_pipeline(run_id: int, query: str, locations: list[str] | None, sou
                     "rows": 40,
                     "proxy": {"useApifyProxy": True, "apifyProxyGroups": ["RESIDENTIAL"]},
                 }
-                apify_jobs = run_apify_job(settings.apify_token, actor_id, run_input) or []
+                apify_jobs = await asyncio.to_thread(run_apify_job, settings.apify_token, actor_id, run_input) or []
                 inserted = 0
                 for j in apify_jobs[:80]:
                     title = j.get('title') or j.get('jobTitle')
@@ -180,7 +241,7 @@ async def run_pipeline(run_id: int, query: str, locations: list[str] | None, sou
                     logging.info("Enrichment skip job=%s missing key/company/title", j.id)
                 else:
                     try:
-                        contact = find_recruiter_contact(j.company, j.title)
+                        contact = await asyncio.to_thread(find_recruiter_contact, j.company, j.title)
                     except Exception as e:  # noqa: BLE001
                         logging.warning("Apollo enrichment exception job=%s: %s", j.id, e)
                         contact = None
@@ -208,8 +269,6 @@ async def run_pipeline(run_id: int, query: str, locations: list[str] | None, sou
         from app.services.resume_service import load_base_resume_text, tailor_resume_for_job
         base_resume_text = load_base_resume_text(run)
         if jobs_total:
-            from coverletter_convertion import convert_cover_letter
-            import os
             jobs = db.query(ScrapedJob).filter(ScrapedJob.run_id == run.id).all()
             total_jobs = len(jobs)
             output_dir = os.path.join(_project_root(), 'generated_docs', f'run_{run.id}')
@@ -225,59 +284,11 @@ async def run_pipeline(run_id: int, query: str, locations: list[str] | None, sou
                     j.generated_at = datetime.utcnow()
                     generated += 1
                     db.add(j)
+                    cover_letter, resume_custom, job_id = j.cover_letter, j.resume_custom, j.id
                     db.commit()
-                    # Write text file & convert to docx for UI download
-                    base_name = f"cover_letter_job{j.id}"
-                    txt_path = os.path.join(output_dir, base_name + '.txt')
-                    docx_path = os.path.join(output_dir, base_name + '.docx')
-                    resume_txt_path = os.path.join(output_dir, f"resume_job{j.id}.txt")
-                    resume_docx_path = os.path.join(output_dir, f"resume_job{j.id}.docx")
-                    try:
-                        with open(txt_path, 'w', encoding='utf-8') as f:
-                            f.write(j.cover_letter or '')
-                        convert_cover_letter(txt_path, docx_path)
-                        logging.info("[PIPELINE] Wrote cover letter files for job %s -> %s", j.id, base_name)
-                        # Mirror to Supabase Storage
-                        from app.core.config import settings as _settings
-                        if _settings.supabase_storage_enabled:
-                            try:
-                                from app.services.supabase_storage import upload_bytes
-                                key_txt = f"runs/{run.id}/{base_name}.txt"
-                                key_docx = f"runs/{run.id}/{base_name}.docx"
-                                with open(txt_path, 'rb') as fh:
-                                    upload_bytes(_settings.SUPABASE_STORAGE_BUCKET_DOCS, key_txt, fh.read(), content_type='text/plain', upsert=True)
-                                if os.path.exists(docx_path):
-                                    with open(docx_path, 'rb') as fh:
-                                        upload_bytes(_settings.SUPABASE_STORAGE_BUCKET_DOCS, key_docx, fh.read(), content_type='application/vnd.openxmlformats-officedocument.wordprocessingml.document', upsert=True)
-                            except Exception:
-                                pass
-                        # Write resume txt
-                        if j.resume_custom:
-                            with open(resume_txt_path, 'w', encoding='utf-8') as f:
-                                f.write(j.resume_custom)
-                            # Re-use converter if it accepts arbitrary text (create temp file)
-                            try:
-                                # Write temp wrapper file for conversion
-                                tmp_resume_source = resume_txt_path  # already plain text
-                                convert_cover_letter(tmp_resume_source, resume_docx_path)
-                            except Exception:
-                                pass
-                            logging.info("[PIPELINE] Wrote resume files for job %s", j.id)
-                            # Mirror resume files as well
-                            if _settings.supabase_storage_enabled:
-                                try:
-                                    from app.services.supabase_storage import upload_bytes
-                                    key_txt = f"runs/{run.id}/resume_job{j.id}.txt"
-                                    key_docx = f"runs/{run.id}/resume_job{j.id}.docx"
-                                    with open(resume_txt_path, 'rb') as fh:
-                                        upload_bytes(_settings.SUPABASE_STORAGE_BUCKET_DOCS, key_txt, fh.read(), content_type='text/plain', upsert=True)
-                                    if os.path.exists(resume_docx_path):
-                                        with open(resume_docx_path, 'rb') as fh:
-                                            upload_bytes(_settings.SUPABASE_STORAGE_BUCKET_DOCS, key_docx, fh.read(), content_type='application/vnd.openxmlformats-officedocument.wordprocessingml.document', upsert=True)
-                                except Exception:
-                                    pass
-                    except Exception:
-                        pass
+                    # File writes, DOCX conversion and storage uploads block; run them
+                    # on a worker thread so the event loop keeps serving requests
+                    await asyncio.to_thread(_write_job_files, run.id, job_id, cover_letter, resume_custom, output_dir)
                 except Exception:
                     continue
                 # Update counts after each iteration so UI can poll and display progress
@@ -10,6 +10,8 @@ reuses the existing coverletter_convertion.convert_cover_letter helper for consi
 """
 from pathlib import Path
 from typing import Iterable, List
+import hashlib
+import tempfile
 import zipfile
 import os
 
@@ -31,7 +33,12 @@ def ensure_resume_files(run: PipelineRun, jobs: Iterable[ScrapedJob]) -> List[st
         txt_path = out_dir / f"resume_job{j.id}.txt"
         docx_path = out_dir / f"resume_job{j.id}.docx"
         try:
-            # Always (re)write text file (idempotent, small)
+            # Unchanged resume with its docx already built: leave both files
+            # (and their mtimes, which key the zip cache) alone
+            if docx_path.exists() and _read_text(txt_path) == j.resume_custom:
+                written.append(str(txt_path))
+                written.append(str(docx_path))
+                continue
             txt_path.write_text(j.resume_custom, encoding='utf-8')
             # Convert to docx (best effort)
             try:
@@ -45,18 +52,70 @@ def ensure_resume_files(run: PipelineRun, jobs: Iterable[ScrapedJob]) -> List[st
     return written
 
 def create_resume_zip(run: PipelineRun) -> str:
+    """Return the run's resume zip, rebuilding it only when the resume files changed."""
     out_dir = _run_output_dir(run.id)
     if not out_dir.exists():
         raise FileNotFoundError("No generated docs directory for run")
     zip_path = out_dir / f"run_{run.id}_resumes.zip"
-    with zipfile.ZipFile(zip_path, 'w', compression=zipfile.ZIP_DEFLATED) as zf:
-        for p in sorted(out_dir.glob('resume_job*.*')):
-            try:
-                zf.write(p, arcname=p.name)
-            except Exception:
-                continue
+    fp_path = out_dir / f"run_{run.id}_resumes.zip.fingerprint"
+    files = sorted(out_dir.glob('resume_job*.*'))
+    fingerprint = _fingerprint(files)
+    if zip_path.exists() and _read_text(fp_path) == fingerprint:
+        return str(zip_path)
+    # Build in a private temp file next to the target and swap it in, so
+    # concurrent downloads never see (or clobber) a half-written archive
+    fd, tmp_name = tempfile.mkstemp(dir=out_dir, prefix=f"run_{run.id}_resumes.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as fh, zipfile.ZipFile(fh, 'w', compression=zipfile.ZIP_DEFLATED) as zf:
+            for p in files:
+                try:
+                    zf.write(p, arcname=p.name)
+                except Exception:
+                    continue
+        os.replace(tmp_name, zip_path)
+    except BaseException:
+        _unlink_quietly(tmp_name)
+        raise
+    _write_atomic(fp_path, fingerprint)
     return str(zip_path)
 
+
+def _read_text(path: Path) -> str | None:
+    try:
+        return path.read_text(encoding='utf-8')
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as fh:
+            fh.write(text)
+        os.replace(tmp_name, path)
+    except BaseException:
+        _unlink_quietly(tmp_name)
+        raise
+
+
+def _unlink_quietly(path: str) -> None:
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+def _fingerprint(files: Iterable[Path]) -> str:
+    """Digest of each file's name, size and mtime."""
+    h = hashlib.sha256()
+    for p in files:
+        try:
+            st = p.stat()
+        except OSError:
+            continue
+        h.update(f"{p.name}:{st.st_size}:{st.st_mtime_ns}\n".encode())
+    return h.hexdigest()
+
 __all__ = [
     'ensure_resume_files',
     'create_resume_zip',
@@ -11,11 +11,38 @@ should guard with `settings.supabase_storage_enabled` and degrade gracefully to
 local filesystem.
 """
 
+import threading
+import time
 from typing import Optional, List, Dict, Any
+
+from cachetools import TTLCache
+
 from app.core.config import settings
 
 _client = None  # cached client
 
+# Object URLs keyed by (kind, bucket, path[, expires_in]). Run listings ask for
+# the same resume/cover-letter URLs on every poll; signed entries also carry
+# their own deadline so a URL is never handed out after it has expired.
+_URL_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=3000)
+_URL_CACHE_LOCK = threading.Lock()
+# Stop serving a signed URL this long before Supabase expires it
+_SIGNED_URL_MARGIN = 60
+
+
+def _cached_url(key: tuple) -> Optional[str]:
+    with _URL_CACHE_LOCK:
+        hit = _URL_CACHE.get(key)
+    if hit is None:
+        return None
+    url, deadline = hit
+    return url if time.monotonic() < deadline else None
+
+
+def _cache_url(key: tuple, url: str, lifetime: float) -> None:
+    with _URL_CACHE_LOCK:
+        _URL_CACHE[key] = (url, time.monotonic() + lifetime)
+
 
 def get_client():
     """Return a configured Supabase client or None when disabled."""
@@ -54,6 +81,10 @@ def upload_bytes(bucket: str, path: str, data: bytes, content_type: Optional[str
 
 def get_public_url(bucket: str, path: str) -> Optional[str]:
     """Return public URL for object (works when bucket is public)."""
+    key = ("public", bucket, path)
+    url = _cached_url(key)
+    if url:
+        return url
     client = get_client()
     if not client:
         return None
@@ -62,16 +93,26 @@ def get_public_url(bucket: str, path: str) -> Optional[str]:
         # lib returns dict-like {'data': {'publicUrl': '...'}} in some versions
         if isinstance(res, dict):
             data = res.get("data") or {}
-            return data.get("publicUrl") or res.get("publicURL") or None
-        # Some versions return simple object with .data.public_url
-        url = getattr(getattr(res, "data", None), "public_url", None)
-        return url or None
+            url = data.get("publicUrl") or res.get("publicURL") or None
+        else:
+            # Some versions return simple object with .data.public_url
+            url = getattr(getattr(res, "data", None), "public_url", None) or None
     except Exception:
         return None
+    if url:
+        _cache_url(key, url, _URL_CACHE.ttl)
+    return url
 
 
 def create_signed_url(bucket: str, path: str, expires_in: int = 60 * 60) -> Optional[str]:
-    """Return a time-limited signed URL for private buckets."""
+    """Return a time-limited signed URL for private buckets.
+
+    Cached URLs are reused until shortly before they expire.
+    """
+    key = ("signed", bucket, path, expires_in)
+    url = _cached_url(key)
+    if url:
+        return url
     client = get_client()
     if not client:
         return None
@@ -79,11 +120,15 @@ def create_signed_url(bucket: str, path: str, expires_in: int = 60 * 60) -> Opti
         res = client.storage.from_(bucket).create_signed_url(path, expires_in)
         if isinstance(res, dict):
             data = res.get("data") or {}
-            return data.get("signedUrl") or data.get("signedURL") or None
-        url = getattr(getattr(res, "data", None), "signed_url", None)
-        return url or None
+            url = data.get("signedUrl") or data.get("signedURL") or None
+        else:
+            url = getattr(getattr(res, "data", None), "signed_url", None) or None
     except Exception:
         return None
+    lifetime = min(expires_in - _SIGNED_URL_MARGIN, _URL_CACHE.ttl)
+    if url and lifetime > 0:
+        _cache_url(key, url, lifetime)
+    return url
 
 
 def list_prefix(bucket: str, prefix: str) -> List[Dict[str, Any]]:
@@ -0,0 +1,25 @@
+"""add users lower(email) index
+
+Revision ID: 2f7c3b9e8d15
+Revises: 8b2d4f6a1c93
+Create Date: 2025-09-22 11:03:52.690271
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '2f7c3b9e8d15'
+down_revision = '8b2d4f6a1c93'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # authenticate_user matches func.lower(User.email); index the expression
+    op.create_index('ix_users_email_lower', 'users', [sa.text('lower(email)')], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_email_lower', table_name='users')
@@ -0,0 +1,25 @@
+"""add scraped_jobs (run_id, recruiter_email) index
+
+Revision ID: 3e8b6d1f0a27
+Revises: a7d3f5c2e914
+Create Date: 2025-09-24 16:02:44.917530
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3e8b6d1f0a27'
+down_revision = 'a7d3f5c2e914'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # jobflow send_emails reads a run's jobs with their recruiter_email
+    op.create_index('ix_scraped_jobs_run_recruiter_email', 'scraped_jobs', ['run_id', 'recruiter_email'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_scraped_jobs_run_recruiter_email', table_name='scraped_jobs')
@@ -0,0 +1,52 @@
+"""add admin list search indexes
+
+Revision ID: 5c1e9a7d2f40
+Revises: aefcc3eb170b
+Create Date: 2025-09-20 10:12:31.402117
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5c1e9a7d2f40'
+down_revision = 'aefcc3eb170b'
+branch_labels = None
+depends_on = None
+
+
+# (index name, table, column) for the columns the admin list endpoints search
+# with ilike('%term%'); a leading wildcard can only use a trigram GIN index.
+TRGM_INDEXES = [
+    ('ix_users_email_trgm', 'users', 'email'),
+    ('ix_users_first_name_trgm', 'users', 'first_name'),
+    ('ix_users_last_name_trgm', 'users', 'last_name'),
+    ('ix_roles_name_trgm', 'roles', 'name'),
+    ('ix_roles_description_trgm', 'roles', 'description'),
+    ('ix_permissions_name_trgm', 'permissions', 'name'),
+    ('ix_permissions_description_trgm', 'permissions', 'description'),
+    ('ix_email_templates_name_trgm', 'email_templates', 'name'),
+    ('ix_email_templates_subject_trgm', 'email_templates', 'subject'),
+]
+
+
+def upgrade() -> None:
+    is_postgres = op.get_bind().dialect.name == 'postgresql'
+    if is_postgres:
+        op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        for name, table, column in TRGM_INDEXES:
+            op.create_index(name, table, [column], unique=False,
+                            postgresql_using='gin', postgresql_ops={column: 'gin_trgm_ops'})
+    op.create_index('ix_users_active', 'users', ['is_active'], unique=False,
+                    postgresql_where=sa.text('is_active = true'),
+                    sqlite_where=sa.text('is_active = 1'))
+    op.create_index(op.f('ix_permissions_resource'), 'permissions', ['resource'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_permissions_resource'), table_name='permissions')
+    op.drop_index('ix_users_active', table_name='users')
+    if op.get_bind().dialect.name == 'postgresql':
+        for name, table, _column in reversed(TRGM_INDEXES):
+            op.drop_index(name, table_name=table)
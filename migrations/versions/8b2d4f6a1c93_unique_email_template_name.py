@@ -0,0 +1,35 @@
+"""unique email template name
+
+Revision ID: 8b2d4f6a1c93
+Revises: 5c1e9a7d2f40
+Create Date: 2025-09-21 09:41:07.215384
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8b2d4f6a1c93'
+down_revision = '5c1e9a7d2f40'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Names were not unique before this revision. Keep the oldest template of
+    # each name as is and suffix the rest with their id, so the unique index
+    # can be built without dropping any rows.
+    op.execute(
+        """
+        UPDATE email_templates
+        SET name = SUBSTR(name, 1, 180) || ' (' || CAST(id AS VARCHAR(20)) || ')'
+        WHERE id NOT IN (SELECT MIN(id) FROM email_templates GROUP BY name)
+        """
+    )
+    # Conflict target for the admin create endpoint's INSERT ... ON CONFLICT DO NOTHING
+    op.create_index(op.f('ix_email_templates_name'), 'email_templates', ['name'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_email_templates_name'), table_name='email_templates')
@@ -0,0 +1,25 @@
+"""add scraped_jobs (run_id, id) index
+
+Revision ID: 9c4e1b7a3d52
+Revises: 2f7c3b9e8d15
+Create Date: 2025-09-23 09:41:17.208344
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9c4e1b7a3d52'
+down_revision = '2f7c3b9e8d15'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # jobflow run listings and counts filter on run_id and order/limit by id
+    op.create_index('ix_scraped_jobs_run_id_id', 'scraped_jobs', ['run_id', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_scraped_jobs_run_id_id', table_name='scraped_jobs')
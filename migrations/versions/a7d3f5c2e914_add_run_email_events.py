@@ -0,0 +1,46 @@
+"""add run_email_events table
+
+Revision ID: a7d3f5c2e914
+Revises: 9c4e1b7a3d52
+Create Date: 2025-09-24 14:26:05.531870
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a7d3f5c2e914'
+down_revision = '9c4e1b7a3d52'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Outreach email log per run; previously a capped list packed into
+    # pipeline_runs.metadata_json and rewritten on every send
+    op.create_table(
+        'run_email_events',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+        sa.Column('is_deleted', sa.Boolean(), server_default=sa.false(), nullable=False),
+        sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('run_id', sa.Integer(), nullable=False),
+        sa.Column('job_id', sa.Integer(), nullable=True),
+        sa.Column('email', sa.String(255), nullable=True),
+        sa.Column('subject', sa.Text(), nullable=True),
+        sa.Column('dry_run', sa.Boolean(), nullable=True),
+        sa.Column('status', sa.String(20), nullable=True),
+        sa.Column('error', sa.String(255), nullable=True),
+        sa.ForeignKeyConstraint(['run_id'], ['pipeline_runs.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_run_email_events_id'), 'run_email_events', ['id'], unique=False)
+    op.create_index(op.f('ix_run_email_events_run_id'), 'run_email_events', ['run_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_run_email_events_run_id'), table_name='run_email_events')
+    op.drop_index(op.f('ix_run_email_events_id'), table_name='run_email_events')
+    op.drop_table('run_email_events')
@@ -0,0 +1,141 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.api import dependencies as deps
+from app.core.database import get_db
+from app.models.user import User, Role, Permission
+from app.models.communication import EmailTemplate
+
+
+@pytest.fixture()
+def db():
+    # Same engine/session factory the overridden get_db hands to the endpoints
+    gen = app.dependency_overrides[get_db]()
+    session = next(gen)
+    yield session
+    gen.close()
+
+
+@pytest.fixture()
+def client(db):
+    admin_role = Role(name="admin", display_name="Admin")
+    admin = User(email="admin@example.com", username="admin", first_name="A", last_name="D", hashed_password="h", is_active=True)
+    admin.roles.append(admin_role)
+    db.add(admin)
+    db.commit()
+    app.dependency_overrides[deps.get_current_user] = lambda: admin
+    return TestClient(app)
+
+
+def seed_permission(db, name: str) -> Permission:
+    perm = Permission(name=name, display_name=name, resource="job", action="read")
+    db.add(perm)
+    db.commit()
+    return perm
+
+
+def test_update_permission_rename_onto_existing_name(client, db):
+    seed_permission(db, "jobs.read")
+    other = seed_permission(db, "jobs.write")
+    r = client.put(f"/api/admin/permissions/{other.id}", json={"name": "jobs.read"})
+    assert r.status_code == 400
+    assert r.json()["detail"] == "Permission with this name already exists"
+
+
+def test_update_permission_not_found(client):
+    r = client.put("/api/admin/permissions/9999", json={"name": "jobs.read"})
+    assert r.status_code == 404
+
+
+def test_create_role(client, db):
+    seed_permission(db, "job:read")
+    r = client.post("/api/admin/roles", json={"name": "recruiter", "description": "Sourcing", "permissions": ["job:read"]})
+    assert r.status_code == 201, r.text
+    body = r.json()
+    assert body["name"] == "recruiter"
+    assert body["permissions"] == ["job:read"]
+
+
+def test_create_role_duplicate_name(client):
+    r = client.post("/api/admin/roles", json={"name": "admin"})
+    assert r.status_code == 400
+    assert r.json()["detail"] == "Role with this name already exists"
+
+
+def test_create_permission(client, db):
+    r = client.post("/api/admin/permissions", json={"name": "job:read", "description": "Read jobs"})
+    assert r.status_code == 201, r.text
+    assert r.json()["name"] == "job:read"
+    perm = db.get(Permission, r.json()["id"])
+    assert (perm.resource, perm.action) == ("job", "read")
+
+
+def test_create_permission_duplicate_name(client, db):
+    seed_permission(db, "jobs.read")
+    r = client.post("/api/admin/permissions", json={"name": "jobs.read"})
+    assert r.status_code == 400
+    assert r.json()["detail"] == "Permission with this name already exists"
+
+
+def test_create_email_template(client):
+    r = client.post(
+        "/api/admin/email-templates",
+        json={"name": "welcome", "subject": "Hello", "content": "<p>Hello</p>", "template_type": "welcome"},
+    )
+    assert r.status_code == 201, r.text
+    assert r.json()["content"] == "<p>Hello</p>"
+
+
+def test_create_email_template_duplicate_name(client, db):
+    db.add(EmailTemplate(name="welcome", template_type="welcome", subject="Hi", html_content="<p>Hi</p>"))
+    db.commit()
+    r = client.post(
+        "/api/admin/email-templates",
+        json={"name": "welcome", "subject": "Hello", "content": "Hello", "template_type": "welcome"},
+    )
+    assert r.status_code == 400
+    assert r.json()["detail"] == "Email template with this name already exists"
+
+
+def test_create_recruiter_duplicate_identifier(client):
+    payload = {"recruiter_identifier": "rec@example.com", "display_name": "Rec"}
+    assert client.post("/api/admin/recruiters", json=payload).status_code == 200
+    r = client.post("/api/admin/recruiters", json=payload)
+    assert r.status_code == 400
+    assert r.json()["detail"] == "Recruiter identifier already exists"
+
+
+def test_update_role_permissions(client, db):
+    seed_permission(db, "job:read")
+    seed_permission(db, "job:write")
+    role = Role(name="recruiter", display_name="Recruiter")
+    db.add(role)
+    db.commit()
+
+    r = client.put(f"/api/admin/roles/{role.id}", json={"permissions": ["job:read", "job:write"]})
+    assert r.status_code == 200, r.text
+    assert sorted(r.json()["permissions"]) == ["job:read", "job:write"]
+
+    r = client.put(f"/api/admin/roles/{role.id}", json={"description": "Sourcing", "permissions": []})
+    assert r.status_code == 200, r.text
+    assert r.json()["permissions"] == []
+    assert r.json()["description"] == "Sourcing"
+
+
+def test_update_role_unknown_permission(client, db):
+    role = Role(name="recruiter", display_name="Recruiter")
+    db.add(role)
+    db.commit()
+    r = client.put(f"/api/admin/roles/{role.id}", json={"permissions": ["nope:read"]})
+    assert r.status_code == 400
+    assert r.json()["detail"] == "Unknown permission(s): nope:read"
+
+
+def test_update_email_template_content(client, db):
+    template = EmailTemplate(name="welcome", template_type="welcome", subject="Hi", html_content="<p>Hi</p>", created_by=1)
+    db.add(template)
+    db.commit()
+    r = client.put(f"/api/admin/email-templates/{template.id}", json={"content": "<p>Hello</p>"})
+    assert r.status_code == 200, r.text
+    assert r.json()["content"] == "<p>Hello</p>"
@@ -0,0 +1,36 @@
+import pytest
+from fastapi.testclient import TestClient
+from passlib.context import CryptContext
+
+from app.main import app
+from app.core.database import get_db
+from app.models.user import User
+
+
+@pytest.fixture()
+def db():
+    # Same engine/session factory the overridden get_db hands to the endpoints
+    gen = app.dependency_overrides[get_db]()
+    session = next(gen)
+    yield session
+    gen.close()
+
+
+def test_login_upgrades_bcrypt_hash_to_argon2(db):
+    password = "legacy-pass-123"
+    legacy_hash = CryptContext(schemes=["bcrypt"]).hash(password)
+    user = User(email="legacy@example.com", username="legacy", first_name="L", last_name="G", hashed_password=legacy_hash, is_active=True)
+    db.add(user)
+    db.commit()
+    client = TestClient(app)
+
+    r = client.post("/auth/login", data={"username": "legacy@example.com", "password": password})
+    assert r.status_code == 200, r.text
+    db.expire_all()
+    upgraded = db.get(User, user.id).hashed_password
+    assert upgraded.startswith("$argon2id$")
+
+    r = client.post("/auth/login", data={"username": "legacy@example.com", "password": password})
+    assert r.status_code == 200, r.text
+    db.expire_all()
+    assert db.get(User, user.id).hashed_password == upgraded
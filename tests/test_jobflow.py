@@ -21,3 +21,56 @@ def test_start_run_and_list_jobs():
     if jobs:
         first = jobs[0]
         assert 'id' in first and 'title' in first
+
+
+def _seed_run(metadata_json=None):
+    import json
+    from app.core.database import get_db
+    from app.models import PipelineRun, ScrapedJob
+    gen = app.dependency_overrides[get_db]()
+    db = next(gen)
+    try:
+        run = PipelineRun(query='python developer', counts={}, metadata_json=metadata_json)
+        db.add(run)
+        db.flush()
+        for i in range(3):
+            db.add(ScrapedJob(
+                run_id=run.id, source='indeed', hash=f'h{i}', title=f'Engineer {i}', company='Acme',
+                recruiter_email=f'rec{i}@example.com',
+                metadata_json=json.dumps({'recruiter_contacts': [{'email': f'alt{i}@example.com'}]}),
+            ))
+        db.commit()
+        return run.id
+    finally:
+        gen.close()
+
+def test_send_dry_run_logs_email_events_in_order(monkeypatch):
+    from app.api.routers import jobflow
+    monkeypatch.setattr(jobflow.settings, 'SENDGRID_API_KEY', 'test-key')
+    # Keep the tracker's events.db out of the working tree
+    monkeypatch.setattr(jobflow, '_record_tracked_email', lambda *a, **k: None)
+    run_id = _seed_run()
+    client = TestClient(app)
+    resp = client.post(f'/api/runs/{run_id}/send', json={'max_emails': 5, 'dry_run': True})
+    assert resp.status_code == 200
+    assert resp.json()['sent'] == 5
+    events = client.get(f'/api/runs/{run_id}/emails').json()
+    assert [e['email'] for e in events] == [
+        'rec0@example.com', 'alt0@example.com',
+        'rec1@example.com', 'alt1@example.com',
+        'rec2@example.com',
+    ]
+    assert all(e['dry_run'] and e['job_id'] for e in events)
+    # A second send appends after the first batch
+    client.post(f'/api/runs/{run_id}/send', json={'max_emails': 1, 'dry_run': True})
+    events = client.get(f'/api/runs/{run_id}/emails').json()
+    assert len(events) == 6 and events[-1]['email'] == 'rec0@example.com'
+
+def test_email_events_fall_back_to_legacy_run_metadata():
+    import json
+    legacy = [{'job_id': 7, 'email': 'old@example.com', 'subject': 'Application', 'dry_run': False}]
+    run_id = _seed_run(metadata_json=json.dumps({'email_events': legacy}))
+    client = TestClient(app)
+    resp = client.get(f'/api/runs/{run_id}/emails')
+    assert resp.status_code == 200
+    assert resp.json() == legacy
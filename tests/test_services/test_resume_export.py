@@ -0,0 +1,62 @@
+import os
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+from app.services import resume_export
+
+
+@pytest.fixture()
+def run_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(resume_export, "PROJECT_ROOT", tmp_path)
+    out_dir = tmp_path / "generated_docs" / "run_1"
+    out_dir.mkdir(parents=True)
+    (out_dir / "resume_job1.txt").write_text("first resume", encoding="utf-8")
+    (out_dir / "resume_job2.txt").write_text("second resume", encoding="utf-8")
+    return out_dir
+
+
+def test_create_resume_zip_reuses_archive_until_resumes_change(run_dir):
+    run = SimpleNamespace(id=1)
+    zip_path = resume_export.create_resume_zip(run)
+    with zipfile.ZipFile(zip_path) as zf:
+        assert sorted(zf.namelist()) == ["resume_job1.txt", "resume_job2.txt"]
+    built = os.stat(zip_path).st_ino
+
+    # Nothing changed: the cached archive is returned as is
+    assert resume_export.create_resume_zip(run) == zip_path
+    assert os.stat(zip_path).st_ino == built
+
+    # A resume changed: the archive is rebuilt with the new content
+    resume = run_dir / "resume_job1.txt"
+    resume.write_text("first resume, revised", encoding="utf-8")
+    st = resume.stat()
+    os.utime(resume, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    resume_export.create_resume_zip(run)
+    assert os.stat(zip_path).st_ino != built
+    with zipfile.ZipFile(zip_path) as zf:
+        assert zf.read("resume_job1.txt") == b"first resume, revised"
+
+
+def test_create_resume_zip_concurrent_rebuilds(run_dir):
+    run = SimpleNamespace(id=1)
+    # Enough content that rebuilds overlap
+    for n in range(3, 20):
+        (run_dir / f"resume_job{n}.txt").write_text(f"resume {n} " * 20000, encoding="utf-8")
+
+    def rebuild(_):
+        # Drop the fingerprint so every call takes the rebuild path
+        try:
+            os.unlink(run_dir / "run_1_resumes.zip.fingerprint")
+        except OSError:
+            pass
+        return resume_export.create_resume_zip(run)
+
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        paths = list(ex.map(rebuild, range(20)))
+    assert set(paths) == {str(run_dir / "run_1_resumes.zip")}
+    assert not list(run_dir.glob("*.tmp"))
+    with zipfile.ZipFile(paths[0]) as zf:
+        assert zf.testzip() is None